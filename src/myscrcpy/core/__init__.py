@@ -7,6 +7,18 @@
     V/A/C Adapter, Extensions
 
     Log:
+        2026-10-19 3.3.0 Me2sY
+            1.新增 Macro 录制回放
+            2.新增 asyncio 版本 Connection / Adapter / Session
+            3.新增 Metrics 指标
+            4.新增 ServerEvent / EventBus
+            5.新增 StandbyPool 预启动 Server
+            6.新增 SocketProfile
+            7.新增 DeviceQuery，uiautomator2 改为可选
+            8.新增 DisplayState
+            9.新增 TransferManager 并发续传拉取
+            10.FileManager 新增 sync_dir 增量同步
+
         2024-09-15 1.6.0 Me2sY  新增 插件结构
 
         2024-08-29 1.4.0 Me2sY  重构，新增 Connection Session
@@ -15,11 +27,17 @@
 """
 
 __author__ = 'Me2sY'
-__version__ = '1.6.0'
+__version__ = '3.3.0'
 
 __all__ = [
     # Connection
-    'Connection',
+    'Connection', 'SocketProfile',
+
+    # Metrics
+    'MetricsRegistry', 'METRICS',
+
+    # Events
+    'ServerEvent', 'EventBus',
     
     # Video
     'CameraArgs', 'VideoArgs',
@@ -33,11 +51,22 @@ __all__ = [
     'ControlArgs', 'ControlAdapter',
 
     # Session
-    'Session',
+    'Session', 'StandbyPool', 'DisplayState',
+
+    # Asyncio
+    'AsyncConnection',
+    'AsyncVideoAdapter', 'AsyncAudioAdapter', 'AsyncControlAdapter',
+    'AsyncSession',
+
+    # Macro
+    'MacroRecord', 'MacroRecorder', 'MacroReplayer',
 
     # Device
     'DeviceInfo', 'PackageInfo',
-    'AdvDevice', 'DeviceFactory',
+    'DisplayInfo', 'SyncReport', 'DeviceQuery', 'DeviceMonitor', 'AdvDevice', 'DeviceFactory',
+
+    # Transfer
+    'Transfer', 'TransferManager',
 
     # Extension
     'ExtInfo',
@@ -47,10 +76,17 @@ __all__ = [
 
 ]
 
+from myscrcpy.core.metrics import *
+from myscrcpy.core.events import *
 from myscrcpy.core.connection import *
+from myscrcpy.core.display import *
 from myscrcpy.core.video import *
 from myscrcpy.core.audio import *
 from myscrcpy.core.control import *
+from myscrcpy.core.standby import *
 from myscrcpy.core.session import *
+from myscrcpy.core.aio import *
+from myscrcpy.core.macro import *
+from myscrcpy.core.transfer import *
 from myscrcpy.core.device import *
 from myscrcpy.core.extension import *
@@ -0,0 +1,850 @@
+# -*- coding: utf-8 -*-
+"""
+    Asyncio Core
+    ~~~~~~~~~~~~~~~~~~
+    asyncio 版本 Connection / Adapter / Session
+    单一事件循环管理多设备，socket 非阻塞读写，解码于 executor 中进行
+    Frame / Audio 数据通过有界队列以 async iterator 输出
+
+    Log:
+        2026-10-19 3.3.0 Me2sY
+            1.创建
+            2.AsyncConnection 支持 SocketProfile
+            3.AsyncSession 支持 DisplayState
+"""
+
+__author__ = 'Me2sY'
+__version__ = '3.3.0'
+
+__all__ = [
+    'AsyncConnection',
+    'AsyncVideoAdapter', 'AsyncAudioAdapter', 'AsyncControlAdapter',
+    'AsyncSession'
+]
+
+import asyncio
+from concurrent.futures import Executor
+import struct
+import time
+from typing import AsyncIterator, Callable
+
+import av
+from adbutils import AdbDevice, AdbError, Network
+from loguru import logger
+
+from myscrcpy.core.adapter_cls import ScrcpyAdapter
+from myscrcpy.core.connection import Connection, SocketProfile
+from myscrcpy.core.display import DisplayState
+from myscrcpy.core.events import EventBus, ServerEvent
+from myscrcpy.core.video import VideoArgs, VideoAdapter
+from myscrcpy.core.audio import AudioArgs
+from myscrcpy.core.control import ControlArgs, ControlAdapter
+from myscrcpy.core.metrics import METRICS
+
+
+class AsyncConnection:
+    """
+        asyncio 连接
+        push / spawn 等 adb 阻塞操作于 executor 中执行，forward socket 转为 asyncio Stream
+    """
+
+    def __init__(
+            self, args, retry_n: int = 3, event_bus: EventBus | None = None,
+            socket_profile: SocketProfile | None = None, **kwargs
+    ):
+        """
+            初始化连接参数
+        :param args: Scrcpy Connect Args
+        :param retry_n: 连接重试次数
+        :param event_bus: Server 日志事件总线
+        :param socket_profile: Socket 参数，timeout 不生效
+        """
+        # 复用 Connection push / build_cmd / spawn 及日志解析
+        self._conn = Connection(args, retry_n, event_bus, socket_profile)
+
+        self.reader: asyncio.StreamReader | None = None
+        self.writer: asyncio.StreamWriter | None = None
+
+        self.device_name = ''
+
+        self.is_connected = False
+        self.is_lost = False
+
+        self._log_task: asyncio.Task | None = None
+        self._log_writer: asyncio.StreamWriter | None = None
+
+    @property
+    def args(self):
+        return self._conn.args
+
+    @property
+    def scid(self) -> str:
+        return self._conn.scid
+
+    @property
+    def retry_n(self) -> int:
+        return self._conn.retry_n
+
+    @property
+    def stream_type(self) -> str:
+        return self._conn.stream_type
+
+    @property
+    def connect_metrics(self) -> dict:
+        return self._conn.connect_metrics
+
+    @property
+    def metric_labels(self) -> dict:
+        return self._conn.metric_labels
+
+    async def _spawn(self, adb_device: AdbDevice, args: list, extra_cmd: list = None, timeout: int = 5) -> bool:
+        """
+            推送并启动 Server
+        :param adb_device:
+        :param args:
+        :param extra_cmd:
+        :param timeout:
+        :return:
+        """
+        loop = asyncio.get_running_loop()
+
+        self._conn.connect_metrics = {}
+        push_path = await loop.run_in_executor(None, self._conn.push_server, adb_device)
+
+        t = time.perf_counter()
+        cmd = self._conn.build_cmd(push_path, args, extra_cmd)
+        if not await loop.run_in_executor(None, self._conn.spawn, adb_device, cmd, timeout):
+            return False
+        self._conn.connect_metrics['spawn_ms'] = (time.perf_counter() - t) * 1000
+        return True
+
+    async def attach(self, adb_device: AdbDevice, timeout: int = 5, first: bool = True) -> bool:
+        """
+            创建 forward 连接并转为 asyncio Stream
+        :param adb_device:
+        :param timeout:
+        :param first: 首个 socket 读取 dummy byte 及 device name
+        :return:
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        _sock = None
+        while loop.time() < deadline:
+            try:
+                _sock = await loop.run_in_executor(
+                    None, adb_device.create_connection, Network.LOCAL_ABSTRACT, f"scrcpy_{self.scid}"
+                )
+                break
+            except AdbError:
+                await asyncio.sleep(0.01)
+
+        if _sock is None:
+            logger.error('Failed to Create Socket.')
+            return False
+
+        self._conn.socket_profile.apply(_sock)
+        _sock.setblocking(False)
+        self.reader, self.writer = await asyncio.open_connection(sock=_sock)
+
+        if first:
+            try:
+                dummy = await asyncio.wait_for(self.reader.readexactly(1), timeout)
+                if dummy != b'\x00':
+                    raise ValueError('Dummy Data Error!')
+                self.device_name = (
+                    await asyncio.wait_for(self.reader.readexactly(64), timeout)
+                ).decode('utf-8').rstrip('\x00')
+
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as e:
+                logger.error(f"Attach Error => {e}")
+                self.writer.close()
+                self.reader = self.writer = None
+                return False
+
+        self.is_connected = True
+        self.is_lost = False
+        self._conn.bind_metrics(adb_device.serial)
+        return True
+
+    async def connect(
+            self, adb_device: AdbDevice, extra_cmd: list = None, timeout: int = 5,
+            read_stream: bool = True, _retry_n: int = 0, **kwargs
+    ) -> bool:
+        """
+            连接至 Scrcpy
+        :param adb_device:
+        :param extra_cmd:
+        :param timeout:
+        :param read_stream: 读取stream回传信息
+        :param _retry_n:
+        :return:
+        """
+        if self.is_connected:
+            await self.disconnect()
+
+        if _retry_n > self.retry_n:
+            return False
+
+        if not (
+                await self._spawn(adb_device, self.args.to_args(), extra_cmd, timeout)
+        ) or not (
+                await self.attach(adb_device, timeout)
+        ):
+            await self.disconnect()
+            logger.warning('Reconnect')
+            return await self.connect(adb_device, extra_cmd, timeout, read_stream, _retry_n=_retry_n + 1)
+
+        read_stream and self._read_log()
+
+        return True
+
+    @classmethod
+    async def connect_multiplex(
+            cls, adb_device: AdbDevice, connections: list['AsyncConnection'],
+            extra_cmd: list = None, timeout: int = 5, read_stream: bool = True,
+            _retry_n: int = 0, **kwargs
+    ) -> bool:
+        """
+            单一 Scrcpy Server 进程承载多个连接，按 video -> audio -> control 顺序 attach
+        :param adb_device:
+        :param connections:
+        :param extra_cmd:
+        :param timeout:
+        :param read_stream:
+        :param _retry_n:
+        :return:
+        """
+        connections = sorted(connections, key=lambda _: Connection.STREAM_ORDER.index(_.stream_type))
+
+        lead = connections[0]
+        if _retry_n > lead.retry_n:
+            return False
+
+        for conn in connections:
+            await conn.disconnect()
+
+        for conn in connections[1:]:
+            conn._conn.scid = lead.scid
+
+        args = []
+        for conn in connections:
+            args += conn.args.to_args()
+
+        ok = await lead._spawn(adb_device, args, extra_cmd, timeout)
+        for conn in connections:
+            ok = ok and await conn.attach(adb_device, timeout, first=conn is lead)
+
+        if not ok:
+            for conn in connections:
+                await conn.disconnect()
+            logger.warning('Reconnect')
+            return await cls.connect_multiplex(
+                adb_device, connections, extra_cmd, timeout, read_stream, _retry_n=_retry_n + 1
+            )
+
+        for conn in connections[1:]:
+            conn.device_name = lead.device_name
+            conn._conn.connect_metrics = lead.connect_metrics
+
+        read_stream and lead._read_log()
+
+        return True
+
+    def _read_log(self):
+        """
+            读取 Scrcpy Server 回传信息
+        :return:
+        """
+        async def _read():
+            try:
+                _sock = self._conn._stream.conn
+                _sock.setblocking(False)
+                reader, self._log_writer = await asyncio.open_connection(sock=_sock)
+                while self.is_connected:
+                    line = await reader.readline()
+                    if line == b'':
+                        break
+                    self._conn.handle_log_line(self.device_name, line.decode('utf-8', errors='replace').rstrip())
+            except asyncio.CancelledError:
+                ...
+            except Exception as e:
+                logger.warning(f"Stream Lost Connection => {e}")
+
+        self._log_task = asyncio.create_task(_read())
+
+    async def disconnect(self):
+        """
+            关闭连接
+        :return:
+        """
+        self.is_connected = False
+
+        if self._log_task is not None:
+            self._log_task.cancel()
+            self._log_task = None
+
+        if self._log_writer is not None:
+            self._log_writer.close()
+            self._log_writer = None
+
+        if self.writer is not None:
+            try:
+                self.writer.close()
+                await self.writer.wait_closed()
+            except Exception:
+                ...
+
+        self.reader = self.writer = None
+        self.is_lost = False
+
+        # 关闭 server stream，并重置 scid
+        self._conn.disconnect()
+
+    async def read(self, n: int) -> bytes:
+        """
+            读取，对端关闭时置 is_lost
+        :param n:
+        :return:
+        """
+        if not self.is_connected:
+            return b''
+        try:
+            data = await self.reader.read(n)
+        except (ConnectionError, OSError):
+            data = b''
+        if data == b'' and self.is_connected:
+            self.is_lost = True
+        self._conn._m_rx_reads.inc()
+        self._conn._m_rx_bytes.inc(len(data))
+        return data
+
+    async def readexactly(self, n: int) -> bytes:
+        """
+            读取定长数据
+        :param n:
+        :return:
+        """
+        try:
+            return await self.reader.readexactly(n)
+        except (asyncio.IncompleteReadError, ConnectionError, OSError):
+            if self.is_connected:
+                self.is_lost = True
+            return b''
+
+    def write(self, data: bytes):
+        """
+            写入，需在事件循环线程调用
+        :param data:
+        :return:
+        """
+        if self.is_connected:
+            try:
+                self.writer.write(data)
+                self._conn._m_tx_packets.inc()
+                self._conn._m_tx_bytes.inc(len(data))
+            except (ConnectionError, OSError):
+                self.is_lost = True
+
+    async def drain(self):
+        """
+            等待写缓冲排空
+        :return:
+        """
+        if self.is_connected:
+            try:
+                await self.writer.drain()
+            except (ConnectionError, OSError):
+                self.is_lost = True
+
+
+class _AsyncQueueMixin:
+    """
+        有界队列输出
+        drop_oldest 为 True 时队列满丢弃最旧数据，否则阻塞读取实现背压
+    """
+
+    _END = object()
+
+    def _init_queue(self, queue_size: int, drop_oldest: bool):
+        self.queue_size = queue_size
+        self.drop_oldest = drop_oldest
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped_n = 0
+
+    async def _put(self, item):
+        if self.drop_oldest:
+            while self._queue.full():
+                self._queue.get_nowait()
+                self.dropped_n += 1
+            self._queue.put_nowait(item)
+        else:
+            await self._queue.put(item)
+
+    def _close_queue(self):
+        while self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(self._END)
+
+    def __aiter__(self) -> AsyncIterator:
+        return self._iter()
+
+    async def _iter(self):
+        while True:
+            item = await self._queue.get()
+            if item is self._END:
+                break
+            yield item
+
+
+class AsyncVideoAdapter(_AsyncQueueMixin, VideoAdapter):
+    """
+        asyncio 视频适配器
+        async for frame in adapter: ...
+        get_frame / get_image / coordinate 等方法与 VideoAdapter 一致
+    """
+
+    def __init__(
+            self, connection: AsyncConnection, frame_update_callback: Callable = None,
+            queue_size: int = 2, drop_oldest: bool = True, executor: Executor | None = None,
+            display_state: DisplayState | None = None
+    ):
+        """
+            asyncio 视频适配器
+        :param connection:
+        :param frame_update_callback:
+        :param queue_size: 帧队列长度
+        :param drop_oldest: 队列满时丢弃旧帧，避免消费方拖慢解码
+        :param executor: 解码 executor，None 使用事件循环默认 executor
+        :param display_state:
+        """
+        super().__init__(connection, frame_update_callback, display_state)
+        self._init_queue(queue_size, drop_oldest)
+        self.executor = executor
+        self._task: asyncio.Task | None = None
+
+    async def start(self, adb_device: AdbDevice, timeout: float = 2, *args, **kwargs) -> bool:
+        """
+            启动解析
+        :param adb_device:
+        :param timeout: 等待首帧时间
+        :return:
+        """
+        if self.is_running and self.is_ready:
+            return True
+
+        if not (self.conn.is_connected or await self.conn.connect(adb_device)):
+            return False
+
+        _video_codec = (await self.conn.readexactly(4)).decode()
+        if _video_codec == '':
+            logger.warning('Video Header Error. Check VideoArgs')
+            return False
+
+        _size = await self.conn.readexactly(8)
+        if len(_size) != 8:
+            return False
+        width, height = struct.unpack('>II', _size)
+        self.display_state.update_frame(width, height)
+
+        self.is_running = True
+        self._task = asyncio.create_task(self.main_thread())
+
+        deadline = time.perf_counter() + timeout
+        while self._last_frame is None:
+            if time.perf_counter() > deadline or not self.is_running:
+                logger.error(f"Video Got No Frame!")
+                return False
+            await asyncio.sleep(0.01)
+
+        self.is_ready = True
+        logger.success(f"Video Socket {self.conn.scid} Connected! Codec: {_video_codec} {width}x{height}")
+        return True
+
+    async def main_thread(self):
+        """
+            读取及解码协程
+        :return:
+        """
+        loop = asyncio.get_running_loop()
+        code_context = av.CodecContext.create(self.CODEC_AV_MAP.get(self.conn.args.video_codec), 'r')
+
+        m_decode = METRICS.histogram('video_decode_ms', **self.conn.metric_labels)
+        m_frames = METRICS.counter('video_frames_total', **self.conn.metric_labels)
+        m_queue = METRICS.gauge('video_queue_depth', **self.conn.metric_labels)
+
+        update_frame = self.display_state.update_frame
+
+        while self.is_running and not self.conn.is_lost:
+            data = await self.conn.read(self.conn.args.buffer_size)
+            if data == b'':
+                break
+            try:
+                t = time.perf_counter()
+                frames = await loop.run_in_executor(self.executor, self._decode, code_context, data)
+                m_decode.observe((time.perf_counter() - t) * 1000)
+            except Exception as e:
+                logger.info(f"Exception while decoding frame {self.frame_n} | {e}")
+                continue
+
+            for _frame in frames:
+                self._last_frame = _frame
+                self.frame_n += 1
+                m_frames.inc()
+                update_frame(_frame.width, _frame.height)
+                if self.frame_update_callback:
+                    self.frame_update_callback(_frame, self.frame_n)
+                await self._put(_frame)
+            m_queue.set(self._queue.qsize())
+
+        self.is_ready = False
+        self._close_queue()
+        logger.warning(f"{self.__class__.__name__} Task {self.conn.scid} Closed.")
+
+    async def stop(self):
+        """
+            停止
+        :return:
+        """
+        self.is_running = False
+        self.is_ready = False
+        await self.conn.disconnect()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._last_frame = None
+        self.frame_n = 0
+
+
+class AsyncAudioAdapter(_AsyncQueueMixin, ScrcpyAdapter):
+    """
+        asyncio 音频适配器
+        async for packet in adapter: ...  输出原始音频数据，默认背压不丢弃
+    """
+
+    def __init__(
+            self, connection: AsyncConnection, queue_size: int = 64, drop_oldest: bool = False,
+            buffer_size: int = AudioArgs.RECEIVE_FRAMES_PER_BUFFER * 2
+    ):
+        super().__init__(connection)
+        self._init_queue(queue_size, drop_oldest)
+        self.buffer_size = buffer_size
+        self.audio_codec = None
+        self._task: asyncio.Task | None = None
+
+    async def start(self, adb_device: AdbDevice, *args, **kwargs) -> bool:
+        """
+            启动连接
+        :param adb_device:
+        :return:
+        """
+        if self.is_running:
+            return True
+
+        if not (self.conn.is_connected or await self.conn.connect(adb_device)):
+            return False
+
+        self.audio_codec = (await self.conn.readexactly(4)).replace(b'\x00', b'').decode()
+        if self.audio_codec != self.conn.args.audio_codec:
+            logger.error(f"Invalid Audio Codec: {self.audio_codec}")
+            return False
+
+        self.is_running = True
+        self.is_ready = True
+        self._task = asyncio.create_task(self.main_thread())
+
+        logger.success(f"Audio Socket {self.conn.scid} Connected! Codec: {self.audio_codec}")
+        return True
+
+    async def main_thread(self):
+        """
+            读取协程
+        :return:
+        """
+        while self.is_running and not self.conn.is_lost:
+            data = await self.conn.read(self.buffer_size)
+            if data == b'':
+                break
+            await self._put(data)
+
+        self.is_ready = False
+        self._close_queue()
+        logger.warning(f"{self.__class__.__name__} Task {self.conn.scid} Closed.")
+
+    async def stop(self):
+        """
+            停止
+        :return:
+        """
+        self.is_running = False
+        self.is_ready = False
+        await self.conn.disconnect()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+class AsyncControlAdapter(_AsyncQueueMixin, ControlAdapter):
+    """
+        asyncio 控制适配器
+        f_* 控制方法与 ControlAdapter 一致，可跨线程调用
+        async for msg in adapter: ...  输出设备回传消息(剪切板等)
+    """
+
+    def __init__(
+            self, connection: AsyncConnection, queue_size: int = 16, display_state: DisplayState | None = None
+    ):
+        super().__init__(connection, display_state)
+        self._init_queue(queue_size, True)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
+
+    async def start(self, adb_device: AdbDevice, *args, **kwargs) -> bool:
+        """
+            启动
+        :param adb_device:
+        :return:
+        """
+        if self.is_running and self.is_ready:
+            return True
+
+        self._loop = asyncio.get_running_loop()
+
+        if self.display_state is not None and self.display_state.coord_v is None:
+            await self._loop.run_in_executor(None, self.display_state.refresh, adb_device)
+
+        if self.display_state is not None and self.display_state.coord_v is not None:
+            self.set_coord(self.display_state.coord_v)
+            self.display_state.register(self._on_display_change)
+        else:
+            self.set_coord(await self._loop.run_in_executor(None, self.get_window_size, adb_device))
+
+        if self.screen_status == ControlArgs.STATUS_KEEP:
+            self.screen_status = await self._loop.run_in_executor(None, adb_device.is_screen_on)
+
+        if not (self.conn.is_connected or await self.conn.connect(adb_device)):
+            return False
+
+        self.is_running = True
+        self.is_ready = True
+        self._task = asyncio.create_task(self.main_thread())
+
+        self.f_set_screen(True if self.screen_status == ControlArgs.STATUS_ON else False)
+
+        logger.success(f"Control Socket {self.conn.scid} Connected!")
+        return True
+
+    def _write(self, packet: bytes):
+        self.conn.write(packet)
+        if self.packet_callbacks:
+            for callback in tuple(self.packet_callbacks):
+                callback(packet)
+
+    def send_packet(self, packet: bytes, ignore_repeat: bool = False):
+        """
+            发送控制数据包，非事件循环线程调用时转至事件循环
+        :param packet:
+        :param ignore_repeat:
+        :return:
+        """
+        if (packet != self.last_packet or ignore_repeat) and self._loop is not None:
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+
+            if running is self._loop:
+                self._write(packet)
+            else:
+                self._loop.call_soon_threadsafe(self._write, packet)
+
+        self.last_packet = packet
+
+    async def main_thread(self):
+        """
+            读取设备回传消息
+        :return:
+        """
+        while self.is_running and not self.conn.is_lost:
+            data = await self.conn.read(262144)
+            if data == b'':
+                break
+            await self._put(data)
+
+        self.is_ready = False
+        self._close_queue()
+        logger.warning(f"{self.__class__.__name__} Task {self.conn.scid} Closed.")
+
+    async def stop(self):
+        """
+            停止
+        :return:
+        """
+        if self.display_state is not None:
+            self.display_state.unregister(self._on_display_change)
+        self.is_running = False
+        self.is_ready = False
+        await self.conn.drain()
+        await self.conn.disconnect()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+class AsyncSession:
+    """
+        asyncio Session
+
+        async with AsyncSession(adb_device, VideoArgs()) as sess:
+            async for frame in sess.va:
+                ...
+    """
+
+    def __init__(
+            self,
+            adb_device: AdbDevice,
+            video_args: VideoArgs = None,
+            audio_args: AudioArgs = None,
+            control_args: ControlArgs = None,
+            multiplex: bool = False,
+            start_timeout: float = 10,
+            frame_update_callback: Callable = None,
+            executor: Executor | None = None,
+            event_bus: EventBus | None = None,
+            **kwargs
+    ):
+        """
+            asyncio Session，需 await start() 或 async with 使用
+        :param adb_device:
+        :param video_args:
+        :param audio_args:
+        :param control_args:
+        :param multiplex: 单一 Scrcpy Server 进程承载全部连接
+        :param start_timeout: 并发启动共用超时时间
+        :param frame_update_callback: 于事件循环中调用
+        :param executor: 视频解码 executor
+        :param event_bus: Server 事件总线
+        :param kwargs:
+        """
+        self.adb_device = adb_device
+        self.multiplex = multiplex
+        self.start_timeout = start_timeout
+        self.event_bus = EventBus() if event_bus is None else event_bus
+
+        self.display_state = DisplayState(adb_device)
+        self.event_bus.register(ServerEvent.ROTATION, self.display_state.on_server_event)
+        self.event_bus.register(ServerEvent.RESOLUTION, self.display_state.on_server_event)
+
+        self.va = None if video_args is None or not video_args.is_activate else AsyncVideoAdapter(
+            AsyncConnection(video_args, event_bus=self.event_bus), frame_update_callback, executor=executor,
+            display_state=self.display_state
+        )
+        self.aa = None if audio_args is None or not audio_args.is_activate else AsyncAudioAdapter(
+            AsyncConnection(audio_args, event_bus=self.event_bus)
+        )
+        self.ca = None if control_args is None or not control_args.is_activate else AsyncControlAdapter(
+            AsyncConnection(control_args, event_bus=self.event_bus), display_state=self.display_state
+        )
+
+        if self.ca is None and self.aa is None and self.va is None:
+            raise RuntimeError(f"At Least One Adapter Required!")
+
+        self.start_report = {}
+        self.is_running = False
+
+    async def __aenter__(self) -> 'AsyncSession':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    @property
+    def adapters(self) -> dict:
+        return {
+            name: adapter for name, adapter in [('video', self.va), ('audio', self.aa), ('control', self.ca)]
+            if adapter is not None
+        }
+
+    async def start(self) -> dict[str, bool]:
+        """
+            并发启动全部 Adapter
+        :return: {name: 是否成功}
+        """
+        adapters = self.adapters
+
+        if self.multiplex:
+            if not await AsyncConnection.connect_multiplex(self.adb_device, [_.conn for _ in adapters.values()]):
+                logger.error('Multiplex Connect Failed!')
+                for name in adapters:
+                    self.start_report[name] = {'ok': False, 'ms': 0.0, 'error': 'multiplex connect failed'}
+                return {name: False for name in adapters}
+
+        async def _start(_adapter) -> tuple[bool, float]:
+            _t = time.perf_counter()
+            return await _adapter.start(self.adb_device), (time.perf_counter() - _t) * 1000
+
+        tasks = {name: asyncio.create_task(_start(adapter)) for name, adapter in adapters.items()}
+        await asyncio.wait(tasks.values(), timeout=self.start_timeout)
+
+        outcomes = {}
+        for name, task in tasks.items():
+            if not task.done():
+                task.cancel()
+                report = {'ok': False, 'ms': self.start_timeout * 1000, 'error': 'timeout'}
+            elif task.exception() is not None:
+                report = {'ok': False, 'ms': 0.0, 'error': str(task.exception())}
+            else:
+                ok, ms = task.result()
+                report = {'ok': ok, 'ms': ms, 'error': '' if ok else 'start failed'}
+
+            if not report['ok']:
+                logger.error(f"{name.capitalize():<8} Start Failed => {report['error']}")
+                await adapters[name].stop()
+
+            self.start_report[name] = report
+            outcomes[name] = report['ok']
+
+        self.is_running = any(outcomes.values())
+        return outcomes
+
+    async def stop(self):
+        """
+            断开连接
+        :return:
+        """
+        await asyncio.gather(*[_.stop() for _ in self.adapters.values()], return_exceptions=True)
+        self.is_running = False
+
+    @property
+    def is_video_ready(self) -> bool:
+        return self.va is not None and self.va.is_ready
+
+    @property
+    def is_audio_ready(self) -> bool:
+        return self.aa is not None and self.aa.is_ready
+
+    @property
+    def is_control_ready(self) -> bool:
+        return self.ca is not None and self.ca.is_ready
+
+
+if __name__ == '__main__':
+    """
+        DEMO Here
+        单一事件循环连接全部设备
+    """
+    from adbutils import adb
+
+    async def show(device: AdbDevice):
+        async with AsyncSession(device, VideoArgs(max_size=800, fps=30), multiplex=True) as sess:
+            async for frame in sess.va:
+                if sess.va.frame_n % 30 == 0:
+                    logger.info(f"{device.serial} | Frame {sess.va.frame_n} | {frame.width}x{frame.height}")
+                if sess.va.frame_n >= 300:
+                    break
+
+    async def main():
+        await asyncio.gather(*[show(_) for _ in adb.device_list()])
+
+    asyncio.run(main())
@@ -5,6 +5,10 @@
     音频相关类
 
     Log:
+        2026-10-19 3.3.0 Me2sY
+            1.支持 multiplex 连接，socket 断开时结束主进程
+            2.记录解码播放耗时指标
+
         2025-04-23 3.2.0 Me2sY
             1.增加更多 audio source
             2.优化退出逻辑，避免卡线程
@@ -29,7 +33,7 @@
 """
 
 __author__ = 'Me2sY'
-__version__ = '3.2.0'
+__version__ = '3.3.0'
 
 __all__ = [
     'AudioArgs', 'AudioAdapter'
@@ -70,6 +74,7 @@ except:
 from myscrcpy.core.args_cls import ScrcpyConnectArgs
 from myscrcpy.core.adapter_cls import ScrcpyAdapter
 from myscrcpy.core.connection import Connection
+from myscrcpy.core.metrics import METRICS
 
 
 class Player:
@@ -505,7 +510,8 @@ class AudioAdapter(ScrcpyAdapter):
             self.player.setup_player, self.player.play, *args, **kwargs
         )
 
-        if self.conn.connect(adb_device):
+        # 2026-10-19 3.3.0 Me2sY  multiplex 模式下连接已由 Session 建立
+        if self.conn.is_connected or self.conn.connect(adb_device):
             self.is_running = True
         else:
             return False
@@ -534,10 +540,14 @@ class AudioAdapter(ScrcpyAdapter):
 
         self.decoder.parse_audio_args(self.conn)
 
-        while self.is_running:
+        m_process = METRICS.histogram('audio_process_ms', **self.conn.metric_labels)
+
+        while self.is_running and not self.conn.is_lost:
             try:
                 _ = self.conn.recv(AudioArgs.RECEIVE_FRAMES_PER_BUFFER * 2)
+                t = time.perf_counter()
                 not self.mute and self.decoder.process(_)
+                m_process.observe((time.perf_counter() - t) * 1000)
             except OSError:
                 ...
             except Exception as e:
@@ -5,6 +5,16 @@
     连接类，用于创建 Scrcpy 连接，连接状态管理、自动重连等
 
     Log:
+        2026-10-19 3.3.0 Me2sY
+            1.拆分 push / spawn / attach 阶段，记录各阶段耗时
+            2.新增 connect_multiplex，单一 Server 进程承载 video/audio/control
+            3.scrcpy-server 按内容 hash 缓存于设备，清理过期文件
+            4.新增 is_lost，标记 socket 被动断开
+            5.记录 rx/tx 字节数、连接耗时等指标
+            6.Server 日志按块读取，解析为 ServerEvent 分发至 EventBus
+            7.connect_multiplex 拆分为 spawn_multiplex / attach_multiplex，支持预启动
+            8.新增 SocketProfile，按连接类型设置 TCP_NODELAY / 缓冲区 / keepalive / timeout
+
         2025-04-23 3.2.0 Me2sY  增加 socket.shutdown / settimeout(1) 避免关闭 socket.recv 导致卡线程
 
         2024-09-09 1.5.8 Me2sY  新增自动屏蔽方法
@@ -15,36 +25,123 @@
 """
 
 __author__ = 'Me2sY'
-__version__ = '3.2.0'
+__version__ = '3.3.0'
 
 __all__ = [
-    'Connection'
+    'SocketProfile', 'Connection'
 ]
 
+from dataclasses import dataclass
+import hashlib
 import random
 import socket
 import threading
 import time
+from typing import ClassVar
 
 from adbutils import AdbDevice, Network, AdbConnection, AdbError
 from loguru import logger
 
+from myscrcpy.core.events import ServerEvent, EventBus
+from myscrcpy.core.metrics import METRICS, Counter
 from myscrcpy.utils import Param
 
 
+@dataclass
+class SocketProfile:
+    """
+        Socket 参数
+        注意: socket 连接至本地 adb server，再由 adb server 转发至设备
+        参数作用于 本机 <-> adb server 一段，无线设备的 adb server <-> adbd 一段由 adb 自身控制
+    """
+
+    nodelay: bool = False       # TCP_NODELAY 关闭 Nagle
+    rcvbuf: int = 0             # SO_RCVBUF, 0 为系统默认
+    sndbuf: int = 0             # SO_SNDBUF, 0 为系统默认
+    keepalive: bool = False     # SO_KEEPALIVE
+    keepidle: int = 10          # 空闲多久开始探测，秒
+    keepintvl: int = 5          # 探测间隔，秒
+    keepcnt: int = 3            # 探测次数
+    timeout: float | None = 1   # None 为阻塞，超时用于关闭时及时退出 recv
+
+    STREAM_DEFAULTS: ClassVar[dict] = {}
+
+    def apply(self, sock: socket.socket):
+        """
+            应用至 socket，不支持的选项忽略
+        :param sock:
+        :return:
+        """
+        options = [
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, int(self.nodelay)),
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, int(self.keepalive)),
+        ]
+        if self.rcvbuf > 0:
+            options.append((socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf))
+        if self.sndbuf > 0:
+            options.append((socket.SOL_SOCKET, socket.SO_SNDBUF, self.sndbuf))
+        if self.keepalive:
+            for name, value in [
+                ('TCP_KEEPIDLE', self.keepidle), ('TCP_KEEPINTVL', self.keepintvl), ('TCP_KEEPCNT', self.keepcnt)
+            ]:
+                if hasattr(socket, name):
+                    options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+
+        for level, opt, value in options:
+            try:
+                sock.setsockopt(level, opt, value)
+            except OSError as e:
+                logger.debug(f"setsockopt {opt} => {e}")
+
+        sock.settimeout(self.timeout)
+
+    @classmethod
+    def for_stream(cls, stream_type: str) -> 'SocketProfile':
+        """
+            按连接类型获取默认参数
+        :param stream_type: video / audio / control
+        :return:
+        """
+        return cls.STREAM_DEFAULTS.get(stream_type, cls.LEGACY)
+
+
+# 原行为，仅 settimeout(1)
+SocketProfile.LEGACY = SocketProfile()
+
+SocketProfile.STREAM_DEFAULTS.update({
+    # 大接收缓冲，高码率下避免 recv 不及时导致窗口收缩
+    'video': SocketProfile(rcvbuf=4 * 1024 * 1024, keepalive=True),
+    'audio': SocketProfile(nodelay=True, rcvbuf=256 * 1024, keepalive=True),
+    # 控制包小且频繁，关闭 Nagle
+    'control': SocketProfile(nodelay=True, sndbuf=64 * 1024, keepalive=True),
+})
+
+
 class Connection:
     """
         连接类，用于创建 Scrcpy 连接，状态管理等
     """
 
-    def __init__(self, args, retry_n: int = 3, **kwargs):
+    # Scrcpy Server accept socket 顺序
+    STREAM_ORDER = ('video', 'audio', 'control')
+
+    _server_hash = None
+
+    def __init__(
+            self, args, retry_n: int = 3, event_bus: EventBus | None = None,
+            socket_profile: SocketProfile | None = None, **kwargs
+    ):
         """
             初始化连接参数
         :param args: Scrcpy Connect Args
         :param retry_n: 连接重试次数
+        :param event_bus: Server 日志事件总线
+        :param socket_profile: Socket 参数，None 时按连接类型使用默认值
         """
 
         self.args = args
+        self.event_bus = event_bus
+        self.socket_profile = SocketProfile.for_stream(self.stream_type) if socket_profile is None else socket_profile
 
         self._stream: AdbConnection | None = None
         self.socket: socket.socket | None = None
@@ -54,6 +151,19 @@ class Connection:
         self.is_connected = False
         self.retry_n = retry_n
 
+        # socket 被动断开
+        self.is_lost = False
+
+        # 连接各阶段耗时 ms
+        self.connect_metrics = {}
+
+        # 指标，attach 后绑定至 METRICS
+        self.metric_labels = {}
+        self._m_rx_bytes = Counter()
+        self._m_rx_reads = Counter()
+        self._m_tx_bytes = Counter()
+        self._m_tx_packets = Counter()
+
     def __del__(self):
         self.is_connected = False
         if self._stream is not None and not self._stream.closed:
@@ -75,19 +185,32 @@ class Connection:
             关闭连接
         :return:
         """
-        if self.is_connected and self._stream is not None and not self._stream.closed:
-            try:
-                self.socket.shutdown(2)
-                self.socket.close()
-            except Exception as e:
-                logger.error(e)
+        # 先置状态，避免读取线程将主动关闭误判为断开
+        _connected = self.is_connected
+        self.is_connected = False
 
+        if _connected:
+            if self.socket is not None:
+                try:
+                    self.socket.shutdown(2)
+                    self.socket.close()
+                except Exception as e:
+                    logger.error(e)
+
+        # 2026-10-19 3.3.0 Me2sY  multiplex 模式下仅首个连接持有 stream，attach 失败时同样需关闭
+        if self._stream is not None and not self._stream.closed:
             try:
                 self._stream.close()
             except Exception as e:
                 logger.error(e)
 
-        self.is_connected = False
+        # 指标 labels 含 scid，重连后为新序列，断开时删除旧序列
+        if self.metric_labels:
+            METRICS.remove(**self.metric_labels)
+            self.metric_labels = {}
+
+        self.is_lost = False
+        self._stream = None
         self.scid = self.random_scid()
 
     @staticmethod
@@ -104,52 +227,110 @@ class Connection:
 
         return wrapper
 
-    @clean
-    def connect(
-            self, adb_device: AdbDevice, extra_cmd: list = None, timeout: int = 5,
-            read_stream: bool = True, auto_exclude: bool = True,
-            _retry_n: int = 0, **kwargs
-    ) -> bool:
+    @property
+    def stream_type(self) -> str:
         """
-            连接至 Scrcpy，建立重连机制。
-        :param adb_device: ADB设备
-        :param extra_cmd: 附加命令
-        :param timeout: 连接超时时间
-        :param read_stream: 读取stream回传信息
-        :param auto_exclude: 自动屏蔽其他连接
-        :param _retry_n: 已重试测试，用于重试，不建议赋值
+            连接类型 video / audio / control
         :return:
         """
+        return self.args.to_args()[0].split('=')[0]
 
-        if _retry_n > self.retry_n:
-            return False
+    @classmethod
+    def server_hash(cls) -> str:
+        """
+            本地 scrcpy-server 内容 hash
+        :return:
+        """
+        if cls._server_hash is None:
+            cls._server_hash = hashlib.md5(Param.PATH_SCRCPY_SERVER_JAR_LOCAL.read_bytes()).hexdigest()[:12]
+        return cls._server_hash
+
+    def push_server(self, adb_device: AdbDevice) -> str:
+        """
+            推送 scrcpy-server
+            2026-10-19 3.3.0 Me2sY  按内容 hash 缓存于设备，仅首次推送
+                Server 启动后会删除自身 CLASSPATH 文件，故每个 scid 使用缓存的硬链接
+        :param adb_device:
+        :return: push_path
+        """
+        t = time.perf_counter()
 
         # 2024-08-30 Me2sY  修复 因 clean导致的 scrcpy-server-v3.2-v2.7 自动删除问题，采用每个进程独立scrcpy-server_SCID
         push_path = Param.PATH_SCRCPY_PUSH + f"_{self.scid}"
-        adb_device.sync.push(Param.PATH_SCRCPY_SERVER_JAR_LOCAL, push_path)
+        cache_path = Param.PATH_SCRCPY_PUSH + f"-{self.server_hash()}"
+        size = Param.PATH_SCRCPY_SERVER_JAR_LOCAL.stat().st_size
+
+        link_cmd = f"(ln -f {cache_path} {push_path} || cp {cache_path} {push_path})"
+
+        # 校验缓存大小并链接
+        cached = adb_device.shell(
+            f"[ \"$(stat -c %s {cache_path} 2>/dev/null)\" = \"{size}\" ] && {link_cmd} && echo 1"
+        ).strip() == '1'
 
+        if not cached:
+            # 先推送至临时文件，避免并发连接读取不完整文件
+            tmp_path = cache_path + f".{self.scid}"
+            adb_device.sync.push(Param.PATH_SCRCPY_SERVER_JAR_LOCAL, tmp_path)
+            adb_device.shell(f"mv -f {tmp_path} {cache_path} && {link_cmd}")
+
+            # 清理过期文件
+            adb_device.shell(
+                f"find {Param.PATH_SCRCPY_PUSH.rsplit('/', 1)[0]} -maxdepth 1 "
+                f"-name '{Param.SCRCPY_SERVER_NAME}*' ! -name '{cache_path.rsplit('/', 1)[1]}' -mmin +1 -delete"
+            )
+
+        self.connect_metrics['push_ms'] = (time.perf_counter() - t) * 1000
+        self.connect_metrics['push_cached'] = cached
+
+        return push_path
+
+    def build_cmd(
+            self, push_path: str, args: list, extra_cmd: list = None, auto_exclude: bool = True
+    ) -> list:
+        """
+            生成 app_process 启动命令
+        :param push_path: server 路径
+        :param args: 连接参数
+        :param extra_cmd: 附加命令
+        :param auto_exclude: 自动屏蔽 args 中未声明的 socket
+        :return:
+        """
         extra_cmd = [] if extra_cmd is None else extra_cmd
-        cmd = Param.SCRCPY_SERVER_START_CMD + self.args.to_args() + extra_cmd + [f"scid={self.scid}"]
+        cmd = Param.SCRCPY_SERVER_START_CMD + args + extra_cmd + [f"scid={self.scid}"]
         cmd[0] = cmd[0] + push_path
 
         if auto_exclude:
             # 自动屏蔽其他socket
-            if 'video=true' in cmd:
-                cmd += ['audio=false', 'control=false']
-            elif 'audio=true' in cmd:
-                cmd += ['video=false', 'control=false']
-            elif 'control=true' in cmd:
-                cmd += ['video=false', 'audio=false']
+            for _ in self.STREAM_ORDER:
+                if not any(arg.startswith(f"{_}=") for arg in cmd):
+                    cmd.append(f"{_}=false")
 
-        # logger.debug(f"Adb Run => {cmd}")
+        return cmd
 
-        # 设备执行 app_process
+    def spawn(self, adb_device: AdbDevice, cmd: list, timeout: int = 5) -> bool:
+        """
+            设备执行 app_process
+        :param adb_device:
+        :param cmd:
+        :param timeout:
+        :return:
+        """
+        # logger.debug(f"Adb Run => {cmd}")
         try:
             self._stream = adb_device.shell(cmd, stream=True, timeout=timeout)
+            return True
         except AdbError as e:
-            logger.error(f"Make Stream Error, Retrying... ERROR => {e}")
-            return self.connect(adb_device, extra_cmd, timeout, read_stream, _retry_n=_retry_n + 1)
+            logger.error(f"Make Stream Error => {e}")
+            return False
 
+    def attach(self, adb_device: AdbDevice, timeout: int = 5, first: bool = True) -> str | None:
+        """
+            创建 forward 连接
+        :param adb_device:
+        :param timeout:
+        :param first: 首个 socket 读取 dummy byte 及 device name
+        :return: device name, 失败返回 None
+        """
         wait_ms = 10
         _conn = None
         for _ in range(timeout * 1000 // wait_ms):
@@ -161,21 +342,97 @@ class Connection:
                 time.sleep(wait_ms / 1000)
 
         if _conn is None:
-            logger.error('Failed to Create Socket. Reconnect')
-            return self.connect(adb_device, extra_cmd, timeout, read_stream, _retry_n=_retry_n + 1)
-        else:
+            logger.error('Failed to Create Socket.')
+            return None
+
+        _device_name = ''
+        if first:
             if _conn.recv(1) != b'\x00':
-                logger.error('Dummy Data Error! Reconnect')
-                return self.connect(adb_device, extra_cmd, timeout, read_stream, _retry_n=_retry_n + 1)
+                logger.error('Dummy Data Error!')
+                _conn.close()
+                return None
 
-        # Device Name
-        _device_name = _conn.recv(64).decode('utf-8').rstrip('\x00')
+            # Device Name
+            _device_name = _conn.recv(64).decode('utf-8').rstrip('\x00')
 
         self.socket = _conn
         self.is_connected = True
+        self.is_lost = False
+
+        self.bind_metrics(adb_device.serial)
 
         # # 避免进程无法关闭
-        self.socket.settimeout(1)
+        self.socket_profile.apply(self.socket)
+
+        return _device_name
+
+    def bind_metrics(self, serial: str):
+        """
+            绑定指标 labels: serial / stream / scid
+        :param serial:
+        :return:
+        """
+        self.metric_labels = {'serial': serial, 'stream': self.stream_type, 'scid': self.scid}
+        self._m_rx_bytes = METRICS.counter('rx_bytes_total', **self.metric_labels)
+        self._m_rx_reads = METRICS.counter('rx_reads_total', **self.metric_labels)
+        self._m_tx_bytes = METRICS.counter('tx_bytes_total', **self.metric_labels)
+        self._m_tx_packets = METRICS.counter('tx_packets_total', **self.metric_labels)
+
+    def observe_connect(self, serial: str, ok: bool):
+        """
+            记录连接结果及耗时，按 serial / stream 统计
+        :param serial:
+        :param ok:
+        :return:
+        """
+        labels = {'serial': serial, 'stream': self.stream_type}
+        if ok:
+            METRICS.counter('connects_total', **labels).inc()
+            METRICS.histogram('connect_ms', **labels).observe(
+                self.connect_metrics.get('push_ms', 0) + self.connect_metrics.get('attach_ms', 0)
+            )
+        else:
+            METRICS.counter('connect_failures_total', **labels).inc()
+
+    @clean
+    def connect(
+            self, adb_device: AdbDevice, extra_cmd: list = None, timeout: int = 5,
+            read_stream: bool = True, auto_exclude: bool = True,
+            _retry_n: int = 0, **kwargs
+    ) -> bool:
+        """
+            连接至 Scrcpy，建立重连机制。
+        :param adb_device: ADB设备
+        :param extra_cmd: 附加命令
+        :param timeout: 连接超时时间
+        :param read_stream: 读取stream回传信息
+        :param auto_exclude: 自动屏蔽其他连接
+        :param _retry_n: 已重试测试，用于重试，不建议赋值
+        :return:
+        """
+
+        if _retry_n > self.retry_n:
+            self.observe_connect(adb_device.serial, False)
+            return False
+
+        self.connect_metrics = {}
+        push_path = self.push_server(adb_device)
+
+        cmd = self.build_cmd(push_path, self.args.to_args(), extra_cmd, auto_exclude)
+
+        t = time.perf_counter()
+        if not self.spawn(adb_device, cmd, timeout):
+            logger.warning('Retrying...')
+            return self.connect(adb_device, extra_cmd, timeout, read_stream, auto_exclude, _retry_n=_retry_n + 1)
+
+        _device_name = self.attach(adb_device, timeout)
+        if _device_name is None:
+            logger.warning('Reconnect')
+            self.disconnect()
+            return self.connect(adb_device, extra_cmd, timeout, read_stream, auto_exclude, _retry_n=_retry_n + 1)
+
+        self.connect_metrics['attach_ms'] = (time.perf_counter() - t) * 1000
+        self.observe_connect(adb_device.serial, True)
 
         # 读取 Scrcpy Server 回传运行信息
         if read_stream:
@@ -183,39 +440,188 @@ class Connection:
 
         return True
 
+    @classmethod
+    def spawn_multiplex(
+            cls, adb_device: AdbDevice, connections: list['Connection'],
+            extra_cmd: list = None, timeout: int = 5
+    ) -> list['Connection'] | None:
+        """
+            推送并启动单一 Server 进程，不建立 socket
+            Server 于 accept 处等待，可作为预启动 Standby
+        :param adb_device:
+        :param connections: 各连接 args 类型不可重复
+        :param extra_cmd:
+        :param timeout:
+        :return: 按 accept 顺序排列的连接，失败返回 None
+        """
+        connections = sorted(connections, key=lambda _: cls.STREAM_ORDER.index(_.stream_type))
+
+        for conn in connections:
+            if conn.is_connected or conn._stream is not None:
+                conn.disconnect()
+
+        # 共用 scid
+        lead = connections[0]
+        for conn in connections[1:]:
+            conn.scid = lead.scid
+
+        lead.connect_metrics = {}
+        push_path = lead.push_server(adb_device)
+
+        args = []
+        for conn in connections:
+            args += conn.args.to_args()
+
+        t = time.perf_counter()
+        if not lead.spawn(adb_device, lead.build_cmd(push_path, args, extra_cmd), timeout):
+            return None
+        lead.connect_metrics['spawn_ms'] = (time.perf_counter() - t) * 1000
+
+        return connections
+
+    @classmethod
+    def attach_multiplex(
+            cls, adb_device: AdbDevice, connections: list['Connection'],
+            timeout: int = 5, read_stream: bool = True
+    ) -> bool:
+        """
+            按 accept 顺序建立已启动 Server 的全部 socket
+        :param adb_device:
+        :param connections: spawn_multiplex 返回的连接
+        :param timeout:
+        :param read_stream:
+        :return:
+        """
+        lead = connections[0]
+
+        t = time.perf_counter()
+        _device_name = None
+        for conn in connections:
+            _ = conn.attach(adb_device, timeout, first=conn is lead)
+            if _ is None:
+                for _conn in connections:
+                    _conn.disconnect()
+                return False
+            if conn is lead:
+                _device_name = _
+
+        metrics = lead.connect_metrics
+        metrics['attach_ms'] = (time.perf_counter() - t) * 1000
+
+        for conn in connections:
+            conn.connect_metrics = metrics
+            conn.observe_connect(adb_device.serial, True)
+
+        if read_stream:
+            threading.Thread(target=lead._thread_load_stream, args=(_device_name,)).start()
+
+        return True
+
+    @classmethod
+    def connect_multiplex(
+            cls, adb_device: AdbDevice, connections: list['Connection'],
+            extra_cmd: list = None, timeout: int = 5, read_stream: bool = True,
+            _retry_n: int = 0, **kwargs
+    ) -> bool:
+        """
+            单一 Scrcpy Server 进程承载多个连接
+            只推送一次 server，只启动一次 app_process，按协议顺序 video -> audio -> control 依次 accept socket
+        :param adb_device:
+        :param connections: 各连接 args 类型不可重复
+        :param extra_cmd:
+        :param timeout:
+        :param read_stream:
+        :param _retry_n:
+        :return:
+        """
+        if _retry_n > connections[0].retry_n:
+            for conn in connections:
+                conn.observe_connect(adb_device.serial, False)
+            return False
+
+        _connections = cls.spawn_multiplex(adb_device, connections, extra_cmd, timeout)
+        if _connections is None or not cls.attach_multiplex(adb_device, _connections, timeout, read_stream):
+            logger.warning('Reconnect')
+            return cls.connect_multiplex(
+                adb_device, connections, extra_cmd, timeout, read_stream, _retry_n=_retry_n + 1
+            )
+
+        return True
+
+    def handle_log_line(self, device_name: str, line: str):
+        """
+            处理 Server 日志行，解析为事件并分发
+        :param device_name:
+        :param line:
+        :return:
+        """
+        event = ServerEvent.parse(
+            line, serial=self.metric_labels.get('serial', ''), stream=self.stream_type, scid=self.scid
+        )
+
+        if event.level == 'ERROR':
+            logger.error(f"{device_name:<32} => {line}")
+        elif event.level == 'WARN':
+            logger.warning(f"{device_name:<32} => {line}")
+        else:
+            logger.info(f"{device_name:<32} => {line}")
+
+        if self.event_bus is not None:
+            self.event_bus.publish(event)
+
     def _thread_load_stream(self, device_name: str):
         """
             读取 Scrcpy Server 回传信息
+            2026-10-19 3.3.0 Me2sY  按块读取并切分行，替代逐字符读取
         :return:
         """
-        msg = ''
-        while self.is_connected and not self._stream.closed:
+        _stream = self._stream
+        buf = b''
+        while self.is_connected and _stream is not None and not _stream.closed:
             try:
-                w = self._stream.read_string(1)
-                if w == b'':
-                    logger.warning(f"Stream Lost Connection")
-                    break
-                if w == '\n':
-                    logger.info(f"{device_name:<32} => {msg}")
-                    msg = ''
-                else:
-                    msg += w
-            except AdbError:
+                chunk = _stream.conn.recv(4096)
+            except socket.timeout:
+                continue
+            except (ConnectionAbortedError, OSError, AdbError):
+                logger.warning(f"Stream Lost Connection")
                 break
-            except (ConnectionAbortedError, OSError):
+
+            if chunk == b'':
                 logger.warning(f"Stream Lost Connection")
                 break
-            except Exception as e:
-                logger.error(f"{device_name:<32} Stream Exception => {e}")
+
+            buf += chunk
+            *lines, buf = buf.split(b'\n')
+            for line in lines:
+                try:
+                    self.handle_log_line(device_name, line.decode('utf-8', errors='replace').rstrip('\r'))
+                except Exception as e:
+                    logger.error(f"{device_name:<32} Stream Exception => {e}")
 
     def recv(self, buf_size) -> bytes:
         """
             self.socket.recv
+            对端关闭或 socket 错误时置 is_lost
         :param buf_size:
         :return:
         """
         if self.is_connected:
-            return self.socket.recv(buf_size)
+            try:
+                data = self.socket.recv(buf_size)
+            except socket.timeout:
+                raise
+            except OSError:
+                if self.is_connected:
+                    self.is_lost = True
+                raise
+
+            if data == b'' and buf_size > 0 and self.is_connected:
+                self.is_lost = True
+
+            self._m_rx_reads.inc()
+            self._m_rx_bytes.inc(len(data))
+
+            return data
         else:
             return b''
 
@@ -226,4 +632,59 @@ class Connection:
         :return:
         """
         if self.is_connected:
-            self.socket.send(buf_data)
+            try:
+                self.socket.send(buf_data)
+                self._m_tx_packets.inc()
+                self._m_tx_bytes.inc(len(buf_data))
+            except socket.timeout:
+                raise
+            except OSError:
+                if self.is_connected:
+                    self.is_lost = True
+                raise
+
+
+if __name__ == '__main__':
+    """
+        DEMO Here
+        各 SocketProfile 下 video 吞吐及 control 发送耗时
+        control 端到端延迟见 python -m myscrcpy.tools.latency --profile
+    """
+    from adbutils import adb
+
+    from myscrcpy.core.video import VideoArgs
+    from myscrcpy.core.control import ControlArgs, ControlAdapter
+    from myscrcpy.utils import Action
+
+    device = adb.device_list()[0]
+
+    profiles = {
+        'legacy': (SocketProfile.LEGACY, SocketProfile.LEGACY),
+        'default': (SocketProfile.for_stream('video'), SocketProfile.for_stream('control')),
+    }
+
+    for profile_name, (video_profile, control_profile) in profiles.items():
+        conn = Connection(VideoArgs(max_size=0, fps=120), socket_profile=video_profile)
+        if not conn.connect(device):
+            continue
+
+        total, t = 0, time.perf_counter()
+        while time.perf_counter() - t < 5:
+            try:
+                total += len(conn.recv(0x10000))
+            except socket.timeout:
+                ...
+        logger.info(f"{profile_name:8s} video  {total / (time.perf_counter() - t) / 1024 / 1024:.2f} MB/s")
+        conn.disconnect()
+
+        conn = Connection(ControlArgs(screen_status=ControlArgs.STATUS_KEEP), socket_profile=control_profile)
+        if not conn.connect(device):
+            continue
+
+        # KEYCODE_UNKNOWN，设备端无响应
+        packet = ControlAdapter.packet__keycode(Action.RELEASE.value, 0)
+        n, t = 1000, time.perf_counter()
+        for _ in range(n):
+            conn.send(packet)
+        logger.info(f"{profile_name:8s} control {(time.perf_counter() - t) / n * 1e6:.1f} us/packet")
+        conn.disconnect()
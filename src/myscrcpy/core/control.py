@@ -4,6 +4,14 @@
     ~~~~~~~~~~~~~~~~~~
 
     Log:
+        2026-10-19 3.3.0 Me2sY
+            1.新增 send_packet 回调
+            2.新增 injectKeycode
+            3.新增 GamepadScheduler 定频发送 Gamepad report
+            4.支持 multiplex 连接，socket 断开时结束主进程
+            5.记录发送队列深度指标
+            6.新增 display_state，设备尺寸变化时同步 coord_hv
+
         2025-04-23 3.2.0 Me2sY
             1.适配 Scrcpy 3.2 增加 vendorId ProductId
             2.优化关闭逻辑，避免卡线程
@@ -24,10 +32,10 @@
 """
 
 __author__ = 'Me2sY'
-__version__ = '3.2.0'
+__version__ = '3.3.0'
 
 __all__ = [
-    'KeyboardWatcher', 'Gamepad',
+    'KeyboardWatcher', 'Gamepad', 'GamepadScheduler',
     'ControlArgs', 'ControlAdapter'
 ]
 
@@ -38,6 +46,7 @@ import queue
 import re
 import struct
 import threading
+import time
 from typing import ClassVar, Callable
 
 from adbutils import AdbDevice, AdbError
@@ -47,6 +56,8 @@ import pyperclip
 from myscrcpy.core.args_cls import ScrcpyConnectArgs
 from myscrcpy.core.adapter_cls import ScrcpyAdapter
 from myscrcpy.core.connection import Connection
+from myscrcpy.core.display import DisplayState
+from myscrcpy.core.metrics import METRICS, Gauge
 from myscrcpy.utils import Action, Coordinate, ScalePointR
 from myscrcpy.utils import UnifiedKey, UnifiedKeys, KeyMapper
 from myscrcpy.utils import (
@@ -233,13 +244,18 @@ class Gamepad:
         max_value: int
         last_value: int | None = None
         jitter: int = 0
+        centered: bool = True           # 摇杆居中归零，扳机 -1 为静止位
+        last_scale: float | None = None
 
         def __post_init__(self):
             if self.max_value < 0:
                 raise ValueError(f'Max Value must be positive')
 
             if self.last_value is None:
-                self.last_value = int(self.max_value / 2)
+                self.last_value = int(self.max_value / 2) if self.centered else 0
+
+            if self.last_scale is None:
+                self.last_scale = 0.0 if self.centered else -1.0
 
         def __call__(self, *args, **kwargs) -> int:
             return self.last_value
@@ -250,6 +266,7 @@ class Gamepad:
             :param scale:
             :return:
             """
+            self.last_scale = scale
             _ = max(
                 0,
                 min(
@@ -263,6 +280,29 @@ class Gamepad:
                 self.last_value = _
                 return True, _
 
+        def quantize(self, deadzone: float, levels: int) -> int:
+            """
+                死区及量化处理后的值
+            :param deadzone: 0..1
+            :param levels: 量化级数
+            :return:
+            """
+            s = max(-1.0, min(1.0, self.last_scale))
+
+            if self.centered:
+                mag = abs(s)
+                mag = 0.0 if mag <= deadzone else (mag - deadzone) / (1 - deadzone)
+                steps = max(1, levels // 2)
+                mag = round(mag * steps) / steps
+                u = (1 + (mag if s >= 0 else -mag)) / 2
+            else:
+                u = (s + 1) / 2
+                u = 0.0 if u <= deadzone else (u - deadzone) / (1 - deadzone)
+                steps = max(1, levels - 1)
+                u = round(u * steps) / steps
+
+            return round(u * self.max_value)
+
 
     @dataclass
     class DPad:
@@ -353,6 +393,9 @@ class Gamepad:
 
         self.send_method = send_method
 
+        # 由 GamepadScheduler 管理时关闭，按固定频率发送
+        self.auto_update = True
+
         self.is_created = False
 
         self.pressed = list()
@@ -363,8 +406,8 @@ class Gamepad:
         self.right_stick_x = self.Axis(self.MAX_VALUE_STICK, jitter=1500)
         self.right_stick_y = self.Axis(self.MAX_VALUE_STICK, jitter=1500)
 
-        self.left_trigger = self.Axis(self.MAX_VALUE_TRIGGER)
-        self.right_trigger = self.Axis(self.MAX_VALUE_TRIGGER)
+        self.left_trigger = self.Axis(self.MAX_VALUE_TRIGGER, centered=False)
+        self.right_trigger = self.Axis(self.MAX_VALUE_TRIGGER, centered=False)
 
         self.last_packet = None
 
@@ -414,13 +457,14 @@ class Gamepad:
             )
             self.__class__.gamepad_inited.remove(self.gp_id)
 
-    def key_pressed(self, unified_key: UnifiedKey, auto_update: bool = True):
+    def key_pressed(self, unified_key: UnifiedKey, auto_update: bool | None = None):
         """
             按键按下
         :param unified_key:
-        :param auto_update:
+        :param auto_update: None 时使用 self.auto_update
         :return:
         """
+        auto_update = self.auto_update if auto_update is None else auto_update
         if unified_key in self.dpad.dpad_keys:
             self.dpad.key_pressed(unified_key)
             auto_update and self.update_status()
@@ -431,13 +475,14 @@ class Gamepad:
             auto_update and self.update_status()
             return
 
-    def key_release(self, unified_key: UnifiedKey, auto_update: bool = True):
+    def key_release(self, unified_key: UnifiedKey, auto_update: bool | None = None):
         """
             按键释放
         :param unified_key:
-        :param auto_update:
+        :param auto_update: None 时使用 self.auto_update
         :return:
         """
+        auto_update = self.auto_update if auto_update is None else auto_update
         if unified_key in self.dpad.dpad_keys:
             self.dpad.key_release(unified_key)
             auto_update and self.update_status()
@@ -458,9 +503,11 @@ class Gamepad:
         """
         self.axis_mapper[axis_idx].s2v(value_scale)
 
-    def update_status(self):
+    def build_report(self, deadzone: float | None = None, levels: int | None = None) -> bytes:
         """
-            更新status
+            生成 15 bytes HID input report
+        :param deadzone: 不为 None 时对各轴进行死区及量化处理
+        :param levels: 量化级数
         :return:
         """
 
@@ -469,32 +516,159 @@ class Gamepad:
         for uk in self.pressed:
             key_v |= uk.value
 
-        # Create gamepad HID input report
-        packet = struct.pack(
-            '<HHHHHHHB', *[
-                self.left_stick_x(),
-                self.left_stick_y(),
-                self.right_stick_x(),
-                self.right_stick_y(),
-                self.left_trigger(),
-                self.right_trigger(),
-                key_v,
-                self.dpad()
+        if deadzone is None:
+            axes = [_() for _ in self.axis_mapper.values()]
+        else:
+            axes = [_.quantize(deadzone, levels) for _ in self.axis_mapper.values()]
+
+        return struct.pack('<HHHHHHHB', *axes, key_v, self.dpad())
+
+    def input_packet(self, report: bytes) -> bytes:
+        """
+            UHID_INPUT 数据包
+        :param report:
+        :return:
+        """
+        return struct.pack(
+            '>BhH', *[
+                ControlAdapter.MessageType.UHID_INPUT.value,
+                self.gp_id,
+                len(report)
             ]
-        )
+        ) + report
+
+    def update_status(self):
+        """
+            更新status
+        :return:
+        """
+
+        # Create gamepad HID input report
+        packet = self.build_report()
 
         # Send packet
         if packet != self.last_packet:
             self.last_packet = packet
-            self.send_method(
-                struct.pack(
-                    '>BhH', *[
-                        ControlAdapter.MessageType.UHID_INPUT.value,
-                        self.gp_id,
-                        15
-                    ]
-                ) + packet
-            )
+            self.send_method(self.input_packet(packet))
+
+
+class GamepadScheduler:
+    """
+        Gamepad 定频发送调度器
+        按固定频率采样各手柄状态，经死区及量化处理后，仅在 report 变化时发送
+        多个手柄共用一个发送通道，同一周期内的数据包合并发送
+    """
+
+    def __init__(
+            self, send_method: Callable,
+            poll_hz: int = 500, deadzone: float = 0.08, levels: int = 256
+    ):
+        """
+            调度器
+        :param send_method: 通常为 ControlAdapter.send_packet
+        :param poll_hz: 采样频率，如 250/500/1000
+        :param deadzone: 死区 0..1
+        :param levels: 每轴量化级数
+        """
+        if poll_hz <= 0:
+            raise ValueError('Poll Hz must be > 0')
+
+        if not 0 <= deadzone < 1:
+            raise ValueError('Deadzone must in [0, 1)')
+
+        self.send_method = send_method
+        self.poll_hz = poll_hz
+        self.deadzone = deadzone
+        self.levels = levels
+
+        self.gamepads: dict[int, Gamepad] = {}
+
+        self.is_running = False
+        self.sent_n = 0
+
+    def create_gamepad(self, name: str = 'MYGP') -> Gamepad:
+        """
+            创建并注册手柄
+        :param name:
+        :return:
+        """
+        gp = Gamepad(self.send_method, name)
+        self.register(gp)
+        return gp
+
+    def register(self, gamepad: Gamepad):
+        """
+            注册手柄，关闭其即时发送
+        :param gamepad:
+        :return:
+        """
+        gamepad.auto_update = False
+        self.gamepads[gamepad.gp_id] = gamepad
+
+    def unregister(self, gamepad: Gamepad):
+        """
+            注销手柄
+        :param gamepad:
+        :return:
+        """
+        self.gamepads.pop(gamepad.gp_id, None)
+        gamepad.auto_update = True
+
+    def tick(self):
+        """
+            采样一次，发送变化的 report
+        :return:
+        """
+        packets = []
+        for gp in tuple(self.gamepads.values()):
+            if not gp.is_created:
+                continue
+            report = gp.build_report(self.deadzone, self.levels)
+            if report != gp.last_packet:
+                gp.last_packet = report
+                packets.append(gp.input_packet(report))
+
+        if packets:
+            self.send_method(b''.join(packets))
+            self.sent_n += len(packets)
+
+    def _thread_loop(self):
+        """
+            定频循环，以 deadline 累加避免漂移
+        :return:
+        """
+        period = 1 / self.poll_hz
+        deadline = time.perf_counter()
+        while self.is_running:
+            try:
+                self.tick()
+            except Exception as e:
+                logger.error(f"Gamepad Scheduler Error => {e}")
+
+            deadline += period
+            wait = deadline - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+            else:
+                # 落后时重新对齐
+                deadline = time.perf_counter()
+
+    def start(self) -> 'GamepadScheduler':
+        """
+            启动调度线程
+        :return:
+        """
+        if not self.is_running:
+            self.is_running = True
+            threading.Thread(target=self._thread_loop, daemon=True).start()
+        return self
+
+    def stop(self):
+        """
+            停止调度
+        :return:
+        """
+        self.is_running = False
 
 
 @dataclass
@@ -533,6 +707,7 @@ class ControlAdapter(ScrcpyAdapter):
     CLOSE_PACKET = b'Me2sYSayBye'
 
     class MessageType(IntEnum):
+        INJECT_KEYCODE = 0
         INJECT_TOUCH_EVENT = 2
         SET_CLIPBOARD = 9
         SET_SCREEN_POWER_MODE = 10
@@ -559,10 +734,11 @@ class ControlAdapter(ScrcpyAdapter):
             return Coordinate(int(w), int(h))
         raise AdbError("wm size output unexpected", output)
 
-    def __init__(self, connection: Connection):
+    def __init__(self, connection: Connection, display_state: DisplayState | None = None):
         """
             创建 Control Socket
         :param connection:
+        :param display_state: 屏幕状态，设备尺寸变化时同步更新 coord_hv
         """
         super().__init__(connection)
 
@@ -573,6 +749,12 @@ class ControlAdapter(ScrcpyAdapter):
         self.clipboard = connection.args.clipboard
 
         self.coord_hv = {}
+        self.display_state = display_state
+
+        # 2026-10-19 3.3.0 Me2sY  send_packet 回调，用于录制等功能
+        self.packet_callbacks = set()
+
+        self._m_queue_depth = Gauge()
 
     def start(self, adb_device: AdbDevice, *args, **kwargs) -> bool:
         """
@@ -585,23 +767,22 @@ class ControlAdapter(ScrcpyAdapter):
         if self.is_running and self.is_ready:
             return True
 
-        _coord = self.get_window_size(adb_device)
-
-        # 2024-09-08 1.5.7 Me2sY  适配Scrcpy control
-        _coord = _coord.fit_scrcpy_video()
-
-        if _coord.rotation == ROTATION_VERTICAL:
-            _coord_v = _coord
+        # 2026-10-19 3.3.0 Me2sY  优先使用 display_state，Session 内重连/切换时无需再次查询
+        if self.display_state is None:
+            self.set_coord(self.get_window_size(adb_device))
         else:
-            _coord_v = Coordinate(_coord.height, _coord.width)
-
-        self.coord_hv[ROTATION_VERTICAL] = _coord_v
-        self.coord_hv[ROTATION_HORIZONTAL] = _coord_v.rotate()
+            if self.display_state.coord_v is None:
+                self.display_state.refresh(adb_device)
+            self.set_coord(self.display_state.coord_v or self.get_window_size(adb_device))
+            self.display_state.register(self._on_display_change)
 
         if self.screen_status == ControlArgs.STATUS_KEEP:
             self.screen_status = adb_device.is_screen_on()
 
-        if self.conn.connect(adb_device):
+        # 2026-10-19 3.3.0 Me2sY  multiplex 模式下连接已由 Session 建立
+        if self.conn.is_connected or self.conn.connect(adb_device):
+            # 丢弃上次连接遗留的 CLOSE_PACKET 及断线期间积压的控制包
+            self.__packet_queue = queue.Queue()
             self.is_running = True
             threading.Thread(target=self.main_thread).start()
             threading.Thread(target=self.clipboard_thread).start()
@@ -609,11 +790,36 @@ class ControlAdapter(ScrcpyAdapter):
         else:
             return False
 
+    def set_coord(self, coord: Coordinate):
+        """
+            设置设备尺寸
+        :param coord: 任意方向
+        :return:
+        """
+        # 2024-09-08 1.5.7 Me2sY  适配Scrcpy control
+        _coord = coord.fit_scrcpy_video()
+
+        if _coord.rotation == ROTATION_VERTICAL:
+            _coord_v = _coord
+        else:
+            _coord_v = Coordinate(_coord.height, _coord.width)
+
+        self.coord_hv = {
+            ROTATION_VERTICAL: _coord_v,
+            ROTATION_HORIZONTAL: _coord_v.rotate()
+        }
+
+    def _on_display_change(self, display_state: DisplayState):
+        if display_state.coord_v is not None:
+            self.set_coord(display_state.coord_v)
+
     def stop(self):
         """
             停止进程
         :return:
         """
+        if self.display_state is not None:
+            self.display_state.unregister(self._on_display_change)
         self.is_running = False
         self.__packet_queue.put(self.CLOSE_PACKET)
         self.conn.disconnect()
@@ -625,13 +831,19 @@ class ControlAdapter(ScrcpyAdapter):
         :return:
         """
         self.is_ready = True
+        self._m_queue_depth = METRICS.gauge('control_queue_depth', **self.conn.metric_labels)
         logger.success(f"Control Socket {self.conn.scid} Connected!")
         self.f_set_screen(
             True if self.screen_status == ControlArgs.STATUS_ON else False
         )
-        while self.is_running:
+        packet_queue = self.__packet_queue
+        while self.is_running and not self.conn.is_lost:
             try:
-                self.conn.send(self.__packet_queue.get())
+                packet = packet_queue.get()
+                # CLOSE_PACKET 仅用于唤醒本线程，不发送
+                if packet is self.CLOSE_PACKET:
+                    break
+                self.conn.send(packet)
             except OSError:
                 continue
             except Exception as e:
@@ -703,8 +915,28 @@ class ControlAdapter(ScrcpyAdapter):
         """
         if packet != self.last_packet or ignore_repeat:
             self.__packet_queue.put(packet)
+            self._m_queue_depth.set(self.__packet_queue.qsize())
+            if self.packet_callbacks:
+                for callback in tuple(self.packet_callbacks):
+                    callback(packet)
         self.last_packet = packet
 
+    def register_packet_callback(self, callback: Callable[[bytes], None]):
+        """
+            注册 send_packet 回调，数据包进入发送队列时调用
+        :param callback:
+        :return:
+        """
+        self.packet_callbacks.add(callback)
+
+    def unregister_packet_callback(self, callback: Callable[[bytes], None]):
+        """
+            注销 send_packet 回调
+        :param callback:
+        :return:
+        """
+        self.packet_callbacks.discard(callback)
+
     @classmethod
     def packet__screen(cls, status: bool) -> bytes:
         """
@@ -808,6 +1040,25 @@ class ControlAdapter(ScrcpyAdapter):
             touch_id=touch_id, ignore_repeat=ignore_repeat
         )
 
+    @classmethod
+    def packet__keycode(cls, action: int, keycode: int, repeat: int = 0, meta_state: int = 0) -> bytes:
+        """
+            转换为 Scrcpy injectKeycode 指令
+        :param action: 0 DOWN / 1 UP
+        :param keycode: Android KeyCode
+        :param repeat:
+        :param meta_state:
+        :return:
+        """
+        return struct.pack(
+            '>BBiii',
+            cls.MessageType.INJECT_KEYCODE.value,
+            action, keycode, repeat, meta_state
+        )
+
+    def f_keycode(self, action: int, keycode: int, repeat: int = 0, meta_state: int = 0):
+        self.send_packet(self.packet__keycode(action, keycode, repeat, meta_state), ignore_repeat=True)
+
     @classmethod
     def packet__text_paste(cls, text: str, paste: bool = True) -> bytes:
         text_bytes = text.encode('utf-8')
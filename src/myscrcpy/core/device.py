@@ -4,6 +4,19 @@
     ~~~~~~~~~~~~~~~~~~
 
     Log:
+        2026-10-19 3.3.0 Me2sY
+            1. DeviceFactory 并行加载设备
+            2. DeviceInfo 按 adb serial 缓存至 kv_global，带 TTL，WLAN serial 命中时核对 ro.serialno
+            3. device() 优先使用已加载设备，后台刷新
+            4. prop_d 按需加载
+            5. getprop 改用 PropStore 单次解析，去除 exec
+            6. 新增 DeviceQuery，单次 shell 获取屏幕尺寸及方向，uiautomator2 改为可选并按需加载
+            7. 新增 DeviceMonitor，基于 track-devices 增量维护设备状态，adb_dev 改为状态查询
+            8. FileManager.push_dir 改为 tar 流单连接上传，支持进度及取消，失败回退逐文件上传
+            9. FileManager.pull_file / pull_dir 改由 TransferManager 并发续传并校验
+            10. FileManager 新增 sync_dir，基于 md5 增量同步
+            11. FileManager.ls 按路径及 mtime 缓存并后台校验，cd 优先本地解析
+
         2024-10-13 1.6.6 Me2sY
             1. 修复prop解析错误问题
             2. 降低 UHID 输入版本功能需求至 9
@@ -24,25 +37,32 @@
 """
 
 __author__ = 'Me2sY'
-__version__ = '1.6.6'
+__version__ = '3.3.0'
 
 __all__ = [
-    'DeviceInfo', 'PackageInfo',
-    'AdvDevice', 'DeviceFactory'
+    'DeviceInfo', 'PackageInfo', 'DisplayInfo', 'SyncReport',
+    'DeviceQuery', 'DeviceMonitor', 'AdvDevice', 'DeviceFactory'
 ]
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 import datetime
+import posixpath
+import re
+import shlex
+import socket
 import stat
+import tarfile
 import threading
 import time
 from pathlib import PurePosixPath, Path
-from typing import NamedTuple, Tuple, List, Dict
+from typing import Callable, NamedTuple, Tuple, List, Dict, Set
 
-from adbutils import AdbDevice, AdbError, AppInfo, adb, FileInfo
+from adbutils import AdbDevice, AdbError, AdbTimeout, AppInfo, adb, FileInfo, AdbConnection, DeviceEvent
 from loguru import logger
 
-from myscrcpy.utils import KVManager, kv_global, Coordinate, ROTATION_HORIZONTAL, ROTATION_VERTICAL, Param
-import uiautomator2
+from myscrcpy.core.transfer import Transfer, TransferManager
+from myscrcpy.utils import KVManager, kv_global, Coordinate, ROTATION_HORIZONTAL, ROTATION_VERTICAL, Param, PropStore
 
 
 class DeviceInfo(NamedTuple):
@@ -81,13 +101,310 @@ class PackageInfo(NamedTuple):
     activity: str
 
 
+class DisplayInfo(NamedTuple):
+    """
+        Display Info
+    """
+    width: int                          # 自然方向(rotation 0)宽度
+    height: int
+    rotation: int = 0                   # 0 ~ 3
+
+    @property
+    def coordinate(self) -> Coordinate:
+        """
+            当前方向尺寸
+        :return:
+        """
+        _ = Coordinate(self.width, self.height)
+        return _.rotate() if self.rotation % 2 == 1 else _
+
+
+class DeviceQuery:
+    """
+        轻量设备查询
+        多条 shell 命令合并为一次调用，替代 uiautomator2 获取屏幕尺寸及方向
+    """
+
+    SEP = '--MYSC-SEP--'
+
+    COMMANDS = {
+        'size': 'wm size',
+        'orientation': "dumpsys display | grep -m 1 -E 'orientation=[0-9]'",
+        'user_rotation': 'settings get system user_rotation',
+    }
+
+    def __init__(self, adb_device: AdbDevice):
+        self.adb_device = adb_device
+
+    def query(self, *names: str, timeout: float = 3) -> Dict[str, str]:
+        """
+            批量执行 COMMANDS 中命令
+        :param names: 为空时执行全部
+        :param timeout:
+        :return: {name: output}
+        """
+        names = names or tuple(self.COMMANDS.keys())
+        output = self.adb_device.shell(
+            f'; echo {self.SEP}; '.join(f"{self.COMMANDS[_]} 2>/dev/null" for _ in names), timeout=timeout
+        )
+        return {name: _.strip() for name, _ in zip(names, output.split(self.SEP))}
+
+    @staticmethod
+    def parse_size(output: str) -> Coordinate:
+        """
+            解析 wm size，优先 Override size
+        :param output:
+        :return:
+        """
+        m = re.search(r"Override size: (\d+)x(\d+)", output) or re.search(r"Physical size: (\d+)x(\d+)", output)
+        if m is None:
+            raise ValueError(f"wm size output unexpected => {output}")
+        return Coordinate(int(m.group(1)), int(m.group(2)))
+
+    @staticmethod
+    def parse_rotation(orientation: str, user_rotation: str = '') -> int:
+        """
+            解析方向，dumpsys display 无结果时使用 user_rotation
+        :param orientation:
+        :param user_rotation:
+        :return:
+        """
+        m = re.search(r"orientation=(\d)", orientation)
+        if m:
+            return int(m.group(1)) % 4
+        try:
+            return int(user_rotation) % 4
+        except ValueError:
+            return 0
+
+    def display(self) -> DisplayInfo:
+        """
+            屏幕尺寸及方向
+        :return:
+        """
+        r = self.query('size', 'orientation', 'user_rotation')
+        size = self.parse_size(r['size'])
+        return DisplayInfo(size.width, size.height, self.parse_rotation(r['orientation'], r['user_rotation']))
+
+    def rotation(self) -> int:
+        """
+            当前方向
+        :return:
+        """
+        r = self.query('orientation', 'user_rotation')
+        return self.parse_rotation(r['orientation'], r['user_rotation'])
+
+
+class DeviceMonitor:
+    """
+        设备热插拔监听
+        通过 ADB Server host:track-devices 长连接接收设备列表变化，增量维护状态
+        回调参数为 DeviceEvent(present, serial, status)，status: device / offline / unauthorized / absent
+    """
+
+    STATUS_DEVICE = 'device'
+    STATUS_ABSENT = 'absent'
+
+    RETRY_SEC = 1       # ADB Server 断开后重连间隔
+
+    def __init__(self):
+        self.states: Dict[str, str] = {}
+        self.callbacks: Set[Callable[[DeviceEvent], None]] = set()
+
+        self.is_running = False
+        self.ready = threading.Event()      # 已收到首个设备列表
+
+        self._conn: AdbConnection | None = None
+        self._thread: threading.Thread | None = None
+
+    def register(self, callback: Callable[[DeviceEvent], None]):
+        """
+            注册设备事件回调，于监听线程中执行，应尽快返回
+        :param callback:
+        :return:
+        """
+        self.callbacks.add(callback)
+
+    def unregister(self, callback: Callable[[DeviceEvent], None]):
+        self.callbacks.discard(callback)
+
+    def is_online(self, serial: str) -> bool:
+        """
+            设备是否可用
+        :param serial: adb serial
+        :return:
+        """
+        return self.states.get(serial) == self.STATUS_DEVICE
+
+    def start(self) -> 'DeviceMonitor':
+        if self.is_running:
+            return self
+        self.is_running = True
+        self._thread = threading.Thread(target=self._thread_track, daemon=True, name='device_monitor')
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.is_running = False
+        if self._conn is not None:
+            self._conn.close()
+
+    @staticmethod
+    def parse(output: str) -> Dict[str, str]:
+        """
+            解析设备列表
+        :param output: serial\tstatus 每行一个
+        :return: {serial: status}
+        """
+        states = {}
+        for line in output.splitlines():
+            fields = line.strip().split('\t', maxsplit=1)
+            if len(fields) == 2:
+                states[fields[0]] = fields[1]
+        return states
+
+    def _emit(self, event: DeviceEvent):
+        logger.info(f"Device {event.serial} => {event.status}")
+        for callback in tuple(self.callbacks):
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error(f"DeviceMonitor Callback {callback} Error => {e}")
+
+    def _update(self, states: Dict[str, str]):
+        """
+            对比设备列表，发送变化事件
+        :param states:
+        :return:
+        """
+        prev, self.states = self.states, states
+
+        for serial in prev.keys() - states.keys():
+            self._emit(DeviceEvent(False, serial, self.STATUS_ABSENT))
+
+        for serial, status in states.items():
+            if prev.get(serial) != status:
+                self._emit(DeviceEvent(True, serial, status))
+
+        self.ready.set()
+
+    def _thread_track(self):
+        """
+            监听线程，ADB Server 重启时自动重连
+        :return:
+        """
+        while self.is_running:
+            try:
+                self._conn = adb.make_connection()
+                self._conn.send_command('host:track-devices')
+                self._conn.check_okay()
+                while self.is_running:
+                    self._update(self.parse(self._conn.read_string_block()))
+
+            except (AdbError, OSError) as e:
+                if not self.is_running:
+                    break
+                logger.warning(f"Track Devices Lost, Retry in {self.RETRY_SEC}s => {e}")
+
+                # ADB Server 断开时全部设备视为离线
+                self._update({})
+                self.ready.clear()
+                time.sleep(self.RETRY_SEC)
+
+            finally:
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+
+        logger.warning('DeviceMonitor Stopped.')
+
+
+class SyncReport(NamedTuple):
+    """
+        sync_dir 结果
+    """
+
+    files_total: int
+    files_changed: int
+    files_deleted: int
+    bytes_sent: int
+    bytes_saved: int
+    completed: bool
+    seconds: float
+
+
+@dataclass
+class _Listing:
+    """
+        目录缓存
+    """
+
+    mtime: datetime.datetime | None
+    files: List[FileInfo]
+    t_checked: float
+
+
+class _TarSink:
+    """
+        tarfile 流模式输出至 socket
+        合并写入，按块 sendall，统计进度并响应取消
+    """
+
+    CHUNK = 256 * 1024
+
+    def __init__(
+            self, sock, total: int,
+            progress_callback: Callable[[int, int], None] | None = None,
+            cancel_event: threading.Event | None = None
+    ):
+        self.sock = sock
+        self.total = total
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event
+
+        self.sent = 0
+        self._buf = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buf += data
+        if len(self._buf) >= self.CHUNK:
+            self.flush()
+        return len(data)
+
+    def flush(self):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise InterruptedError()
+
+        if not self._buf:
+            return
+
+        self.sock.sendall(self._buf)
+        self.sent += len(self._buf)
+        self._buf.clear()
+
+        if self.progress_callback:
+            self.progress_callback(min(self.sent, self.total), self.total)
+
+
 class FileManager:
     """
         文件管理器
     """
 
+    TAR_RC_MARK = 'MYSC_TAR_RC='
+    TAR_RC_TIMEOUT = 60             # 发送完毕后等待设备端 tar 退出，秒
+    MKDIR_BATCH = 200
+    KV_HASH_NAME = 'file_hash'
+    LISTING_REVALIDATE_SEC = 2
+
     def __init__(self, adb_device: AdbDevice):
         self.adb_device = adb_device
+        self._has_tar: bool | None = None
+        self._transfer: TransferManager | None = None
+        self.kv_hash = KVManager(self.KV_HASH_NAME)
+
+        self._listings: Dict[PurePosixPath, _Listing] = {}
+        self._listing_lock = threading.Lock()
 
         self.path_base = Param.PATH_DEV_BASE
         self.path_cur = self.path_base
@@ -99,14 +416,95 @@ class FileManager:
     def __repr__(self):
         return self.path_cur.__str__()
 
-    def ls(self, path: str = None) -> List[FileInfo]:
+    def _list(self, path: PurePosixPath) -> _Listing:
+        """
+            读取目录，记录目录 mtime
+        :param path:
+        :return:
+        """
+        mtime = self.adb_device.sync.stat(path.__str__()).mtime
+        listing = _Listing(mtime, self.adb_device.sync.list(path.__str__()), time.perf_counter())
+        with self._listing_lock:
+            self._listings[path] = listing
+        return listing
+
+    def ls(
+            self, path: str = None, refresh: bool = False,
+            revalidate_callback: Callable[[PurePosixPath, List[FileInfo]], None] | None = None
+    ) -> List[FileInfo]:
         """
             ls
+            2026-10-19 3.3.0 按路径缓存，命中时立即返回并后台按目录 mtime 校验
         :param path:
+        :param refresh: 忽略缓存
+        :param revalidate_callback: 后台校验发现变化时回调 (path, files)
         :return:
         """
         _path = PurePosixPath(path) if path else self.path_cur
-        return self.adb_device.sync.list(_path.__str__())
+
+        listing = None if refresh else self._listings.get(_path)
+        if listing is None:
+            return self._list(_path).files
+
+        if time.perf_counter() - listing.t_checked > self.LISTING_REVALIDATE_SEC:
+            # 启动前标记，避免重复启动校验线程
+            listing.t_checked = time.perf_counter()
+            threading.Thread(target=self._revalidate, args=(_path, listing, revalidate_callback), daemon=True).start()
+
+        return listing.files
+
+    def _revalidate(
+            self, path: PurePosixPath, listing: _Listing,
+            revalidate_callback: Callable[[PurePosixPath, List[FileInfo]], None] | None
+    ):
+        """
+            目录 mtime 变化时重新读取
+        :param path:
+        :param listing:
+        :param revalidate_callback:
+        :return:
+        """
+        try:
+            if self.adb_device.sync.stat(path.__str__()).mtime == listing.mtime:
+                return
+            files = self._list(path).files
+        except (AdbError, OSError) as e:
+            logger.warning(f"ls {path} Revalidate Error => {e}")
+            return
+
+        if revalidate_callback:
+            revalidate_callback(path, files)
+
+    def invalidate(self, path: PurePosixPath | str | None = None):
+        """
+            清除目录缓存
+        :param path: None 时清除全部
+        :return:
+        """
+        with self._listing_lock:
+            if path is None:
+                self._listings.clear()
+            else:
+                self._listings.pop(PurePosixPath(path), None)
+
+    def _resolve_local(self, path: PurePosixPath) -> PurePosixPath | None:
+        """
+            依据缓存本地解析目录，符号链接及未缓存项返回 None
+        :param path: 绝对路径
+        :return:
+        """
+        path = PurePosixPath(posixpath.normpath(path.__str__()))
+        if path == path.parent or path in self._listings:
+            return path
+
+        listing = self._listings.get(path.parent)
+        if listing is None:
+            return None
+
+        for _ in listing.files:
+            if _.path == path.name:
+                return path if stat.S_ISDIR(_.mode) else None
+        return None
 
     def rm(self, abs_path: PurePosixPath | str):
         """
@@ -120,7 +518,10 @@ class FileManager:
             logger.warning(f"{abs_path} Not Exists")
             return
 
+        self.invalidate(PurePosixPath(abs_path).parent)
+
         if stat.S_ISDIR(file_info.mode):
+            self.invalidate(abs_path)
             sr = self.adb_device.shell2(f"rm -rf {abs_path}")
             if sr.returncode != 0:
                 logger.warning(f"rm {abs_path} Error => {sr.output}")
@@ -141,7 +542,13 @@ class FileManager:
         :return:
         """
         _path = self.path_cur / path
-        if self.adb_device.sync.exists(_path.__str__()):
+
+        # 2026-10-19 3.3.0 已缓存目录本地解析，符号链接等仍由设备解析
+        _resolved = self._resolve_local(_path)
+        if _resolved is not None:
+            self.path_cur = _resolved
+
+        elif self.adb_device.sync.exists(_path.__str__()):
 
             sr = self.adb_device.shell2(f"cd {_path} && pwd")
             if sr.returncode == 0:
@@ -183,44 +590,338 @@ class FileManager:
                 dest = self.path_cur
 
         self.adb_device.sync.push(src, dest.__str__(), mode=mode, check=check)
+        self.invalidate(dest)
         logger.info(f"pushed {src} to {dest}")
 
-    def push_dir(self, src: Path, dest: PurePosixPath = None, to_default_path: bool = True, **kwargs):
+    def _walk(self, src: Path) -> Tuple[List[PurePosixPath], List[Tuple[Path, PurePosixPath]], int]:
+        """
+            遍历本地目录
+        :param src:
+        :return: 相对目录, (本地文件, 相对路径), 文件总字节
+        """
+        dirs, files, total = [], [], 0
+        for _ in sorted(src.rglob('*')):
+            rel = PurePosixPath(_.relative_to(src).as_posix())
+            if _.is_dir():
+                dirs.append(rel)
+            elif _.is_file():
+                files.append((_, rel))
+                total += _.stat().st_size
+        return dirs, files, total
+
+    @property
+    def has_tar(self) -> bool:
+        """
+            设备是否支持 tar (toybox 自带)
+        :return:
+        """
+        if self._has_tar is None:
+            try:
+                self._has_tar = self.adb_device.shell('command -v tar', timeout=3) != ''
+            except AdbError:
+                self._has_tar = False
+        return self._has_tar
+
+    def push_dir(
+            self, src: Path, dest: PurePosixPath = None, to_default_path: bool = True,
+            bulk: bool = True,
+            progress_callback: Callable[[int, int], None] | None = None,
+            cancel_event: threading.Event | None = None,
+            **kwargs
+    ) -> bool:
         """
             上传路径
+            2026-10-19 3.3.0 默认打包为 tar 流经单一 exec 连接传输并于设备解包，失败时回退逐文件上传
         :param src:
         :param dest:
         :param to_default_path:
-        :param kwargs:
-        :return:
+        :param bulk: 使用 tar 流
+        :param progress_callback: (已传输字节, 总字节)
+        :param cancel_event: set 后中止传输
+        :param kwargs: mode 等，传递至 push
+        :return: 是否完成
         """
 
         dest = dest or (self.path_push if to_default_path else self.path_cur)
 
-        for _ in src.iterdir():
+        self.invalidate()
+        return self._push_entries(src, dest, *self._walk(src), bulk, progress_callback, cancel_event, **kwargs)
 
-            if _.is_dir():
-                self.adb_device.shell(['mkdir', (dest / _.name).__str__()])
-                logger.info(f"mkdir {dest / _.name}")
-                self.push_dir(_, dest / _.name, **kwargs)
+    def _push_entries(
+            self, src: Path, dest: PurePosixPath,
+            dirs: List[PurePosixPath], files: List[Tuple[Path, PurePosixPath]], total: int,
+            bulk: bool = True,
+            progress_callback: Callable[[int, int], None] | None = None,
+            cancel_event: threading.Event | None = None,
+            **kwargs
+    ) -> bool:
+        """
+            上传指定目录及文件，tar 失败时回退逐文件
+        :return: 是否完成
+        """
+        if bulk and self.has_tar:
+            try:
+                return self.push_dir_tar(src, dest, dirs, files, total, progress_callback, cancel_event, **kwargs)
+            except (AdbError, OSError, tarfile.TarError, RuntimeError) as e:
+                logger.warning(f"push_dir tar {src} Failed => {e}, Fallback To Files")
 
-            elif _.is_file():
-                self.push(_, dest, **kwargs)
+        return self.push_dir_files(src, dest, dirs, files, total, progress_callback, cancel_event, **kwargs)
+
+    def remote_md5s(self, dest: PurePosixPath) -> Dict[PurePosixPath, str]:
+        """
+            单次 shell 计算设备目录下全部文件 md5
+        :param dest:
+        :return: {相对路径: md5}，目录不存在时为空
+        """
+        output = self.adb_device.shell(
+            f"cd {shlex.quote(dest.__str__())} 2>/dev/null && find . -type f -print0 | xargs -0 md5sum",
+            timeout=None
+        )
+        md5s = {}
+        for line in output.splitlines():
+            md5, _, path = line.partition('  ')
+            if len(md5) == 32 and path:
+                md5s[PurePosixPath(path)] = md5
+        return md5s
+
+    def local_md5s(self, src: Path, files: List[Tuple[Path, PurePosixPath]]) -> Dict[PurePosixPath, str]:
+        """
+            本地文件 md5，按 (size, mtime_ns) 缓存至 KVManager
+        :param src:
+        :param files:
+        :return: {相对路径: md5}
+        """
+        key = f"md5_{src.resolve()}"
+        cache = self.kv_hash.get(key, {})
+
+        md5s, fresh = {}, {}
+        for path, rel in files:
+            st = path.stat()
+            cached = cache.get(rel.__str__())
+            if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+                md5 = cached[2]
+            else:
+                md5 = TransferManager.local_md5(path)
+            md5s[rel] = md5
+            fresh[rel.__str__()] = (st.st_size, st.st_mtime_ns, md5)
+
+        if fresh != cache:
+            self.kv_hash.set(key, fresh)
+        return md5s
+
+    def sync_dir(
+            self, src: Path, dest: PurePosixPath = None, to_default_path: bool = True,
+            delete: bool = False, bulk: bool = True,
+            progress_callback: Callable[[int, int], None] | None = None,
+            cancel_event: threading.Event | None = None,
+            **kwargs
+    ) -> 'SyncReport':
+        """
+            增量同步本地目录至设备
+            比较本地缓存 md5 与设备端单次批量 md5sum，仅上传变化文件
+        :param src:
+        :param dest:
+        :param to_default_path:
+        :param delete: 删除设备上本地不存在的文件
+        :param bulk: 使用 tar 流
+        :param progress_callback: (已传输字节, 总字节)
+        :param cancel_event:
+        :param kwargs: mode 等
+        :return:
+        """
+        t = time.perf_counter()
+        dest = dest or (self.path_push if to_default_path else self.path_cur)
+
+        dirs, files, total = self._walk(src)
+        self.invalidate()
+
+        local = self.local_md5s(src, files)
+        remote = self.remote_md5s(dest)
+
+        changed = [(path, rel) for path, rel in files if remote.get(rel) != local[rel]]
+        bytes_sent = sum(path.stat().st_size for path, _ in changed)
+
+        completed = True
+        if changed:
+            completed = self._push_entries(
+                src, dest, dirs, changed, bytes_sent, bulk, progress_callback, cancel_event, **kwargs
+            )
+
+        deleted = []
+        if delete and completed:
+            deleted = [_ for _ in remote if _ not in local]
+            for i in range(0, len(deleted), self.MKDIR_BATCH):
+                self.adb_device.shell(
+                    f"cd {shlex.quote(dest.__str__())} && rm -f "
+                    f"{' '.join(shlex.quote(_.__str__()) for _ in deleted[i:i + self.MKDIR_BATCH])}"
+                )
+
+        report = SyncReport(
+            files_total=len(files), files_changed=len(changed), files_deleted=len(deleted),
+            bytes_sent=bytes_sent, bytes_saved=total - bytes_sent,
+            completed=completed, seconds=time.perf_counter() - t
+        )
+        logger.info(f"sync {src} to {dest} => {report}")
+        return report
+
+    def push_dir_tar(
+            self, src: Path, dest: PurePosixPath,
+            dirs: List[PurePosixPath], files: List[Tuple[Path, PurePosixPath]], total: int,
+            progress_callback: Callable[[int, int], None] | None = None,
+            cancel_event: threading.Event | None = None,
+            mode: int = 0o755,
+            **kwargs
+    ) -> bool:
+        """
+            tar 流上传
+            本地以流模式写 tar 至 exec 连接，发送完毕后半关闭写端，设备端 tar 读到结束后退出并回传返回码
+        :return: 是否完成，取消时返回 False
+        :raises RuntimeError: 设备端 tar 返回非 0
+        :raises AdbTimeout: TAR_RC_TIMEOUT 内未返回，此后不再使用 tar
+        """
+        # 归档大小估算: 每项 512 header + 数据按 512 对齐
+        total_archive = sum(512 + (_[0].stat().st_size + 511) // 512 * 512 for _ in files) + 512 * len(dirs) + 1024
+
+        cmd = (
+            f"mkdir -p {shlex.quote(dest.__str__())} && "
+            f"tar -xf - -C {shlex.quote(dest.__str__())}; echo {self.TAR_RC_MARK}$?"
+        )
+
+        t = time.perf_counter()
+        conn = self.adb_device.open_transport(timeout=None)
+        try:
+            conn.send_command(f"exec:sh -c {shlex.quote(cmd)}")
+            conn.check_okay()
+
+            sink = _TarSink(conn.conn, total_archive, progress_callback, cancel_event)
+
+            def _filter(tarinfo: tarfile.TarInfo) -> tarfile.TarInfo:
+                tarinfo.mode = mode
+                tarinfo.uid = tarinfo.gid = 0
+                tarinfo.uname = tarinfo.gname = ''
+                return tarinfo
+
+            try:
+                with tarfile.open(fileobj=sink, mode='w|', format=tarfile.GNU_FORMAT) as tf:
+                    for rel in dirs:
+                        tf.add(src / rel, arcname=rel.__str__(), recursive=False, filter=_filter)
+                    for path, rel in files:
+                        tf.add(path, arcname=rel.__str__(), recursive=False, filter=_filter)
+                sink.flush()
+            except InterruptedError:
+                logger.warning(f"push_dir {src} Cancelled, {sink.sent} / {total_archive} bytes sent")
+                return False
+
+            # 半关闭写端，避免设备端 tar 读至 EOF 才退出时永久阻塞
+            try:
+                conn.conn.shutdown(socket.SHUT_WR)
+            except OSError:
+                ...
+
+            conn.conn.settimeout(self.TAR_RC_TIMEOUT)
+            try:
+                output = conn.read_until_close()
+            except AdbTimeout:
+                self._has_tar = False
+                raise
+
+        finally:
+            conn.close()
+
+        if f"{self.TAR_RC_MARK}0" not in output:
+            raise RuntimeError(output.strip()[-200:])
+
+        if progress_callback:
+            progress_callback(total_archive, total_archive)
+
+        logger.info(
+            f"pushed {src} to {dest} | {len(files)} files {total / 1024 / 1024:.1f} MB "
+            f"in {time.perf_counter() - t:.2f}s by tar"
+        )
+        return True
+
+    def push_dir_files(
+            self, src: Path, dest: PurePosixPath,
+            dirs: List[PurePosixPath], files: List[Tuple[Path, PurePosixPath]], total: int,
+            progress_callback: Callable[[int, int], None] | None = None,
+            cancel_event: threading.Event | None = None,
+            mode: int = 0o755,
+            **kwargs
+    ) -> bool:
+        """
+            逐文件上传
+            目录于单次 shell 中批量 mkdir -p
+        :return: 是否完成，取消时返回 False
+        """
+        t = time.perf_counter()
+
+        paths = [shlex.quote((dest / _).__str__()) for _ in [PurePosixPath('.'), *dirs]]
+        for i in range(0, len(paths), self.MKDIR_BATCH):
+            self.adb_device.shell(f"mkdir -p {' '.join(paths[i:i + self.MKDIR_BATCH])}")
+
+        sent = 0
+        for path, rel in files:
+            if cancel_event is not None and cancel_event.is_set():
+                logger.warning(f"push_dir {src} Cancelled, {sent} / {total} bytes sent")
+                return False
+
+            self.adb_device.sync.push(path, (dest / rel).__str__(), mode=mode)
+            sent += path.stat().st_size
+            if progress_callback:
+                progress_callback(sent, total)
+
+        logger.info(
+            f"pushed {src} to {dest} | {len(files)} files {total / 1024 / 1024:.1f} MB "
+            f"in {time.perf_counter() - t:.2f}s by files"
+        )
+        return True
 
     def pull(self, *args, **kwargs):
         return self.adb_device.sync.pull(*args, **kwargs)
 
-    def pull_file(self, file_name: str, dest: Path):
+    @property
+    def transfer(self) -> TransferManager:
+        """
+            拉取管理器，按需创建
+        :return:
+        """
+        if self._transfer is None:
+            self._transfer = TransferManager(self.adb_device)
+        return self._transfer
+
+    def pull_file(
+            self, file_name: str, dest: Path, progress_callback: Callable[[Transfer], None] | None = None
+    ) -> Future:
         """
             拉取当前目录下文件
+            2026-10-19 3.3.0 改由 TransferManager 后台拉取，支持续传及校验
         :param file_name:
-        :param dest:
-        :return:
+        :param dest: 本地目录
+        :param progress_callback:
+        :return: Future[Transfer]
         """
-        return self.adb_device.sync.pull((self.path_cur / file_name).__str__(), dest / file_name)
+        return self.transfer.pull(self.path_cur / file_name, dest / file_name, progress_callback)
 
-    def pull_dir(self, *args, **kwargs):
-        return self.adb_device.sync.pull_dir(*args, **kwargs)
+    def pull_dir(
+            self, src: PurePosixPath | str, dest: Path, progress_callback: Callable[[Transfer], None] | None = None
+    ) -> List[Future]:
+        """
+            拉取目录
+        :param src: 设备目录
+        :param dest: 本地目录
+        :param progress_callback:
+        :return: [Future[Transfer]]
+        """
+        return self.transfer.pull_dir(src, dest, progress_callback)
+
+    def close(self):
+        """
+            取消未完成传输
+        :return:
+        """
+        if self._transfer is not None:
+            self._transfer.shutdown()
+            self._transfer = None
 
     def push_clipboard_to_device(self, path: PurePosixPath = None):
         """
@@ -245,8 +946,6 @@ class FileManager:
             for _ in im:
                 p = Path(_)
                 if p.is_dir():
-                    self.adb_device.shell(['mkdir', (path_push / p.name).__str__()])
-                    logger.info(f"mkdir {(path_push / p.name).__str__()}")
                     self.push_dir(p, path_push / p.name)
 
                 elif p.is_file():
@@ -282,87 +981,52 @@ class AdvDevice:
         return _
 
     @staticmethod
-    def analysis_device(dev: AdbDevice) -> Tuple[DeviceInfo, dict]:
+    def parse_getprop(dev: AdbDevice) -> PropStore:
         """
-            通过getprop 快速读取并解析设备信息
+            读取 getprop 并解析
+        :param dev:
+        :return:
         """
+        return PropStore.parse(dev.shell('getprop', timeout=1))
 
-        u2d = uiautomator2.connect(dev.serial)
-
-        prop_d = {}
-
-        for _ in dev.shell('getprop', timeout=1).split('\n'):
-            _ = _.replace('\r', '')
-            if _[0] != '[' or _[-1] != ']':
-                continue
-            try:
-                k, v = _.split(': ')
-            except Exception as e:
-                continue
-
-            cmd = "prop_d"
-            for _ in k[1:-1].split('.'):
-                cmd += f".setdefault('{_}', {{}})"
-
-            cmd = cmd[:-3] + "'" + v[1:-1] + "')"
-
-            try:
-                exec(cmd)
-            except:
-                pass
-
-        try:
-            serial_no = prop_d['ro']['serialno']
-        except:
-            serial_no = dev.serial
+    @staticmethod
+    def analysis_device(dev: AdbDevice) -> Tuple[DeviceInfo, PropStore]:
+        """
+            通过getprop 快速读取并解析设备信息
+        """
 
-        try:
-            brand = prop_d['ro']['product']['brand']
-        except:
-            brand = ''
+        props = AdvDevice.parse_getprop(dev)
 
-        try:
-            model = prop_d['ro']['product']['model']
-        except:
-            model = u2d.info['productName']
+        serial_no = props.get('ro.serialno') or dev.serial
+        brand = props.get('ro.product.brand', '')
+        model = props.get('ro.product.model', '')
 
-        try:
-            sdk = int(prop_d['ro']['build']['version']['sdk'])
-        except:
-            sdk = u2d.info['sdkInt']
+        # 无法获取时使用 DeviceInfo 默认值
+        sdk = props.get_int('ro.build.version.sdk', DeviceInfo._field_defaults['sdk'])
 
+        release = props.get('ro.build.version.release', '')
         try:
-            release = prop_d['ro']['build']['version']['release']
-        except Exception:
-            release = None
-
-        if release is None or release == '':
-            try:
-                release = u2d.device_info['version']
-            except:
-                release = 14
-        elif '.' in release:
             release = int(release.split('.')[0])
-        else:
-            release = int(release)
+        except ValueError:
+            release = DeviceInfo._field_defaults['release']
 
-        return DeviceInfo(serial_no=serial_no, brand=brand, model=model, sdk=sdk, release=release), prop_d
+        return DeviceInfo(serial_no=serial_no, brand=brand, model=model, sdk=sdk, release=release), props
 
     def __init__(
             self, adb_device: AdbDevice,
             device_info: DeviceInfo = None,
-            prop_d: dict = None,
+            props: PropStore = None,
             *args, **kwargs
     ):
         """
             Device Controller
         :param adb_device:
         :param device_info:
-        :param prop_d:
+        :param props: 为 None 时按需加载
         :param args:
         :param kwargs:
         """
-        self.info, self.prop_d = self.analysis_device(adb_device) if device_info is None else (device_info, prop_d)
+        self.info, self._props = self.analysis_device(adb_device) if device_info is None else (device_info, props)
         self.serial_no = self.info.serial_no
 
         self.kvm = KVManager(f"dev_{self.serial_no.replace('.', '_').replace(':', '__')}")
@@ -377,18 +1041,63 @@ class AdvDevice:
         # 2024-09-10 1.5.9 Me2sY 新增文件管理器
         self.file_manager = FileManager(adb_device)
 
-        # 2024-09-13 1.5.11 Me2sY 引入 uiautomator2
-        self.u2d = uiautomator2.connect(self.adb_dev.serial)
+        # 2026-10-19 3.3.0 Me2sY uiautomator2 按需加载，屏幕信息改用 DeviceQuery
+        self._u2d = None
 
-        # u2使用jsonrpc获取设备信息延迟低，极少出现卡加载情况
-        info = self.u2d.info
-        if info['displayRotation'] % 2 == 0:
-            self.coord_device_v = Coordinate(width=info['displayWidth'], height=info['displayHeight'])
-        else:
-            self.coord_device_v = Coordinate(width=info['displayHeight'], height=info['displayWidth'])
+        try:
+            display = self.query.display()
+            self.coord_device_v = Coordinate(display.width, display.height)
+        except (AdbError, ValueError) as e:
+            logger.warning(f"{self.info} DeviceQuery Failed, Use uiautomator2 => {e}")
+            info = self.u2d.info
+            if info['displayRotation'] % 2 == 0:
+                self.coord_device_v = Coordinate(width=info['displayWidth'], height=info['displayHeight'])
+            else:
+                self.coord_device_v = Coordinate(width=info['displayHeight'], height=info['displayWidth'])
 
         self.coord_device_h = self.coord_device_v.rotate()
 
+    @property
+    def query(self) -> DeviceQuery:
+        """
+            轻量设备查询
+        :return:
+        """
+        return DeviceQuery(self.adb_dev)
+
+    @property
+    def u2d(self):
+        """
+            uiautomator2 Device，首次访问时连接
+            需安装 uiautomator2: pip install mysc[u2]
+        :return:
+        """
+        if self._u2d is None:
+            try:
+                import uiautomator2
+            except ImportError:
+                raise ImportError('uiautomator2 is not installed. pip install mysc[u2]')
+            self._u2d = uiautomator2.connect(self.adb_dev.serial)
+        return self._u2d
+
+    @property
+    def props(self) -> PropStore:
+        """
+            getprop 解析结果，缓存加载的设备首次访问时读取
+        :return:
+        """
+        if self._props is None:
+            self._props = self.parse_getprop(self.adb_dev)
+        return self._props
+
+    @property
+    def prop_d(self) -> dict:
+        """
+            嵌套 dict 形式，兼容旧接口，建议使用 props
+        :return:
+        """
+        return self.props.nested()
+
     def coord_device(self, rotation: int) -> Coordinate:
         """
             获取设备实际尺寸
@@ -407,19 +1116,27 @@ class AdvDevice:
             在当前device rotation 已知情况下，建议使用 coord_device(rotation) 获取
         :return:
         """
-        return self.coord_device(self.u2d.info['displayRotation'] % 2)
+        return self.coord_device(self.query.rotation())
 
     def __repr__(self):
         return f"AdvDevice > {self.info}"
 
     def stop(self):
-        ...
+        self.file_manager.close()
 
     @property
     def adb_dev(self) -> AdbDevice:
         """
             获取 ADB Dev
+            DeviceMonitor 运行时直接查询设备状态，否则 echo 探测
         """
+        monitor = DeviceFactory.MONITOR
+        if monitor.is_running and monitor.ready.is_set():
+            for dev in (self.usb_dev, self.net_dev):
+                if dev is not None and monitor.is_online(dev.serial):
+                    return dev
+            raise RuntimeError(f'{self.usb_dev} {self.net_dev} Device not connected')
+
         if self.adb_dev_ready:
             return self.adb_dev_ready
 
@@ -448,7 +1165,10 @@ class AdvDevice:
     def reconnected():
         """
             重连至ADB Device
+            DeviceMonitor 运行时设备状态已实时更新，无需重新加载
         """
+        if DeviceFactory.MONITOR.is_running:
+            return
         DeviceFactory.load_devices(load_history=False, save_history=False)
 
     @property
@@ -546,17 +1266,17 @@ class AdvDevice:
             去除Rotation，降低延迟
 
             2024-09-18 1.6.0 Me2sY  改用 uiautomator2.info
+            2026-10-19 3.3.0 Me2sY  改用 DeviceQuery
         :return:
         """
-        info = self.u2d.info
-        return Coordinate(info['displayWidth'], info['displayHeight'])
+        return self.coord_device(self.query.rotation())
 
     def get_rotation(self) -> int:
         """
             获取当前设备方向
         :return:
         """
-        return ROTATION_HORIZONTAL if self.u2d.info['displayRotation'] % 2 == 1 else ROTATION_VERTICAL
+        return ROTATION_HORIZONTAL if self.query.rotation() % 2 == 1 else ROTATION_VERTICAL
 
 
 class DeviceFactory:
@@ -567,6 +1287,20 @@ class DeviceFactory:
 
     DEVICE_CONTROLLERS = {}
 
+    DISCOVERY_WORKERS = 8           # 并行解析设备线程数
+    INFO_CACHE_KEY = 'device_info_cache'
+    INFO_CACHE_TTL = 24 * 3600      # DeviceInfo 缓存有效期，秒
+    REFRESH_INTERVAL = 5            # device() 后台刷新最小间隔，秒
+
+    AUTO_MONITOR = True             # load_devices 后启动 DeviceMonitor
+    MONITOR = DeviceMonitor()
+
+    # 仅保护 DEVICE_CONTROLLERS 及 info_cache 写入，不可在持有时等待线程池
+    _controllers_lock = threading.Lock()
+    _refresh_thread: threading.Thread | None = None
+    _last_loaded = 0
+    _executor: ThreadPoolExecutor | None = None
+
     @classmethod
     def load_history(cls) -> dict:
         """
@@ -581,8 +1315,152 @@ class DeviceFactory:
         except AdbError as e:
             logger.warning(f"Connecting to {addr} failed! => {e}")
 
+    @classmethod
+    def load_info_cache(cls) -> dict:
+        """
+            加载 DeviceInfo 缓存，剔除过期记录
+        :return: {adb_serial: {'info': dict, 'ts': float}}
+        """
+        now = time.time()
+        return {
+            serial: record for serial, record in kv_global.get(cls.INFO_CACHE_KEY, {}).items()
+            if now - record.get('ts', 0) < cls.INFO_CACHE_TTL
+        }
+
+    @classmethod
+    def clear_info_cache(cls):
+        """
+            清除 DeviceInfo 缓存，如设备系统升级后
+        :return:
+        """
+        kv_global.set(cls.INFO_CACHE_KEY, {})
+
+    @staticmethod
+    def _cache_valid(adb_dev: AdbDevice, record: dict) -> bool:
+        """
+            WLAN serial 为 ip:port，地址可能被其他设备复用，命中缓存前核对 ro.serialno
+        :param adb_dev:
+        :param record:
+        :return:
+        """
+        serial_no = record['info'].get('serial_no')
+        if serial_no == adb_dev.serial:
+            return True
+        try:
+            return adb_dev.shell('getprop ro.serialno', timeout=1).strip() == serial_no
+        except Exception:
+            return False
+
+    @classmethod
+    def _load_device(cls, adb_dev: AdbDevice, info_cache: dict) -> DeviceInfo:
+        """
+            解析并创建/更新单个设备
+        :param adb_dev:
+        :param info_cache: 命中时跳过 getprop 解析，未命中时写入
+        :return:
+        """
+        with cls._controllers_lock:
+            record = info_cache.get(adb_dev.serial)
+
+        if record is not None and not cls._cache_valid(adb_dev, record):
+            record = None
+
+        if record is None:
+            info, props = AdvDevice.analysis_device(adb_dev)
+            with cls._controllers_lock:
+                info_cache[adb_dev.serial] = {'info': info._asdict(), 'ts': time.time()}
+        else:
+            info, props = DeviceInfo(**record['info']), None
+
+        # 同一设备 USB/WLAN 可能并行解析，创建过程加锁
+        with cls._controllers_lock:
+            if info.serial_no in cls.DEVICE_CONTROLLERS:
+                _dc = cls.DEVICE_CONTROLLERS[info.serial_no]
+
+                if info.serial_no == adb_dev.serial:    # USB Device
+                    _dc.usb_dev = adb_dev
+                else:                                   # WLAN ADB
+                    _dc.net_dev = adb_dev
+                return info
+
+        dc = AdvDevice(adb_dev, device_info=info, props=props)
+
+        with cls._controllers_lock:
+            _dc = cls.DEVICE_CONTROLLERS.setdefault(info.serial_no, dc)
+            if _dc is not dc:
+                if info.serial_no == adb_dev.serial:
+                    _dc.usb_dev = adb_dev
+                else:
+                    _dc.net_dev = adb_dev
+        return info
+
     @classmethod
     def load_devices(cls, load_history: bool = True, save_history: bool = True):
+        """
+            加载 ADB Device
+            设备并行解析，DeviceInfo 命中缓存时跳过 getprop
+        """
+        cls._load_devices(load_history, save_history)
+
+        if cls.AUTO_MONITOR:
+            cls.start_monitor()
+
+    @classmethod
+    def load_device(cls, serial: str) -> AdvDevice | None:
+        """
+            加载单个设备
+        :param serial: adb serial
+        :return:
+        """
+        info_cache = cls.load_info_cache()
+        cached = set(info_cache.keys())
+
+        try:
+            info = cls._load_device(adb.device(serial), info_cache)
+        except Exception as e:
+            info_cache.pop(serial, None)
+            logger.error(f"Load {serial} Error => {e}")
+            return None
+        finally:
+            if set(info_cache.keys()) != cached:
+                kv_global.set(cls.INFO_CACHE_KEY, info_cache)
+
+        return cls.DEVICE_CONTROLLERS.get(info.serial_no)
+
+    @classmethod
+    def start_monitor(cls) -> DeviceMonitor:
+        """
+            启动热插拔监听，新设备增量加载
+        :return:
+        """
+        if not cls.MONITOR.is_running:
+            cls.MONITOR.register(cls._on_device_event)
+            cls.MONITOR.start()
+        return cls.MONITOR
+
+    @classmethod
+    def stop_monitor(cls):
+        cls.MONITOR.unregister(cls._on_device_event)
+        cls.MONITOR.stop()
+
+    @classmethod
+    def _on_device_event(cls, event: DeviceEvent):
+        """
+            设备上线时后台加载，离线时清除可用连接缓存
+        :param event:
+        :return:
+        """
+        if event.present and event.status == DeviceMonitor.STATUS_DEVICE:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=cls.DISCOVERY_WORKERS, thread_name_prefix='load_device')
+            cls._executor.submit(cls.load_device, event.serial)
+        else:
+            for dc in list(cls.DEVICE_CONTROLLERS.values()):
+                if dc.adb_dev_ready is not None and dc.adb_dev_ready.serial == event.serial:
+                    dc.adb_dev_ready = None
+
+    @classmethod
+    def _load_devices(cls, load_history: bool = True, save_history: bool = True):
         """
             加载 ADB Device
         """
@@ -609,22 +1487,28 @@ class DeviceFactory:
             if dc_info['addr']:
                 threading.Thread(target=cls._connect_device, args=(dc_info['addr'], 1)).start()
 
-        for adb_dev in adb.device_list():
-            try:
-                # 解析设备信息
-                info, prop_d = AdvDevice.analysis_device(adb_dev)
+        info_cache = cls.load_info_cache()
+        cached = set(info_cache.keys())
 
-                if info.serial_no in cls.DEVICE_CONTROLLERS:
-                    _dc = cls.DEVICE_CONTROLLERS[info.serial_no]
+        adb_devs = adb.device_list()
+        if adb_devs:
+            with ThreadPoolExecutor(
+                    max_workers=min(cls.DISCOVERY_WORKERS, len(adb_devs)), thread_name_prefix='load_device'
+            ) as executor:
+                futures = {executor.submit(cls._load_device, _, info_cache): _ for _ in adb_devs}
 
-                    if info.serial_no == adb_dev.serial:    # USB Device
-                        _dc.usb_dev = adb_dev
-                    else:                                   # WLAN ADB
-                        _dc.net_dev = adb_dev
-                else:
-                    cls.DEVICE_CONTROLLERS[info.serial_no] = AdvDevice(adb_dev, device_info=info, prop_d=prop_d)
-            except AdbError as e:
-                logger.error(e)
+            for future, adb_dev in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    # 解析失败时清除缓存，下次重新解析
+                    info_cache.pop(adb_dev.serial, None)
+                    logger.error(f"Load {adb_dev.serial} Error => {e}")
+
+        if set(info_cache.keys()) != cached:
+            kv_global.set(cls.INFO_CACHE_KEY, info_cache)
+
+        cls._last_loaded = time.time()
 
         if save_history:
             _loaded = {
@@ -658,24 +1542,58 @@ class DeviceFactory:
             logger.error(f'Failed to connect to {addr} => {e}')
             return None
 
-        cls.load_devices()
+        # 2026-10-19 3.3.0 Me2sY  仅加载该设备，并记录地址用于下次自动重连
+        dc = cls.load_device(addr)
+        if dc is None or dc.net_dev is None or dc.net_dev.serial != addr:
+            return None
 
-        for _ in cls.DEVICE_CONTROLLERS.values():
-            if _.net_dev and _.net_dev.serial == addr:
-                return _
+        history = cls.load_history()
+        history[dc.serial_no] = {
+            **dc.info._asdict(), 'addr': addr, 'last_connected_time': datetime.datetime.now().timestamp()
+        }
+        kv_global.set('load_history', history)
 
-        return None
+        return dc
+
+    @classmethod
+    def refresh_background(cls) -> threading.Thread | None:
+        """
+            后台刷新设备，刷新中或间隔过短时忽略
+        :return:
+        """
+        if cls._refresh_thread and cls._refresh_thread.is_alive():
+            return None
+
+        if time.time() - cls._last_loaded < cls.REFRESH_INTERVAL:
+            return None
+
+        def _refresh():
+            try:
+                cls.load_devices(save_history=False)
+            except Exception as e:
+                logger.error(f"Refresh Devices Error => {e}")
+
+        cls._refresh_thread = threading.Thread(target=_refresh, daemon=True)
+        cls._refresh_thread.start()
+        return cls._refresh_thread
 
     @classmethod
     def device(cls, serial_no: str = None, addr: str = None) -> AdvDevice | None:
         """
             获取 DeviceController
+            优先返回已加载设备，DeviceMonitor 未运行时后台刷新，未找到时同步加载
         :param serial_no:
         :param addr:
         :return:
         """
 
-        cls.load_devices()
+        if serial_no is None and addr:
+            return cls.connect(addr=addr)
+
+        if len(cls.DEVICE_CONTROLLERS) == 0 or (serial_no and serial_no not in cls.DEVICE_CONTROLLERS):
+            cls.load_devices()
+        elif not cls.MONITOR.is_running:
+            cls.refresh_background()
 
         if serial_no:
             if serial_no in cls.DEVICE_CONTROLLERS:
@@ -684,9 +1602,6 @@ class DeviceFactory:
                 logger.error(f'Serial >{serial_no}< Device Not Found!')
                 return None
 
-        if addr:
-            return cls.connect(addr=addr)
-
         if len(cls.DEVICE_CONTROLLERS) == 0:
             logger.error('No Device Controllers Found!')
             return None
@@ -759,3 +1674,49 @@ class DeviceFactory:
                 return True
         logger.warning(f"Disconnected {device_serial} Failed!")
         return False
+
+
+if __name__ == '__main__':
+    """
+        DEMO Here
+        push_dir: 5000 个小文件，tar 流 vs 逐文件
+    """
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for i in range(5000):
+            p = root / f"d{i // 100:02d}" / f"f{i:04d}.txt"
+            p.parent.mkdir(exist_ok=True)
+            p.write_bytes(b'x' * (256 + i % 1024))
+
+        devices = adb.device_list()
+        if not devices:
+            import io
+            _fm = FileManager.__new__(FileManager)
+            _dirs, _files, _total = _fm._walk(root)
+            _sink = _TarSink(io.BytesIO(), 0)
+            _sink.sock.sendall = _sink.sock.write
+            t = time.perf_counter()
+            with tarfile.open(fileobj=_sink, mode='w|', format=tarfile.GNU_FORMAT) as tf:
+                for _path, _rel in _files:
+                    tf.add(_path, arcname=_rel.__str__(), recursive=False)
+            _sink.flush()
+            print(f"No Device. Local tar stream {len(_files)} files {_sink.sent / 1024:.0f} KB "
+                  f"in {time.perf_counter() - t:.2f}s")
+        else:
+            fm = FileManager(devices[0])
+            for _bulk in [True, False]:
+                _dest = fm.path_push / f"bench_{'tar' if _bulk else 'files'}"
+                t = time.perf_counter()
+                ok = fm.push_dir(root, _dest, bulk=_bulk)
+                print(f"{'tar' if _bulk else 'files'}: {ok} {time.perf_counter() - t:.2f}s")
+
+            # sync_dir: 修改 1% 文件后再次同步
+            _dest = fm.path_push / 'bench_tar'
+            for i in range(0, 5000, 100):
+                (root / f"d{i // 100:02d}" / f"f{i:04d}.txt").write_bytes(b'y' * 300)
+            print(fm.sync_dir(root, _dest, delete=True))
+            print(fm.sync_dir(root, _dest, delete=True))
+
+            fm.adb_device.shell(f"rm -rf {fm.path_push / 'bench_tar'} {fm.path_push / 'bench_files'}")
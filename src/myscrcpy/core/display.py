@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+    Display
+    ~~~~~~~~~~~~~~~~~~
+    设备屏幕状态
+    方向由 VideoAdapter 解码帧尺寸变化推断，无 Video 时通过 DeviceQuery 单次查询
+    状态变化时通知订阅者，ControlAdapter / TouchProxy 等无需轮询
+
+    Log:
+        2026-10-19 3.3.0 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '3.3.0'
+
+__all__ = [
+    'DisplayState'
+]
+
+import threading
+from typing import Callable, Set
+
+from adbutils import AdbDevice, AdbError
+from loguru import logger
+
+from myscrcpy.core.device import DeviceQuery
+from myscrcpy.core.events import ServerEvent
+from myscrcpy.utils import Coordinate, ROTATION_VERTICAL, ROTATION_HORIZONTAL
+
+
+class DisplayState:
+    """
+        屏幕状态
+        coord_v     设备竖直方向全尺寸
+        rotation    ROTATION_VERTICAL / ROTATION_HORIZONTAL
+        frame       最新视频帧尺寸，仅由解码帧更新
+        server_size Server 日志报告的设备/显示尺寸，非帧尺寸(max_size 缩放前)
+    """
+
+    # 帧与设备尺寸宽高比差异超过该值时，视为分辨率变化(折叠屏/wm size 等)，重新查询设备尺寸
+    ASPECT_TOLERANCE = 0.02
+
+    def __init__(self, adb_device: AdbDevice | None = None):
+        """
+            屏幕状态
+        :param adb_device: 为 None 时无法主动查询，仅由视频帧及事件更新
+        """
+        self.adb_device = adb_device
+
+        self.coord_v: Coordinate | None = None
+        self.rotation: int = ROTATION_VERTICAL
+        self.frame: Coordinate | None = None
+        self.server_size: Coordinate | None = None
+
+        self.change_n = 0
+
+        self.callbacks: Set[Callable[['DisplayState'], None]] = set()
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def __repr__(self):
+        return f"DisplayState > {self.coord_v} rotation={self.rotation} frame={self.frame}"
+
+    @property
+    def coordinate(self) -> Coordinate | None:
+        """
+            当前方向设备尺寸
+        :return:
+        """
+        if self.coord_v is None:
+            return None
+        return self.coord_v.rotate() if self.rotation == ROTATION_HORIZONTAL else self.coord_v
+
+    def register(self, callback: Callable[['DisplayState'], None]):
+        """
+            注册状态变化回调
+            回调于解码/事件线程中执行，应尽快返回
+        :param callback:
+        :return:
+        """
+        self.callbacks.add(callback)
+
+    def unregister(self, callback: Callable[['DisplayState'], None]):
+        self.callbacks.discard(callback)
+
+    def notify(self):
+        self.change_n += 1
+        for callback in tuple(self.callbacks):
+            try:
+                callback(self)
+            except Exception as e:
+                logger.error(f"DisplayState Callback {callback} Error => {e}")
+
+    def _aspect_changed(self, coord: Coordinate) -> bool:
+        """
+            与设备尺寸宽高比是否不同
+        :param coord:
+        :return:
+        """
+        if self.coord_v is None:
+            return False
+        return abs(
+            coord.min_size / coord.max_size - self.coord_v.min_size / self.coord_v.max_size
+        ) > self.ASPECT_TOLERANCE
+
+    def update_frame(self, width: int, height: int) -> bool:
+        """
+            视频帧尺寸更新，每帧调用，尺寸未变时直接返回
+        :param width:
+        :param height:
+        :return: 状态是否变化
+        """
+        frame = self.frame
+        if frame is not None and frame.width == width and frame.height == height:
+            return False
+
+        self.frame = Coordinate(width, height)
+
+        if self._aspect_changed(self.frame):
+            logger.info(f"Display Aspect Changed => {self.frame}")
+            self.coord_v = None
+            self.refresh_background()
+
+        return self.set_rotation(self.frame.rotation, force=frame is None)
+
+    def set_rotation(self, rotation: int, force: bool = False) -> bool:
+        """
+            更新方向
+        :param rotation: 0~3 或 ROTATION_VERTICAL / ROTATION_HORIZONTAL
+        :param force: 未变化时也通知
+        :return: 是否通知
+        """
+        rotation = ROTATION_HORIZONTAL if rotation % 2 == 1 else ROTATION_VERTICAL
+        if rotation == self.rotation and not force:
+            return False
+        self.rotation = rotation
+        self.notify()
+        return True
+
+    def set_size(self, coord: Coordinate):
+        """
+            更新设备尺寸
+        :param coord: 任意方向
+        :return:
+        """
+        coord_v = coord if coord.rotation == ROTATION_VERTICAL else coord.rotate()
+        if coord_v != self.coord_v:
+            self.coord_v = coord_v
+            self.notify()
+
+    def refresh(self, adb_device: AdbDevice | None = None) -> bool:
+        """
+            通过 DeviceQuery 单次查询设备尺寸及方向
+            有视频帧时方向以视频帧为准
+        :param adb_device:
+        :return:
+        """
+        adb_device = adb_device or self.adb_device
+        if adb_device is None:
+            return False
+
+        try:
+            display = DeviceQuery(adb_device).display()
+        except (AdbError, ValueError) as e:
+            logger.warning(f"DisplayState Refresh Failed => {e}")
+            return False
+
+        coord_v = Coordinate(display.width, display.height)
+        coord_v = coord_v if coord_v.rotation == ROTATION_VERTICAL else coord_v.rotate()
+        rotation = display.coordinate.rotation if self.frame is None else self.frame.rotation
+
+        if coord_v != self.coord_v or rotation != self.rotation:
+            self.coord_v, self.rotation = coord_v, rotation
+            self.notify()
+        return True
+
+    def refresh_background(self):
+        """
+            后台刷新，避免阻塞解码线程
+        :return:
+        """
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def _refresh():
+            try:
+                self.refresh()
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=_refresh, daemon=True).start()
+
+    def on_server_event(self, event: ServerEvent):
+        """
+            EventBus 回调，处理 ROTATION / RESOLUTION
+        :param event:
+        :return:
+        """
+        # 有视频帧时方向以视频帧为准
+        if event.type == ServerEvent.ROTATION and 'rotation' in event.data:
+            if self.frame is None:
+                self.set_rotation(event.data['rotation'])
+
+        # 报告尺寸为设备尺寸，与 max_size 缩放后的帧尺寸不同，不可写入 frame
+        # 宽高比变化时重新查询设备尺寸
+        elif event.type == ServerEvent.RESOLUTION and 'width' in event.data and 'height' in event.data:
+            self.server_size = Coordinate(event.data['width'], event.data['height'])
+            if self._aspect_changed(self.server_size):
+                logger.info(f"Server Display Size Changed => {self.server_size}")
+                self.refresh_background()
+
+
+if __name__ == '__main__':
+    """
+        DEMO Here
+    """
+    import time
+
+    ds = DisplayState()
+    ds.set_size(Coordinate(1080, 2400))
+    ds.register(lambda _: print(_))
+
+    ds.update_frame(544, 1200)
+    ds.update_frame(1200, 544)
+
+    n = 1_000_000
+    t = time.perf_counter()
+    for _ in range(n):
+        ds.update_frame(1200, 544)
+    print(f"update_frame unchanged {(time.perf_counter() - t) / n * 1e9:.0f} ns/op")
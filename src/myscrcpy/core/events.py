@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+    Events
+    ~~~~~~~~~~~~~~~~~~
+    Scrcpy Server 日志解析为结构化事件，经 EventBus 分发
+
+    Log:
+        2026-10-19 3.3.0 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '3.3.0'
+
+__all__ = [
+    'ServerEvent', 'EventBus'
+]
+
+from dataclasses import dataclass, field
+import re
+import threading
+import time
+from typing import Callable, ClassVar, Dict, Set
+
+from loguru import logger
+
+
+@dataclass
+class ServerEvent:
+    """
+        Server 事件
+    """
+
+    LOG: ClassVar[str] = 'log'
+    DEVICE: ClassVar[str] = 'device'
+    ENCODER: ClassVar[str] = 'encoder'
+    ENCODER_ERROR: ClassVar[str] = 'encoder_error'
+    RESOLUTION: ClassVar[str] = 'resolution'
+    ROTATION: ClassVar[str] = 'rotation'
+    ERROR: ClassVar[str] = 'error'
+
+    ALL: ClassVar[str] = '*'
+
+    LINE_PATTERN: ClassVar[re.Pattern] = re.compile(r'^\[server\]\s+(VERBOSE|DEBUG|INFO|WARN|ERROR):\s*(.*)$')
+
+    # 按顺序匹配，首个命中即为事件类型
+    # 均锚定 Server 日志完整消息格式，避免任意文本中的 rotation / size 字样驱动屏幕状态
+    PATTERNS: ClassVar[tuple] = (
+        # Device: [Xiaomi] Redmi 23049RAD8C (Android 14)
+        (DEVICE, re.compile(
+            r'^Device: \[(?P<manufacturer>[^]]*)\] (?P<brand>\S+) (?P<model>.+?) \((?P<android>Android [^)]+)\)$'
+        )),
+        # Encoding error: ... / Audio encoding error: ... / Video encoder 'x' for h264 not found
+        # android.media.MediaCodec$CodecException: ...
+        (ENCODER_ERROR, re.compile(
+            r"^(?:(?:Audio e|E)ncoding error: .*"
+            r"|(?:Video|Audio) encoder '[^']*' for \S+ not found"
+            r"|(?:android\.media\.)?MediaCodec\$CodecException\b.*)$"
+        )),
+        # Using video encoder: 'c2.mtk.avc.encoder'
+        (ENCODER, re.compile(r"^Using (?:(?P<kind>video|audio) )?encoder: '(?P<encoder>[^']+)'$")),
+        # Display rotation: 1
+        (ROTATION, re.compile(r'^Display rotation: (?P<rotation>[0-3])$')),
+        # New display size: 2400x1080
+        # DisplaySizeMonitor: requestReset(): 1080x2400 -> 2400x1080
+        (RESOLUTION, re.compile(
+            r'^(?:New display size: |DisplaySizeMonitor: requestReset\(\): \S+ -> )'
+            r'(?P<width>\d{2,5})x(?P<height>\d{2,5})$'
+        )),
+    )
+
+    type: str
+    level: str
+    message: str
+    data: dict = field(default_factory=dict)
+    serial: str = ''
+    stream: str = ''
+    scid: str = ''
+    ts: float = field(default_factory=time.time)
+
+    @classmethod
+    def parse(cls, line: str, **kwargs) -> 'ServerEvent':
+        """
+            解析 Server 日志行
+        :param line:
+        :param kwargs: serial / stream / scid
+        :return:
+        """
+        m = cls.LINE_PATTERN.match(line)
+        if m:
+            level, message = m.group(1), m.group(2)
+        else:
+            level, message = 'INFO', line
+
+        for event_type, pattern in cls.PATTERNS:
+            m = pattern.search(message)
+            if m:
+                data = {k: int(v) if v.isdigit() else v.strip() for k, v in m.groupdict().items() if v is not None}
+                return cls(event_type, level, message, data, **kwargs)
+
+        return cls(cls.ERROR if level == 'ERROR' else cls.LOG, level, message, {}, **kwargs)
+
+
+class EventBus:
+    """
+        事件总线
+        按事件类型注册回调，'*' 接收全部事件
+    """
+
+    def __init__(self):
+        self.callbacks: Dict[str, Set[Callable[[ServerEvent], None]]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, event_type: str, callback: Callable[[ServerEvent], None]):
+        """
+            注册回调
+        :param event_type: ServerEvent.XXX
+        :param callback:
+        :return:
+        """
+        with self._lock:
+            self.callbacks.setdefault(event_type, set()).add(callback)
+
+    def unregister(self, event_type: str, callback: Callable[[ServerEvent], None]):
+        """
+            注销回调
+        :param event_type:
+        :param callback:
+        :return:
+        """
+        with self._lock:
+            self.callbacks.get(event_type, set()).discard(callback)
+
+    def has_listener(self, event_type: str) -> bool:
+        return bool(self.callbacks.get(event_type)) or bool(self.callbacks.get(ServerEvent.ALL))
+
+    def publish(self, event: ServerEvent):
+        """
+            分发事件，回调异常不影响其他回调
+        :param event:
+        :return:
+        """
+        callbacks = tuple(self.callbacks.get(event.type, ())) + tuple(self.callbacks.get(ServerEvent.ALL, ()))
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error(f"Event Callback {callback} Error => {e}")
+
+
+if __name__ == '__main__':
+    """
+        DEMO Here
+    """
+    bus = EventBus()
+    bus.register(ServerEvent.ALL, lambda _: print(f"{_.type:<14} {_.data}"))
+
+    for _line, _type in [
+        ('[server] INFO: Device: [Xiaomi] Redmi 23049RAD8C (Android 14)', ServerEvent.DEVICE),
+        ("[server] DEBUG: Using video encoder: 'c2.mtk.avc.encoder'", ServerEvent.ENCODER),
+        ("[server] DEBUG: Using audio encoder: 'c2.android.opus.encoder'", ServerEvent.ENCODER),
+        ('[server] ERROR: Encoding error: android.media.MediaCodec$CodecException: Error 0xfffffc0e', ServerEvent.ENCODER_ERROR),
+        ("[server] ERROR: Video encoder 'OMX.foo' for h265 not found", ServerEvent.ENCODER_ERROR),
+        ('android.media.MediaCodec$CodecException: Error 0xfffffc0e', ServerEvent.ENCODER_ERROR),
+        ('[server] INFO: Display rotation: 1', ServerEvent.ROTATION),
+        ('[server] INFO: New display size: 2400x1080', ServerEvent.RESOLUTION),
+        ('[server] VERBOSE: DisplaySizeMonitor: requestReset(): 1080x2400 -> 2400x1080', ServerEvent.RESOLUTION),
+
+        # 不应命中
+        ('[server] WARN: Audio disabled: it is not supported before Android 11', ServerEvent.LOG),
+        ('[server] INFO: Capture rotation locked to 2', ServerEvent.LOG),
+        ('[server] INFO: rotation=3 requested by client', ServerEvent.LOG),
+        ('[server] INFO: Buffer size: 1920x1080 frames queued', ServerEvent.LOG),
+        ('[server] DEBUG: Texture resolution 1280x720 for overlay', ServerEvent.LOG),
+        ("[server] INFO: Not using encoder 'c2.mtk.avc.encoder'", ServerEvent.LOG),
+        ('[server] ERROR: Could not inject input event', ServerEvent.ERROR),
+    ]:
+        event = ServerEvent.parse(_line)
+        assert event.type == _type, f"{_line} => {event.type}, expected {_type}"
+        bus.publish(event)
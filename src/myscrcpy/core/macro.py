@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""
+    Macro
+    ~~~~~~~~~~~~~~~~~~
+    控制宏录制及回放
+    通过 ControlAdapter.send_packet 回调录制带时间戳的控制数据包，写入紧凑二进制文件
+    回放时按设备分辨率缩放触摸坐标，支持倍速及多 Session 并行回放
+
+    文件格式:
+        Header  MAGIC(4s) VERSION(B) width(H) height(H)     录制设备竖屏 Control 尺寸
+        Record  t_ns(Q) size(I) packet(size)               t_ns 为相对录制开始时间
+
+    Log:
+        2026-10-19 3.3.0 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '3.3.0'
+
+__all__ = [
+    'MacroRecord',
+    'MacroRecorder', 'MacroReplayer'
+]
+
+import pathlib
+import struct
+import threading
+import time
+from typing import NamedTuple, List, Iterable, Tuple
+
+from loguru import logger
+
+from myscrcpy.core.control import ControlAdapter
+from myscrcpy.utils import Coordinate, ROTATION_VERTICAL
+
+
+class MacroRecord(NamedTuple):
+    """
+        单条录制记录
+    """
+    t_ns: int
+    packet: bytes
+
+
+class MacroRecorder:
+    """
+        控制宏录制器
+    """
+
+    MAGIC = b'MYSM'
+    VERSION = 1
+
+    HEADER = struct.Struct('>4sBHH')
+    RECORD = struct.Struct('>QI')
+
+    def __init__(self, control_adapter: ControlAdapter):
+        self.ca = control_adapter
+
+        self.is_recording = False
+        self.record_n = 0
+
+        self._fp = None
+        self._t0 = 0
+        self._lock = threading.Lock()
+
+    def __del__(self):
+        self.stop()
+
+    def start(self, path: pathlib.Path) -> 'MacroRecorder':
+        """
+            开始录制
+        :param path: 录制文件路径
+        :return:
+        """
+        if self.is_recording:
+            self.stop()
+
+        coord_v = self.ca.coord_hv[ROTATION_VERTICAL]
+
+        self._fp = path.open('wb')
+        self._fp.write(self.HEADER.pack(self.MAGIC, self.VERSION, coord_v.width, coord_v.height))
+
+        self.record_n = 0
+        self._t0 = time.perf_counter_ns()
+        self.is_recording = True
+        self.ca.register_packet_callback(self._on_packet)
+
+        logger.info(f"Macro Recording => {path}")
+        return self
+
+    def _on_packet(self, packet: bytes):
+        """
+            send_packet 回调，写入记录
+        :param packet:
+        :return:
+        """
+        t_ns = time.perf_counter_ns() - self._t0
+        with self._lock:
+            if self._fp is None:
+                return
+            self._fp.write(self.RECORD.pack(t_ns, len(packet)))
+            self._fp.write(packet)
+            self.record_n += 1
+
+    def stop(self):
+        """
+            停止录制
+        :return:
+        """
+        if not self.is_recording:
+            return
+
+        self.ca.unregister_packet_callback(self._on_packet)
+        self.is_recording = False
+
+        with self._lock:
+            self._fp.close()
+            self._fp = None
+
+        logger.success(f"Macro Recorded {self.record_n} Packets")
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> Tuple[Coordinate, List[MacroRecord]]:
+        """
+            读取录制文件
+        :param path:
+        :return: 录制设备竖屏 Control 尺寸, 记录
+        """
+        data = path.read_bytes()
+
+        magic, version, width, height = cls.HEADER.unpack_from(data, 0)
+        if magic != cls.MAGIC:
+            raise ValueError(f"{path} is not a macro file")
+        if version != cls.VERSION:
+            raise ValueError(f"Macro version {version} not supported")
+
+        records = []
+        offset = cls.HEADER.size
+        while offset < len(data):
+            t_ns, size = cls.RECORD.unpack_from(data, offset)
+            offset += cls.RECORD.size
+            records.append(MacroRecord(t_ns, data[offset:offset + size]))
+            offset += size
+
+        return Coordinate(width, height), records
+
+
+class MacroReplayer:
+    """
+        控制宏回放器
+        sleep 至目标时间前 SPIN_NS，之后自旋等待，保证亚毫秒级时间精度
+    """
+
+    SPIN_NS = 2_000_000
+
+    TOUCH = struct.Struct('>BBQiiHHHII')
+
+    def __init__(self, records: List[MacroRecord], speed: float = 1.0):
+        """
+            回放器
+        :param records:
+        :param speed: 倍速，2.0 为两倍速
+        """
+        if speed <= 0:
+            raise ValueError('Speed must be > 0')
+
+        self.records = records
+        self.speed = speed
+
+        self.is_running = False
+
+    @classmethod
+    def load(cls, path: pathlib.Path, speed: float = 1.0) -> 'MacroReplayer':
+        """
+            读取录制文件创建回放器
+        :param path:
+        :param speed:
+        :return:
+        """
+        _, records = MacroRecorder.load(path)
+        return cls(records, speed)
+
+    @classmethod
+    def rescale(cls, packet: bytes, control_adapter: ControlAdapter) -> bytes:
+        """
+            按目标设备 Control 尺寸缩放触摸坐标
+            packet 中 width/height 为录制时 frame 尺寸，可据此判断方向
+        :param packet:
+        :param control_adapter:
+        :return:
+        """
+        if len(packet) != cls.TOUCH.size or packet[0] != ControlAdapter.MessageType.INJECT_TOUCH_EVENT:
+            return packet
+
+        _t, action, touch_id, x, y, width, height, pressure, action_button, buttons = cls.TOUCH.unpack(packet)
+
+        _coord = control_adapter.coord_hv[Coordinate(width, height).rotation]
+        if _coord.width == width and _coord.height == height:
+            return packet
+
+        return cls.TOUCH.pack(
+            _t, action, touch_id,
+            round(x * _coord.width / width), round(y * _coord.height / height),
+            _coord.width, _coord.height,
+            pressure, action_button, buttons
+        )
+
+    def _replay(self, control_adapter: ControlAdapter, barrier: threading.Barrier | None = None):
+        """
+            单设备回放
+        :param control_adapter:
+        :param barrier: 并行回放时同步起点
+        :return:
+        """
+        packets = [
+            (round(_.t_ns / self.speed), self.rescale(_.packet, control_adapter)) for _ in self.records
+        ]
+
+        if barrier is not None:
+            barrier.wait()
+
+        t0 = time.perf_counter_ns()
+
+        for t_ns, packet in packets:
+            if not self.is_running:
+                break
+
+            deadline = t0 + t_ns
+            remaining = deadline - time.perf_counter_ns()
+            if remaining > self.SPIN_NS:
+                time.sleep((remaining - self.SPIN_NS) / 1e9)
+
+            while time.perf_counter_ns() < deadline:
+                ...
+
+            control_adapter.send_packet(packet, ignore_repeat=True)
+
+    def replay(self, control_adapters: ControlAdapter | Iterable[ControlAdapter], wait: bool = True):
+        """
+            回放，多个 ControlAdapter 时并行回放
+        :param control_adapters:
+        :param wait: 阻塞直至回放结束
+        :return:
+        """
+        if isinstance(control_adapters, ControlAdapter):
+            control_adapters = [control_adapters]
+
+        control_adapters = [_ for _ in control_adapters if _ is not None and _.is_ready]
+        if len(control_adapters) == 0:
+            logger.warning('No Control Ready to Replay')
+            return
+
+        self.is_running = True
+
+        barrier = threading.Barrier(len(control_adapters))
+        threads = [
+            threading.Thread(target=self._replay, args=(ca, barrier)) for ca in control_adapters
+        ]
+        for _ in threads:
+            _.start()
+
+        logger.info(f"Macro Replaying {len(self.records)} Packets on {len(threads)} Devices. Speed x{self.speed}")
+
+        if wait:
+            for _ in threads:
+                _.join()
+            self.is_running = False
+
+    def stop(self):
+        """
+            停止回放
+        :return:
+        """
+        self.is_running = False
+
+
+if __name__ == '__main__':
+    """
+        DEMO Here
+    """
+    from adbutils import adb
+    from myscrcpy.core.control import ControlArgs
+
+    cas = [ControlAdapter.connect(_, ControlArgs()) for _ in adb.device_list()]
+
+    path_macro = pathlib.Path('demo.mysm')
+
+    recorder = MacroRecorder(cas[0]).start(path_macro)
+    cas[0].f_touch_spr(0, cas[0].coord_hv[ROTATION_VERTICAL].to_scale_point_r(100, 100), 1)
+    cas[0].f_touch_spr(1, cas[0].coord_hv[ROTATION_VERTICAL].to_scale_point_r(100, 100), 1)
+    recorder.stop()
+
+    MacroReplayer.load(path_macro, speed=2.0).replay(cas)
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+    Metrics
+    ~~~~~~~~~~~~~~~~~~
+    连接及数据流指标
+    Counter / Gauge / Histogram 按 labels(serial / stream / scid) 区分
+    热路径仅做属性累加，快照及 Prometheus 文本在读取时生成
+
+    Log:
+        2026-10-19 3.3.0 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '3.3.0'
+
+__all__ = [
+    'Counter', 'Gauge', 'Histogram',
+    'MetricsRegistry', 'METRICS'
+]
+
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+from typing import Dict, Tuple
+
+from loguru import logger
+
+
+class Counter:
+    """
+        累加计数
+    """
+
+    TYPE = 'counter'
+
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, n: int | float = 1):
+        self.value += n
+
+    def snapshot(self):
+        return self.value
+
+
+class Gauge:
+    """
+        当前值
+    """
+
+    TYPE = 'gauge'
+
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0
+
+    def set(self, value: int | float):
+        self.value = value
+
+    def inc(self, n: int | float = 1):
+        self.value += n
+
+    def dec(self, n: int | float = 1):
+        self.value -= n
+
+    def snapshot(self):
+        return self.value
+
+
+class Histogram:
+    """
+        延迟分布，默认单位 ms
+    """
+
+    TYPE = 'histogram'
+
+    DEFAULT_BUCKETS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)    # 最后一位为 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """
+            按 bucket 上界估算分位数
+        :param q: 0..1
+        :return:
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for i, n in enumerate(self.counts):
+            cumulative += n
+            if cumulative >= rank:
+                return self.buckets[i] if i < len(self.buckets) else float('inf')
+        return float('inf')
+
+    def snapshot(self) -> dict:
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+        }
+
+
+class MetricsRegistry:
+    """
+        指标注册表
+    """
+
+    PREFIX = 'myscrcpy_'
+
+    def __init__(self):
+        self._metrics: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Counter | Gauge | Histogram] = {}
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+
+    def _get(self, cls, name: str, labels: dict, *args):
+        """
+            获取或创建指标
+        :param cls:
+        :param name:
+        :param labels:
+        :return:
+        """
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(key)
+                if metric is None:
+                    metric = cls(*args)
+                    self._metrics[key] = metric
+        return metric
+
+    def counter(self, name: str, **labels) -> Counter:
+        return self._get(Counter, name, labels)
+
+    def gauge(self, name: str, **labels) -> Gauge:
+        return self._get(Gauge, name, labels)
+
+    def histogram(self, name: str, buckets: Tuple[float, ...] = Histogram.DEFAULT_BUCKETS, **labels) -> Histogram:
+        return self._get(Histogram, name, labels, buckets)
+
+    def remove(self, **labels):
+        """
+            删除包含指定 labels 的指标，如 remove(scid='...')
+        :param labels:
+        :return:
+        """
+        _labels = {(k, str(v)) for k, v in labels.items()}
+        with self._lock:
+            for key in [_ for _ in self._metrics if _labels.issubset(_[1])]:
+                self._metrics.pop(key)
+
+    def snapshot(self, **labels) -> list[dict]:
+        """
+            指标快照
+        :param labels: 过滤条件
+        :return: [{'name', 'type', 'labels', 'value'}]
+        """
+        _labels = {(k, str(v)) for k, v in labels.items()}
+        with self._lock:
+            items = list(self._metrics.items())
+
+        return [
+            {'name': name, 'type': metric.TYPE, 'labels': dict(_lb), 'value': metric.snapshot()}
+            for (name, _lb), metric in items if _labels.issubset(_lb)
+        ]
+
+    def to_prometheus(self) -> str:
+        """
+            Prometheus 文本格式
+        :return:
+        """
+        with self._lock:
+            items = sorted(self._metrics.items(), key=lambda _: _[0])
+
+        def _fmt(_labels, extra: str = '') -> str:
+            _ = [f'{k}="{v}"' for k, v in _labels]
+            if extra:
+                _.append(extra)
+            return '{' + ','.join(_) + '}' if _ else ''
+
+        lines = []
+        last_name = None
+        for (name, labels), metric in items:
+            full_name = self.PREFIX + name
+            if name != last_name:
+                lines.append(f"# TYPE {full_name} {metric.TYPE}")
+                last_name = name
+
+            if isinstance(metric, Histogram):
+                cumulative = 0
+                for bound, n in zip(metric.buckets + (float('inf'),), metric.counts):
+                    cumulative += n
+                    le = 'le="' + ('+Inf' if bound == float('inf') else f"{bound:g}") + '"'
+                    lines.append(f"{full_name}_bucket{_fmt(labels, le)} {cumulative}")
+                lines.append(f"{full_name}_sum{_fmt(labels)} {metric.sum}")
+                lines.append(f"{full_name}_count{_fmt(labels)} {metric.count}")
+            else:
+                lines.append(f"{full_name}{_fmt(labels)} {metric.value}")
+
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port: int = 9464, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+        """
+            启动本地 Prometheus exporter，GET /metrics
+        :param port:
+        :param host: 默认仅本机访问
+        :return:
+        """
+        if self._server is not None:
+            return self._server
+
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = registry.to_prometheus().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                ...
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        logger.success(f"Metrics Exporter Serving => http://{host}:{port}/metrics")
+        return self._server
+
+    def shutdown(self):
+        """
+            关闭 exporter
+        :return:
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+# 全局默认注册表
+METRICS = MetricsRegistry()
+
+
+if __name__ == '__main__':
+    """
+        DEMO Here
+    """
+    import random
+    import time
+
+    c = METRICS.counter('rx_bytes_total', serial='demo', stream='video', scid='00000000')
+    h = METRICS.histogram('video_decode_ms', serial='demo', stream='video', scid='00000000')
+
+    n = 1_000_000
+    t = time.perf_counter()
+    for _ in range(n):
+        c.inc(1024)
+    logger.info(f"Counter.inc   {(time.perf_counter() - t) / n * 1e9:.0f} ns/op")
+
+    t = time.perf_counter()
+    for _ in range(n):
+        h.observe(random.random() * 20)
+    logger.info(f"Histogram.observe {(time.perf_counter() - t) / n * 1e9:.0f} ns/op")
+
+    print(METRICS.to_prometheus())
@@ -5,6 +5,17 @@
     连接控制
 
     Log:
+        2026-10-19 3.3.0 Me2sY
+            1.新增 multiplex 模式，单一 Server 进程承载全部连接
+            2.Adapter 并行启动，记录各 Adapter 启动结果
+            3.heartbeat 仅重连断开的 Adapter，指数退避
+            4.记录重连次数指标
+            5.新增 event_bus，接收 Server 结构化事件
+            6.新增 standby 预启动 Server，支持 switch 切换连接参数
+            7.新增 socket_profiles，按连接类型设置 Socket 参数
+            8.新增 display_state，Video 帧尺寸及 Server 事件驱动方向/尺寸更新
+            9.新增 decode_executor，多 Session 共享解码线程池
+
         2025-04-23 3.2.0 Me2sY  默认关闭 heartbeat
 
         2024-09-22 1.6.0 Me2sY  支持视频帧回调方法
@@ -14,20 +25,27 @@
 """
 
 __author__ = 'Me2sY'
-__version__ = '3.2.0'
+__version__ = '3.3.0'
 
 __all__ = [
     'Session'
 ]
 
+from concurrent.futures import Executor, ThreadPoolExecutor, Future, wait
 import threading
 import time
-from typing import Callable
+from typing import Callable, Dict
 
 import av
 from adbutils import AdbDevice, AdbError
 from loguru import logger
 
+from myscrcpy.core.adapter_cls import ScrcpyAdapter
+from myscrcpy.core.connection import Connection, SocketProfile
+from myscrcpy.core.display import DisplayState
+from myscrcpy.core.events import EventBus, ServerEvent
+from myscrcpy.core.metrics import METRICS
+from myscrcpy.core.standby import StandbyPool
 from myscrcpy.core.video import *
 from myscrcpy.core.audio import *
 from myscrcpy.core.control import *
@@ -38,6 +56,13 @@ class Session:
         Scrcpy Connect Session
     """
 
+    # Server accept 顺序
+    ADAPTER_ATTRS = {'video': 'va', 'audio': 'aa', 'control': 'ca'}
+
+    POLL_SEC = 0.5
+    BACKOFF_MIN = 0.5
+    BACKOFF_MAX = 30
+
     def __init__(
             self,
             adb_device: AdbDevice,
@@ -46,15 +71,72 @@ class Session:
             control_args: ControlArgs = None,
             heartbeat: bool = False,
             frame_update_callback: Callable = None,
+            multiplex: bool = False,
+            start_timeout: float = 10,
+            event_bus: EventBus | None = None,
+            standby: int = 0,
+            socket_profiles: Dict[str, SocketProfile] | None = None,
+            decode_executor: Executor | None = None,
             **kwargs
     ):
+        """
+            Session
+        :param adb_device:
+        :param video_args:
+        :param audio_args:
+        :param control_args:
+        :param heartbeat:
+        :param frame_update_callback:
+        :param multiplex: 单一 Scrcpy Server 进程承载 video/audio/control，仅推送一次 server 并启动一次 app_process
+        :param start_timeout: Adapter 并行启动共用超时时间
+        :param event_bus: Server 事件总线，None 时创建，如 event_bus.register(ServerEvent.ROTATION, callback)
+        :param standby: 设备预启动 Server 数量，大于 0 时启用 multiplex，重连及切换配置时直接 attach
+        :param socket_profiles: {'video' / 'audio' / 'control': SocketProfile}，未指定使用默认值
+        :param decode_executor: 视频解码 executor，多 Session 共用以限制解码并发
+        :param kwargs:
+        """
         self.adb_device = adb_device
-
-        self.ca = None if control_args is None else ControlAdapter.connect(self.adb_device, control_args)
-        self.aa = None if audio_args is None else AudioAdapter.connect(self.adb_device, audio_args)
-        self.va = None if video_args is None else VideoAdapter.connect(
-            self.adb_device, video_args, frame_update_callback
+        self.multiplex = multiplex or standby > 0
+        self.standby_pool = StandbyPool.of(adb_device, standby) if standby > 0 else None
+        self.start_timeout = start_timeout
+        self.event_bus = EventBus() if event_bus is None else event_bus
+        self.socket_profiles = {} if socket_profiles is None else socket_profiles
+        self.decode_executor = decode_executor
+
+        # 屏幕状态，VideoAdapter / ControlAdapter 共用，display_state.register(callback) 订阅变化
+        self.display_state = DisplayState(adb_device)
+        self.event_bus.register(ServerEvent.ROTATION, self.display_state.on_server_event)
+        self.event_bus.register(ServerEvent.RESOLUTION, self.display_state.on_server_event)
+
+        self.ca = None if control_args is None or not control_args.is_activate else ControlAdapter(
+            self.create_connection('control', control_args), self.display_state
         )
+        self.aa = None if audio_args is None or not audio_args.is_activate else AudioAdapter(
+            self.create_connection('audio', audio_args)
+        )
+        self.va = None if video_args is None or not video_args.is_activate else VideoAdapter(
+            self.create_connection('video', video_args), frame_update_callback, self.display_state,
+            decode_executor
+        )
+
+        # 各 Adapter 启动结果 {name: {'ok': bool, 'ms': float, 'error': str}}
+        self.start_report = {}
+
+        # 重连退避 {name: [next_try, delay]}
+        self._backoff = {}
+
+        t = time.perf_counter()
+
+        outcomes = self.start_adapters()
+
+        # 启动失败的 Adapter 置空，与 Adapter.connect 行为一致
+        for name, ok in outcomes.items():
+            if not ok:
+                setattr(self, self.ADAPTER_ATTRS[name], None)
+
+        self.connect_ms = (time.perf_counter() - t) * 1000
+
+        self.prepare_standby()
 
         if self.ca is None and self.aa is None and self.va is None:
             raise RuntimeError(f"At Least One Adapter Required!")
@@ -93,19 +175,225 @@ class Session:
             **kwargs
         )
 
-    def reconnect(self):
+    def create_connection(self, name: str, args) -> Connection:
         """
-            重连
+            创建连接，应用 socket_profiles
+        :param name: video / audio / control
+        :param args:
+        :return:
+        """
+        return Connection(args, event_bus=self.event_bus, socket_profile=self.socket_profiles.get(name))
+
+    @property
+    def adapters(self) -> dict[str, ScrcpyAdapter]:
+        """
+            已创建的 Adapter，按 Server accept 顺序排列
+        :return:
+        """
+        return {
+            name: getattr(self, attr) for name, attr in self.ADAPTER_ATTRS.items() if getattr(self, attr) is not None
+        }
+
+    def start_adapters(self, names: list[str] | None = None) -> dict[str, bool]:
+        """
+            并行启动 Adapter，共用 start_timeout
+        :param names: 为 None 时启动全部
+        :return: {name: 是否成功}
+        """
+        adapters = {
+            name: adapter for name, adapter in self.adapters.items() if names is None or name in names
+        }
+        if len(adapters) == 0:
+            return {}
+
+        if self.multiplex:
+            # 单一 Server，需先按顺序建立全部 socket
+            t = time.perf_counter()
+
+            # 优先使用预启动 Server
+            connections = None if self.standby_pool is None else self.standby_pool.take(
+                [_.conn.args for _ in adapters.values()]
+            )
+
+            if connections is not None:
+                for conn in connections:
+                    adapters[conn.stream_type].conn = conn
+
+            elif not Connection.connect_multiplex(self.adb_device, [_.conn for _ in adapters.values()]):
+                logger.error('Multiplex Connect Failed!')
+                ms = (time.perf_counter() - t) * 1000
+                for name in adapters:
+                    self.start_report[name] = {'ok': False, 'ms': ms, 'error': 'multiplex connect failed'}
+                return {name: False for name in adapters}
+
+        deadline = time.perf_counter() + self.start_timeout
+
+        def _start(_adapter: ScrcpyAdapter) -> tuple[bool, float]:
+            _t = time.perf_counter()
+            return _adapter.start(self.adb_device), (time.perf_counter() - _t) * 1000
+
+        def _stop_late(_future: Future, _adapter: ScrcpyAdapter):
+            """
+                超时后才启动完成的 Adapter 直接关闭
+            """
+            try:
+                if _future.result()[0]:
+                    _adapter.stop()
+            except Exception:
+                ...
+
+        executor = ThreadPoolExecutor(max_workers=len(adapters), thread_name_prefix='SessionStart')
+        futures = {name: executor.submit(_start, adapter) for name, adapter in adapters.items()}
+        wait(futures.values(), timeout=max(0.0, deadline - time.perf_counter()))
+        executor.shutdown(wait=False)
+
+        outcomes = {}
+        for name, future in futures.items():
+            if not future.done():
+                future.add_done_callback(lambda _f, _a=adapters[name]: _stop_late(_f, _a))
+                report = {'ok': False, 'ms': self.start_timeout * 1000, 'error': 'timeout'}
+            else:
+                try:
+                    ok, ms = future.result()
+                    report = {'ok': ok, 'ms': ms, 'error': '' if ok else 'start failed'}
+                except Exception as e:
+                    report = {'ok': False, 'ms': 0.0, 'error': str(e)}
+
+            self.start_report[name] = report
+            outcomes[name] = report['ok']
+
+            if report['ok']:
+                logger.success(f"{name.capitalize():<8} Started in {report['ms']:.0f} ms")
+            else:
+                logger.error(f"{name.capitalize():<8} Start Failed => {report['error']}")
+
+        return outcomes
+
+    def prepare_standby(self, args_list: list | None = None):
+        """
+            后台预启动 Server
+        :param args_list: 下次可能使用的连接参数，None 时使用当前参数
         :return:
         """
+        if self.standby_pool is None:
+            return
+
+        if args_list is None:
+            args_list = [_.conn.args for _ in self.adapters.values()]
+
+        self.standby_pool.prepare(args_list, self.event_bus, self.socket_profiles)
+
+    def switch(
+            self, video_args: VideoArgs = None, audio_args: AudioArgs = None, control_args: ControlArgs = None
+    ) -> dict[str, bool]:
+        """
+            切换连接参数，存在匹配的 Standby 时直接 attach
+        :param video_args: None 时保持不变
+        :param audio_args:
+        :param control_args:
+        :return: {name: 是否成功}
+        """
         self.disconnect()
-        for _ in [self.ca, self.aa, self.va]:
-            if _ is None:
+
+        for name, args in [('video', video_args), ('audio', audio_args), ('control', control_args)]:
+            if args is None:
+                continue
+
+            attr = self.ADAPTER_ATTRS[name]
+            adapter = getattr(self, attr)
+
+            if not args.is_activate:
+                setattr(self, attr, None)
                 continue
-            _.start(self.adb_device)
 
+            conn = self.create_connection(name, args)
+
+            if adapter is None:
+                adapter = {
+                    'video': VideoAdapter, 'audio': AudioAdapter, 'control': ControlAdapter
+                }[name](conn)
+                if name != 'audio':
+                    adapter.display_state = self.display_state
+                if name == 'video':
+                    adapter.decode_executor = self.decode_executor
+                setattr(self, attr, adapter)
+            else:
+                adapter.conn = conn
+
+            if name == 'control':
+                adapter.screen_status = args.screen_status
+                adapter.clipboard = args.clipboard
+
+        outcomes = self.start_adapters()
+        self.is_running = True
+
+        self.prepare_standby()
+
+        return outcomes
+
+    def lost_adapters(self) -> list[str]:
+        """
+            socket 已断开的 Adapter
+        :return:
+        """
+        return [name for name, adapter in self.adapters.items() if adapter.conn.is_lost]
+
+    def reconnect_lost(self) -> list[str]:
+        """
+            仅重连 socket 断开的 Adapter，指数退避
+            multiplex 模式下 Server 共用，任一断开即全部重连
+        :return: 本次重连成功的 Adapter
+        """
+        lost = self.lost_adapters()
+        if len(lost) == 0:
+            return []
+
+        if self.multiplex:
+            lost = list(self.adapters.keys())
+
+        now = time.perf_counter()
+        retry = []
+        for name in lost:
+            next_try, _ = self._backoff.setdefault(name, [now, self.BACKOFF_MIN])
+            if now >= next_try:
+                retry.append(name)
+
+        if self.multiplex and len(retry) != len(lost):
+            return []
+
+        if len(retry) == 0:
+            return []
+
+        for name in retry:
+            logger.warning(f"{name.capitalize()} Lost. Reconnecting...")
+            METRICS.counter('reconnects_total', serial=self.adb_device.serial, stream=name).inc()
+            self.adapters[name].stop()
+
+        outcomes = self.start_adapters(retry)
+        all(outcomes.values()) and self.prepare_standby()
+
+        for name, ok in outcomes.items():
+            if ok:
+                self._backoff.pop(name, None)
+            else:
+                delay = self._backoff[name][1]
+                self._backoff[name] = [time.perf_counter() + delay, min(delay * 2, self.BACKOFF_MAX)]
+
+        return [name for name, ok in outcomes.items() if ok]
+
+    def reconnect(self):
+        """
+            重连
+        :return:
+        """
+        self.disconnect()
+        for name in self.adapters:
+            METRICS.counter('reconnects_total', serial=self.adb_device.serial, stream=name).inc()
+        self.start_adapters()
         self.is_running = True
 
+        self.prepare_standby()
+
     def disconnect(self):
         """
             断开连接
@@ -131,37 +419,47 @@ class Session:
     def heartbeat(self, auto_reconnect: bool = True, wait_sec: int = 5, retry_n: int = 12, **kwargs):
         """
             监控及重连
+            设备在线时，每 POLL_SEC 检测各 socket，仅重连断开的 Adapter
         :param auto_reconnect: 自动重连
-        :param wait_sec:
+        :param wait_sec: 设备检测间隔
         :param retry_n:
         :return:
         """
         _retry_n = retry_n
+        t_check = 0
         while self.is_running or self.is_loss:
             if retry_n < 0:
                 self.is_running = False
                 logger.error(f"Session Lost Connect!")
                 break
 
-            try:
-                assert '1' == str(self.adb_device.shell('echo 1', timeout=3))
+            if time.perf_counter() >= t_check:
+                t_check = time.perf_counter() + wait_sec
+                try:
+                    assert '1' == str(self.adb_device.shell('echo 1', timeout=3))
 
-                # Auto Reconnect
-                if self.is_loss and auto_reconnect:
-                    self.reconnect()
+                    # Auto Reconnect
+                    if self.is_loss and auto_reconnect:
+                        self.reconnect()
 
-                self.is_loss = False
-                retry_n = _retry_n
+                    self.is_loss = False
+                    retry_n = _retry_n
 
-            except (AdbError, AssertionError) as e:
-                logger.warning(f"Session Heartbeat Error => {e}")
-                self.is_loss = True
-                if auto_reconnect:
-                    retry_n -= 1
-                else:
-                    retry_n = -1
+                except (AdbError, AssertionError) as e:
+                    logger.warning(f"Session Heartbeat Error => {e}")
+                    self.is_loss = True
+                    if auto_reconnect:
+                        retry_n -= 1
+                    else:
+                        retry_n = -1
 
-            time.sleep(wait_sec)
+            if self.is_running and not self.is_loss and auto_reconnect:
+                try:
+                    self.reconnect_lost()
+                except Exception as e:
+                    logger.error(f"Reconnect Lost Adapter Error => {e}")
+
+            time.sleep(self.POLL_SEC)
 
     @property
     def is_video_ready(self) -> bool:
@@ -183,13 +481,12 @@ if __name__ == '__main__':
     from adbutils import adb
     d = adb.device_list()[0]
 
-    sess = Session.connect_by_configs(
-        d,
-        **{'video': True, 'audio': True},
-        **VideoArgs().dump(),
-        **AudioArgs(audio_codec=AudioArgs.CODEC_RAW).dump()
-    )
-
-    # sess = Session(d, video_args=VideoArgs(1200), audio_args=AudioArgs(), control_args=ControlArgs())
-
-    # sess.disconnect()
+    # 连接耗时对比
+    for _multiplex in [False, True]:
+        sess = Session(
+            d, video_args=VideoArgs(max_size=1200), audio_args=AudioArgs(audio_codec=AudioArgs.CODEC_RAW),
+            control_args=ControlArgs(), multiplex=_multiplex
+        )
+        logger.info(f"Multiplex {_multiplex} | Connect {sess.connect_ms:.0f} ms")
+        sess.disconnect()
+        time.sleep(1)
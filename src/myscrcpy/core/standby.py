@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+    Standby
+    ~~~~~~~~~~~~~~~~~~
+    预启动 Scrcpy Server
+    提前完成 push 及 app_process 启动，Server 于 accept 处等待
+    重连或切换配置时直接 attach，省去 push 及 JVM 启动耗时
+
+    Log:
+        2026-10-19 3.3.0 Me2sY
+            1.创建
+            2.prepare 支持 socket_profiles
+"""
+
+__author__ = 'Me2sY'
+__version__ = '3.3.0'
+
+__all__ = [
+    'StandbyPool'
+]
+
+import atexit
+from collections import deque
+import threading
+import time
+from typing import ClassVar, Dict, List
+
+from adbutils import AdbDevice
+from loguru import logger
+
+from myscrcpy.core.args_cls import ScrcpyConnectArgs
+from myscrcpy.core.connection import Connection, SocketProfile
+from myscrcpy.core.events import EventBus
+
+
+class _Standby:
+    """
+        单个预启动 Server
+    """
+
+    def __init__(self, key: tuple):
+        self.key = key
+        self.connections: List[Connection] | None = None
+        self.scid = None
+        self.ready = threading.Event()
+        self.t_spawn = time.perf_counter()
+
+
+class StandbyPool:
+    """
+        设备级 Standby 池，每设备最多 max_n 个
+    """
+
+    pools: ClassVar[Dict[str, 'StandbyPool']] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, adb_device: AdbDevice, max_n: int = 1, max_age: float = 300):
+        """
+            Standby 池
+        :param adb_device:
+        :param max_n: 最大预启动数量
+        :param max_age: 预启动最长保留时间，秒
+        """
+        self.adb_device = adb_device
+        self.max_n = max_n
+        self.max_age = max_age
+
+        self.standbys: deque[_Standby] = deque()
+        self._pool_lock = threading.Lock()
+
+    @classmethod
+    def of(cls, adb_device: AdbDevice, max_n: int = 1) -> 'StandbyPool':
+        """
+            获取设备 Standby 池
+        :param adb_device:
+        :param max_n:
+        :return:
+        """
+        with cls._lock:
+            pool = cls.pools.get(adb_device.serial)
+            if pool is None:
+                pool = cls(adb_device, max_n)
+                cls.pools[adb_device.serial] = pool
+            else:
+                pool.max_n = max(pool.max_n, max_n)
+            return pool
+
+    @staticmethod
+    def make_key(args_list: List[ScrcpyConnectArgs]) -> tuple:
+        """
+            连接参数签名
+        :param args_list:
+        :return:
+        """
+        return tuple(sorted(tuple(_.to_args()) for _ in args_list))
+
+    def prepare(
+            self, args_list: List[ScrcpyConnectArgs], event_bus: EventBus | None = None,
+            socket_profiles: Dict[str, SocketProfile] | None = None
+    ):
+        """
+            后台预启动 Server，已存在相同参数时忽略
+        :param args_list: video / audio / control args
+        :param event_bus:
+        :param socket_profiles: {stream_type: SocketProfile}
+        :return:
+        """
+        args_list = [_ for _ in args_list if _ is not None and _.is_activate]
+        if len(args_list) == 0 or self.max_n <= 0:
+            return
+
+        key = self.make_key(args_list)
+        socket_profiles = {} if socket_profiles is None else socket_profiles
+
+        with self._pool_lock:
+            if any(_.key == key for _ in self.standbys):
+                return
+
+            while len(self.standbys) >= self.max_n:
+                self._discard(self.standbys.popleft())
+
+            standby = _Standby(key)
+            self.standbys.append(standby)
+
+        def _spawn():
+            try:
+                connections = [Connection(_, event_bus=event_bus) for _ in args_list]
+                for conn in connections:
+                    conn.socket_profile = socket_profiles.get(conn.stream_type, conn.socket_profile)
+                standby.connections = Connection.spawn_multiplex(self.adb_device, connections)
+                if standby.connections is not None:
+                    standby.scid = standby.connections[0].scid
+            except Exception as e:
+                logger.warning(f"Standby Spawn Error => {e}")
+            finally:
+                standby.t_spawn = time.perf_counter()
+                standby.ready.set()
+
+        threading.Thread(target=_spawn, daemon=True).start()
+
+    def take(self, args_list: List[ScrcpyConnectArgs], timeout: int = 5) -> List[Connection] | None:
+        """
+            取出匹配的 Standby 并建立 socket
+        :param args_list:
+        :param timeout:
+        :return: 已连接的 Connection，无可用 Standby 返回 None
+        """
+        key = self.make_key([_ for _ in args_list if _ is not None and _.is_activate])
+
+        with self._pool_lock:
+            standby = next((_ for _ in self.standbys if _.key == key), None)
+            if standby is None:
+                return None
+            self.standbys.remove(standby)
+
+        if not standby.ready.wait(timeout) or standby.connections is None:
+            self._discard(standby)
+            return None
+
+        lead = standby.connections[0]
+        if lead._stream is None or lead._stream.closed or time.perf_counter() - standby.t_spawn > self.max_age:
+            self._discard(standby)
+            return None
+
+        if not Connection.attach_multiplex(self.adb_device, standby.connections, timeout):
+            self._discard(standby)
+            return None
+
+        logger.success(f"Standby {lead.scid} Attached!")
+        return standby.connections
+
+    def _discard(self, standby: _Standby, block: bool = False):
+        """
+            结束预启动 Server
+        :param standby:
+        :param block: 阻塞至结束
+        :return:
+        """
+        def _kill():
+            standby.ready.wait(10)
+            if standby.connections is None:
+                return
+            try:
+                self.adb_device.shell(f"pkill -f scid={standby.scid}", timeout=3)
+            except Exception:
+                ...
+            for conn in standby.connections:
+                conn.disconnect()
+
+        if block:
+            _kill()
+        else:
+            threading.Thread(target=_kill, daemon=True).start()
+
+    def clear(self, block: bool = False):
+        """
+            结束全部预启动 Server
+        :param block:
+        :return:
+        """
+        with self._pool_lock:
+            while self.standbys:
+                self._discard(self.standbys.popleft(), block)
+
+    @classmethod
+    def clear_all(cls):
+        """
+            退出时清理
+        :return:
+        """
+        with cls._lock:
+            for pool in cls.pools.values():
+                pool.clear(block=True)
+
+
+atexit.register(StandbyPool.clear_all)
@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+"""
+    Transfer
+    ~~~~~~~~~~~~~~~~~~
+    文件传输管理
+    有界线程池并发拉取，每文件独立 sync 连接
+    写入 .part 临时文件，断线后按块偏移经 dd skip 续传，完成后校验大小及 md5
+
+    Log:
+        2026-10-19 3.3.0 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '3.3.0'
+
+__all__ = [
+    'Transfer', 'TransferManager'
+]
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+import hashlib
+from pathlib import Path, PurePosixPath
+import shlex
+import threading
+import time
+from typing import Callable, ClassVar, Iterator, List
+
+from adbutils import AdbDevice, AdbError
+from loguru import logger
+
+
+@dataclass
+class Transfer:
+    """
+        单文件传输状态
+    """
+
+    STATUS_PENDING: ClassVar[str] = 'pending'
+    STATUS_RUNNING: ClassVar[str] = 'running'
+    STATUS_DONE: ClassVar[str] = 'done'
+    STATUS_FAILED: ClassVar[str] = 'failed'
+    STATUS_CANCELLED: ClassVar[str] = 'cancelled'
+
+    src: PurePosixPath
+    dest: Path
+    size: int = 0
+    done: int = 0
+    status: str = STATUS_PENDING
+    error: str = ''
+    retries: int = 0
+    resumed_from: int = 0
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def progress(self) -> float:
+        return 1.0 if self.size == 0 else min(self.done / self.size, 1.0)
+
+    @property
+    def path_part(self) -> Path:
+        return self.dest.with_name(self.dest.name + '.part')
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (self.STATUS_DONE, self.STATUS_FAILED, self.STATUS_CANCELLED)
+
+    def cancel(self):
+        self.cancel_event.set()
+
+
+class TransferManager:
+    """
+        并发拉取管理器
+
+        tm = TransferManager(adb_device)
+        future = tm.pull('/sdcard/DCIM/a.mp4', Path('a.mp4'), progress_callback=print)
+        transfer = future.result()
+    """
+
+    RESUME_BS = 1 << 20         # dd 块大小，续传偏移按此对齐
+    READ_SIZE = 64 * 1024
+    RETRY_SEC = 1
+
+    def __init__(
+            self, adb_device: AdbDevice,
+            max_workers: int = 4, max_retries: int = 5, verify: bool = True
+    ):
+        """
+            传输管理器
+        :param adb_device:
+        :param max_workers: 并发 sync 连接数
+        :param max_retries: 单文件断线重试次数
+        :param verify: 完成后校验 md5
+        """
+        self.adb_device = adb_device
+        self.max_retries = max_retries
+        self.verify = verify
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='transfer')
+        self.transfers: List[Transfer] = []
+
+    def remote_size(self, src: PurePosixPath | str) -> int:
+        """
+            远端文件大小，使用 stat 避免 sync STAT 32 位溢出
+        :param src:
+        :return:
+        """
+        output = self.adb_device.shell(f"stat -c %s {shlex.quote(str(src))} 2>/dev/null", timeout=5).strip()
+        if not output.isdigit():
+            raise AdbError(f"stat {src} Failed")
+        return int(output)
+
+    def remote_md5(self, src: PurePosixPath | str) -> str:
+        return self.adb_device.shell(f"md5sum {shlex.quote(str(src))}", timeout=None).split(' ')[0]
+
+    @staticmethod
+    def local_md5(path: Path) -> str:
+        md5 = hashlib.md5()
+        with path.open('rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                md5.update(chunk)
+        return md5.hexdigest()
+
+    def remote_files(self, src: PurePosixPath | str) -> List[tuple[PurePosixPath, int]]:
+        """
+            单次 shell 列出目录下全部文件及大小
+        :param src:
+        :return: [(path, size)]
+        """
+        output = self.adb_device.shell(
+            f"find {shlex.quote(str(src))} -type f -exec stat -c '%s|%n' {{}} +", timeout=None
+        )
+        files = []
+        for line in output.splitlines():
+            size, _, path = line.partition('|')
+            if path and size.isdigit():
+                files.append((PurePosixPath(path), int(size)))
+        return files
+
+    def pull(
+            self, src: PurePosixPath | str, dest: Path,
+            progress_callback: Callable[[Transfer], None] | None = None,
+            size: int | None = None
+    ) -> Future:
+        """
+            拉取单个文件
+        :param src: 设备路径
+        :param dest: 本地文件路径
+        :param progress_callback: 进度回调，于传输线程中执行
+        :param size: 已知大小时跳过查询
+        :return: Future[Transfer]
+        """
+        transfer = Transfer(PurePosixPath(src), Path(dest), size=-1 if size is None else size)
+        self.transfers.append(transfer)
+        return self.executor.submit(self._run, transfer, progress_callback)
+
+    def pull_dir(
+            self, src: PurePosixPath | str, dest: Path,
+            progress_callback: Callable[[Transfer], None] | None = None
+    ) -> List[Future]:
+        """
+            拉取目录，保持目录结构
+        :param src:
+        :param dest: 本地目录
+        :param progress_callback:
+        :return: [Future[Transfer]]
+        """
+        src = PurePosixPath(src)
+        return [
+            self.pull(path, dest / path.relative_to(src), progress_callback, size)
+            for path, size in self.remote_files(src)
+        ]
+
+    def _iter_remote(self, src: PurePosixPath, offset: int) -> Iterator[bytes]:
+        """
+            读取远端文件
+            offset 为 0 时使用 sync RECV，否则 exec dd skip 续传
+        :param src:
+        :param offset: RESUME_BS 整数倍
+        :return:
+        """
+        if offset == 0:
+            yield from self.adb_device.sync.iter_content(str(src))
+            return
+
+        conn = self.adb_device.open_transport(timeout=10)
+        try:
+            conn.send_command(
+                f"exec:dd if={shlex.quote(str(src))} bs={self.RESUME_BS} skip={offset // self.RESUME_BS} 2>/dev/null"
+            )
+            conn.check_okay()
+            while True:
+                chunk = conn.conn.recv(self.READ_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            conn.close()
+
+    def _pull_once(self, transfer: Transfer, progress_callback: Callable[[Transfer], None] | None):
+        """
+            自 .part 现有大小(按块对齐)开始拉取
+        :param transfer:
+        :param progress_callback:
+        :return:
+        """
+        part = transfer.path_part
+        offset = part.stat().st_size if part.exists() else 0
+        offset = min(offset, transfer.size) // self.RESUME_BS * self.RESUME_BS
+
+        if offset:
+            transfer.resumed_from = offset
+            logger.info(f"Resume {transfer.src} From {offset}")
+
+        with part.open('r+b' if part.exists() else 'wb') as f:
+            f.truncate(offset)
+            f.seek(offset)
+            transfer.done = offset
+
+            for chunk in self._iter_remote(transfer.src, offset):
+                if transfer.cancel_event.is_set():
+                    return
+                f.write(chunk)
+                transfer.done += len(chunk)
+                if progress_callback:
+                    progress_callback(transfer)
+
+    def _run(self, transfer: Transfer, progress_callback: Callable[[Transfer], None] | None) -> Transfer:
+        """
+            传输线程，断线重试续传并校验
+        :param transfer:
+        :param progress_callback:
+        :return:
+        """
+        transfer.status = Transfer.STATUS_RUNNING
+        transfer.dest.parent.mkdir(parents=True, exist_ok=True)
+
+        while True:
+            try:
+                if transfer.size < 0:
+                    transfer.size = self.remote_size(transfer.src)
+
+                self._pull_once(transfer, progress_callback)
+
+                if transfer.cancel_event.is_set():
+                    transfer.status = Transfer.STATUS_CANCELLED
+                    break
+
+                if transfer.done != transfer.size:
+                    raise AdbError(f"Size Mismatch {transfer.done} != {transfer.size}")
+
+                break
+
+            except (AdbError, OSError, ValueError) as e:
+                transfer.retries += 1
+                if transfer.retries > self.max_retries or transfer.cancel_event.is_set():
+                    transfer.status = Transfer.STATUS_FAILED
+                    transfer.error = str(e)
+                    break
+                logger.warning(f"Pull {transfer.src} Error => {e}, Retry {transfer.retries}/{self.max_retries}")
+                time.sleep(self.RETRY_SEC)
+
+        if transfer.status == Transfer.STATUS_RUNNING:
+            try:
+                if self.verify and self.remote_md5(transfer.src) != self.local_md5(transfer.path_part):
+                    # 校验失败，丢弃后不再续传
+                    transfer.path_part.unlink()
+                    raise AdbError('md5 Mismatch')
+
+                transfer.path_part.replace(transfer.dest)
+                transfer.status = Transfer.STATUS_DONE
+
+            except (AdbError, OSError) as e:
+                transfer.status = Transfer.STATUS_FAILED
+                transfer.error = str(e)
+
+        if transfer.status == Transfer.STATUS_FAILED:
+            logger.error(f"Pull {transfer.src} Failed => {transfer.error}")
+        elif transfer.status == Transfer.STATUS_DONE:
+            logger.success(f"Pulled {transfer.src} => {transfer.dest}")
+
+        if progress_callback:
+            progress_callback(transfer)
+
+        return transfer
+
+    def cancel_all(self):
+        for transfer in self.transfers:
+            if not transfer.is_finished:
+                transfer.cancel()
+
+    def clear_finished(self):
+        self.transfers = [_ for _ in self.transfers if not _.is_finished]
+
+    def summary(self) -> tuple[int, int, int, int]:
+        """
+            汇总
+        :return: 已传输字节, 总字节, 完成数, 总数
+        """
+        transfers = list(self.transfers)
+        return (
+            sum(_.done for _ in transfers), sum(max(_.size, 0) for _ in transfers),
+            sum(_.is_finished for _ in transfers), len(transfers)
+        )
+
+    def shutdown(self):
+        self.cancel_all()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+if __name__ == '__main__':
+    """
+        DEMO Here
+    """
+    import tempfile
+    from adbutils import adb
+
+    devices = adb.device_list()
+    if devices:
+        tm = TransferManager(devices[0])
+        with tempfile.TemporaryDirectory() as tmp:
+            t = time.perf_counter()
+            futures = tm.pull_dir('/sdcard/DCIM', Path(tmp))
+            results = [_.result() for _ in futures]
+            done, total, *_ = tm.summary()
+            print(
+                f"{sum(_.status == Transfer.STATUS_DONE for _ in results)}/{len(results)} files "
+                f"{done / 1024 / 1024:.1f} MB in {time.perf_counter() - t:.2f}s"
+            )
+        tm.shutdown()
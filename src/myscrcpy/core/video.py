@@ -5,6 +5,12 @@
     视频相关类
 
     Log:
+        2026-10-19 3.3.0 Me2sY
+            1.支持 multiplex 连接，socket 断开时结束主进程
+            2.记录解码耗时及帧数指标
+            3.新增 display_state，由帧尺寸变化推断方向
+            4.VideoArgs 新增 video_bit_rate，VideoAdapter 支持共享解码 executor
+
         2025-04-23 3.2.0 Me2sY  优化关闭逻辑，避免卡线程
 
         2024-09-23 1.6.0 Me2sY  新增更新 Callback 方法
@@ -17,7 +23,7 @@
 """
 
 __author__ = 'Me2sY'
-__version__ = '3.2.0'
+__version__ = '3.3.0'
 
 __all__ = [
     'CameraArgs', 'VideoArgs',
@@ -28,6 +34,7 @@ import socket
 import struct
 import threading
 import time
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from typing import ClassVar, Tuple, Callable
 
@@ -40,6 +47,8 @@ from loguru import logger
 from myscrcpy.core.args_cls import ScrcpyConnectArgs
 from myscrcpy.core.adapter_cls import ScrcpyAdapter
 from myscrcpy.core.connection import Connection
+from myscrcpy.core.display import DisplayState
+from myscrcpy.core.metrics import METRICS
 from myscrcpy.utils import Coordinate
 
 
@@ -112,11 +121,15 @@ class VideoArgs(ScrcpyConnectArgs):
     video_codec: str = CODEC_H264
     video_source: str = SOURCE_DISPLAY
     camera: CameraArgs | None = None
+    video_bit_rate: int = 0             # bps, 0 使用 Server 默认值 8Mbps
 
     def __post_init__(self):
         if self.fps < 1:
             raise ValueError("fps must be greater than 0")
 
+        if self.video_bit_rate < 0:
+            raise ValueError("video_bit_rate must be >= 0")
+
         if self.video_codec not in [self.CODEC_H264, self.CODEC_H265]:
             raise ValueError("Video codec not supported")
 
@@ -135,6 +148,9 @@ class VideoArgs(ScrcpyConnectArgs):
             f"video_codec={self.video_codec}",
             f"video_source={self.video_source}",
         ]
+        if self.video_bit_rate > 0:
+            args.append(f"video_bit_rate={self.video_bit_rate}")
+
         if self.video_source == VideoArgs.SOURCE_CAMERA and self.camera:
             args += self.camera.to_args()
 
@@ -150,6 +166,7 @@ class VideoArgs(ScrcpyConnectArgs):
             video_codec=kwargs.get("video_codec", "h264"),
             video_source=kwargs.get("video_source", "camera"),
             camera=CameraArgs.load(**kwargs) if kwargs.get("video_source") == 'camera' else None,
+            video_bit_rate=kwargs.get("video_bit_rate", 0),
         )
 
     def dump(self) -> dict:
@@ -159,7 +176,8 @@ class VideoArgs(ScrcpyConnectArgs):
             'fps': self.fps,
             'buffer_size': self.buffer_size,
             'video_codec': self.video_codec,
-            'video_source': self.video_source
+            'video_source': self.video_source,
+            'video_bit_rate': self.video_bit_rate
         }
         if self.camera:
             d.update(self.camera.dump())
@@ -176,11 +194,17 @@ class VideoAdapter(ScrcpyAdapter):
         VideoArgs.CODEC_H265: 'hevc',     # FFmpeg h265 codec name is hevc
     }
 
-    def __init__(self, connection: Connection, frame_update_callback: Callable = None):
+    def __init__(
+            self, connection: Connection, frame_update_callback: Callable = None,
+            display_state: DisplayState | None = None, decode_executor: Executor | None = None
+    ):
         """
             实现视频解码，转换为 np.ndarray/av.VideoFrame/PIL.Image
 
         :param connection:
+        :param frame_update_callback:
+        :param display_state: 屏幕状态，Session 中与 ControlAdapter 共用
+        :param decode_executor: 共享解码 executor，多设备时限制解码并发，None 时于读取线程中解码
         """
         super().__init__(connection)
 
@@ -189,6 +213,9 @@ class VideoAdapter(ScrcpyAdapter):
 
         self.frame_update_callback: Callable = frame_update_callback
 
+        self.display_state = DisplayState() if display_state is None else display_state
+        self.decode_executor = decode_executor
+
     def start(self, adb_device: AdbDevice, *args, **kwargs) -> bool:
         """
             启动解析
@@ -201,13 +228,16 @@ class VideoAdapter(ScrcpyAdapter):
             return True
 
         # Make Connection
-        if self.conn.connect(adb_device):
+        # 2026-10-19 3.3.0 Me2sY  multiplex 模式下连接已由 Session 建立
+        if self.conn.is_connected or self.conn.connect(adb_device):
 
             # 2024-09-09 1.5.8 Me2sY  分离
             self.is_running, video_c = self.decode_header(self.conn.socket)
             if not self.is_running:
                 return False
 
+            self.display_state.update_frame(*video_c[1].t)
+
             threading.Thread(target=self.main_thread).start()
             retry = 0
             while not self.is_ready:
@@ -259,6 +289,10 @@ class VideoAdapter(ScrcpyAdapter):
         (width, height,) = struct.unpack('>II', socket_conn.recv(8))
         return True, (_video_codec, Coordinate(width, height))
 
+    @staticmethod
+    def _decode(code_context: av.CodecContext, data: bytes) -> list:
+        return [_frame for packet in code_context.parse(data) for _frame in code_context.decode(packet)]
+
     def main_thread(self):
         """
             解析主进程，读取Scrcpy视频流
@@ -267,17 +301,33 @@ class VideoAdapter(ScrcpyAdapter):
 
         code_context = av.CodecContext.create(self.CODEC_AV_MAP.get(self.conn.args.video_codec), 'r')
 
-        while self.is_running:
+        m_decode = METRICS.histogram('video_decode_ms', **self.conn.metric_labels)
+        m_frames = METRICS.counter('video_frames_total', **self.conn.metric_labels)
+
+        update_frame = self.display_state.update_frame
+
+        while self.is_running and not self.conn.is_lost:
             try:
-                packets = code_context.parse(self.conn.recv(self.conn.args.buffer_size))
-                for packet in packets:
-                    for _frame in code_context.decode(packet):
-                        self._last_frame = _frame
-                        self.frame_n += 1
-                        if self.frame_update_callback:
-                            threading.Thread(
-                                target=self.frame_update_callback, args=[self._last_frame, self.frame_n]
-                            ).start()
+                data = self.conn.recv(self.conn.args.buffer_size)
+                t = time.perf_counter()
+
+                # 同一 code_context 须按序解码，提交后等待结果
+                if self.decode_executor is None:
+                    frames = self._decode(code_context, data)
+                else:
+                    frames = self.decode_executor.submit(self._decode, code_context, data).result()
+
+                for _frame in frames:
+                    self._last_frame = _frame
+                    self.frame_n += 1
+                    m_frames.inc()
+                    update_frame(_frame.width, _frame.height)
+                    if self.frame_update_callback:
+                        threading.Thread(
+                            target=self.frame_update_callback, args=[self._last_frame, self.frame_n]
+                        ).start()
+                if frames:
+                    m_decode.observe((time.perf_counter() - t) * 1000)
 
             except OSError as e:
                 ...
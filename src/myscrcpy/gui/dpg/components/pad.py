@@ -4,6 +4,10 @@
     ~~~~~~~~~~~~~~~~~~
 
     Log:
+        2026-10-19 1.7.2 Me2sY
+            1. CPMFilePad 下载改用 TransferManager，显示进度，支持取消及续传
+            2. CPMFilePad 使用目录缓存，分页绘制大目录，过滤于本地完成
+
         2024-09-23 1.6.0 Me2sY  新增底部状态及日志栏
 
         2024-09-10 1.5.9 Me2sY  新增文件管理器
@@ -22,7 +26,7 @@
 """
 
 __author__ = 'Me2sY'
-__version__ = '1.6.0'
+__version__ = '1.7.2'
 
 __all__ = [
     'CPMPad',
@@ -32,9 +36,7 @@ __all__ = [
 ]
 
 import datetime
-import pathlib
 import stat
-import threading
 import time
 from typing import Callable
 import webbrowser
@@ -45,7 +47,7 @@ import dearpygui.dearpygui as dpg
 
 from myscrcpy.utils import ADBKeyCode, Param
 from myscrcpy.gui.dpg.components.component_cls import Component, TempModal
-from myscrcpy.core import AdvDevice
+from myscrcpy.core import AdvDevice, Transfer
 
 
 class CPMPad(Component):
@@ -202,8 +204,21 @@ class CPMFilePad(CPMPad):
     """
         文件管理面板
     """
+
+    PROGRESS_INTERVAL = 0.1
+    PAGE_SIZE = 200
+
     def setup_inner(self, *args, **kwargs):
 
+        self._t_progress = 0
+        self.tag_pb = dpg.generate_uuid()
+        self.tag_row_more = dpg.generate_uuid()
+
+        self.files = []
+        self.files_shown = []
+        self._listing_pending = None
+        self.n_drawn = 0
+
         self.tag_filter = dpg.generate_uuid()
         self.tag_table = dpg.generate_uuid()
 
@@ -250,22 +265,19 @@ class CPMFilePad(CPMPad):
             with dpg.tooltip(dpg.last_item()):
                 dpg.add_text('Unselect All')
 
-            self.tag_filter = dpg.add_input_text(
-                label="Filter", user_data=self.tag_table, width=-40,
-                callback=lambda s, a, u: dpg.set_value(self.tag_table, dpg.get_value(s))
+            dpg.add_input_text(
+                tag=self.tag_filter, label="Filter", width=-40, callback=lambda s, a, u: self.draw_rows()
             )
 
         # Path
         with dpg.group(horizontal=True):
-            dpg.add_button(label='R', callback=self.draw_path)
+            dpg.add_button(label='R', callback=lambda: self.draw_path(refresh=True))
             with dpg.tooltip(dpg.last_item()):
                 dpg.add_text('Reload Path')
 
             dpg.add_button(
                 label='..', user_data='..', width=40,
-                callback=lambda s, a, u: self.open_dir(s, a, u) or
-                                         dpg.set_value(self.tag_filter, '') or
-                                         dpg.set_value(self.tag_table, '')
+                callback=lambda s, a, u: dpg.set_value(self.tag_filter, '') or self.open_dir(s, a, u)
             )
 
             # Current Path
@@ -273,9 +285,16 @@ class CPMFilePad(CPMPad):
             with dpg.tooltip(self.tag_path_cur):
                 self.tag_path_full = dpg.add_text('')
 
+        # Transfer Progress
+        with dpg.group(horizontal=True):
+            dpg.add_progress_bar(tag=self.tag_pb, default_value=0, overlay='No Transfer', width=-40)
+            dpg.add_button(label='X', callback=lambda: self.fm.transfer.cancel_all())
+            with dpg.tooltip(dpg.last_item()):
+                dpg.add_text('Cancel Transfers')
+
         dpg.add_separator()
 
-        with dpg.table(tag=self.tag_table, delay_search=True):
+        with dpg.table(tag=self.tag_table, clipper=True):
             dpg.add_table_column(label='cb', parent=self.tag_table, init_width_or_weight=0.1)
             dpg.add_table_column(label='path', parent=self.tag_table)
 
@@ -294,14 +313,12 @@ class CPMFilePad(CPMPad):
         self.fm = self.adv_device.file_manager
         self.draw_path()
 
-    def draw_path(self):
+    def draw_path(self, refresh: bool = False):
         """
             更新路径显示窗口
+        :param refresh: 忽略目录缓存
         :return:
         """
-        self.all_cb = set()
-        self.selected(None, None, None)
-
         # 显示当前路径
         path_cur = self.fm.path_cur.__str__()
         if len(path_cur) > 20:
@@ -312,55 +329,116 @@ class CPMFilePad(CPMPad):
         dpg.set_value(self.tag_path_cur, path_cur)
         dpg.set_value(self.tag_path_full, self.fm.path_cur.__str__())
 
-        # 加载路径文件列表
-        fs = self.fm.ls()
+        # 加载路径文件列表，缓存命中时后台校验，变化后重绘
+        self.files = self.fm.ls(refresh=refresh, revalidate_callback=self.listing_changed)
+        self.draw_rows()
+
+    def listing_changed(self, path, files):
+        """
+            目录缓存校验发现变化
+            于 FileManager 校验线程中回调，交由下一帧回调重绘，与界面回调串行
+        :param path:
+        :param files:
+        :return:
+        """
+        self._listing_pending = (path, files)
+        dpg.set_frame_callback(dpg.get_frame_count() + 1, self._apply_listing)
+
+    def _apply_listing(self, *args):
+        """
+            应用校验后的目录列表
+        :return:
+        """
+        pending, self._listing_pending = self._listing_pending, None
+        if pending is not None and pending[0] == self.fm.path_cur:
+            self.files = pending[1]
+            self.draw_rows()
+
+    def draw_rows(self):
+        """
+            按过滤条件重绘表格，首屏仅绘制 PAGE_SIZE 行
+        :return:
+        """
+        self.all_cb = set()
+        self.selected(None, None, None)
+
+        key = dpg.get_value(self.tag_filter).lower()
+        self.files_shown = [_ for _ in self.files if key in _.path.lower()] if key else self.files
 
         # 清空并绘制表格
         dpg.delete_item(self.tag_table, children_only=True, slot=1)
+        self.n_drawn = 0
+        self.draw_more()
 
-        for ind, _ in enumerate(fs):
+    def draw_more(self):
+        """
+            追加绘制下一页
+        :return:
+        """
+        if dpg.does_item_exist(self.tag_row_more):
+            dpg.delete_item(self.tag_row_more)
 
-            abs_path = self.fm.path_cur / _.path
+        start, end = self.n_drawn, min(self.n_drawn + self.PAGE_SIZE, len(self.files_shown))
+        for ind in range(start, end):
+            self.draw_row(ind, self.files_shown[ind])
+        self.n_drawn = end
 
-            with dpg.table_row(filter_key=f"{_.path}", parent=self.tag_table) as tag_row:
+        remain = len(self.files_shown) - self.n_drawn
+        if remain > 0:
+            with dpg.table_row(parent=self.tag_table, tag=self.tag_row_more):
+                dpg.add_text('')
+                dpg.add_button(label=f"More ({remain})", width=-1, callback=lambda: self.draw_more())
 
-                # column function
-                tag_sel = dpg.add_selectable(
-                    label=str(ind + 1), default_value=False, user_data=(abs_path, ind),
-                    callback=lambda s, a, u: self.selected(s, a, u) or self.highlight(s, a, u)
-                )
-                with dpg.popup(tag_sel):
-                    dpg.add_text(default_value=abs_path.__str__())
-                    dpg.add_separator()
-
-                    if stat.S_ISREG(_.mode) and _.size < Param.OPEN_MAX_SIZE:
-                        dpg.add_selectable(
-                            label='Open', user_data=abs_path,
-                            callback=lambda s, a, u: self.open_file(u) or dpg.set_value(s, False)
-                        )
-                    dpg.add_selectable(
-                        label='Download', user_data=abs_path,
-                        callback=lambda s, a, u: self.download(u) or dpg.set_value(s, False)
-                    )
-                    dpg.add_selectable(
-                        label='Delete', user_data=abs_path,
-                        callback=lambda s, a, u: self.rm(u) or dpg.set_value(s, False)
-                    )
+    def draw_row(self, ind: int, file_info):
+        """
+            绘制单行
+        :param ind:
+        :param file_info:
+        :return:
+        """
+        _ = file_info
+
+        abs_path = self.fm.path_cur / _.path
 
-                self.all_cb.add(tag_sel)
-                self.highlight(tag_sel, False, (abs_path, ind))
+        with dpg.table_row(parent=self.tag_table):
+
+            # column function
+            tag_sel = dpg.add_selectable(
+                label=str(ind + 1), default_value=False, user_data=(abs_path, ind),
+                callback=lambda s, a, u: self.selected(s, a, u) or self.highlight(s, a, u)
+            )
+            with dpg.popup(tag_sel):
+                dpg.add_text(default_value=abs_path.__str__())
+                dpg.add_separator()
 
-                # column path
-                if stat.S_ISDIR(_.mode) or stat.S_ISLNK(_.mode):
+                if stat.S_ISREG(_.mode) and _.size < Param.OPEN_MAX_SIZE:
                     dpg.add_selectable(
-                        label=f"> {_.path}", default_value=False, user_data=abs_path,
-                        callback=lambda s, a, u: self.open_dir(s, a, u)
+                        label='Open', user_data=abs_path,
+                        callback=lambda s, a, u: self.open_file(u) or dpg.set_value(s, False)
                     )
-                else:
-                    dpg.add_text(default_value=f"{_.path}")
+                dpg.add_selectable(
+                    label='Download', user_data=abs_path,
+                    callback=lambda s, a, u: self.download(u) or dpg.set_value(s, False)
+                )
+                dpg.add_selectable(
+                    label='Delete', user_data=abs_path,
+                    callback=lambda s, a, u: self.rm(u) or dpg.set_value(s, False)
+                )
 
-                with dpg.tooltip(dpg.last_item()):
-                    dpg.add_text(f"{stat.filemode(_.mode)} | {_.mtime} | {_.size} | {_.path}")
+            self.all_cb.add(tag_sel)
+            self.highlight(tag_sel, False, (abs_path, ind))
+
+            # column path
+            if stat.S_ISDIR(_.mode) or stat.S_ISLNK(_.mode):
+                dpg.add_selectable(
+                    label=f"> {_.path}", default_value=False, user_data=abs_path,
+                    callback=lambda s, a, u: self.open_dir(s, a, u)
+                )
+            else:
+                dpg.add_text(default_value=f"{_.path}")
+
+            with dpg.tooltip(dpg.last_item()):
+                dpg.add_text(f"{stat.filemode(_.mode)} | {_.mtime} | {_.size} | {_.path}")
 
     def upload(self):
         """
@@ -369,11 +447,33 @@ class CPMFilePad(CPMPad):
         :return:
         """
         self.fm.push_clipboard_to_device(self.fm.path_cur)
-        self.draw_path()
+        self.fm.invalidate(self.fm.path_cur)
+        self.draw_path(refresh=True)
+
+    def transfer_progress(self, transfer: Transfer):
+        """
+            传输进度回调，于传输线程中执行，限制刷新频率
+        :param transfer:
+        :return:
+        """
+        now = time.perf_counter()
+        if not transfer.is_finished and now - self._t_progress < self.PROGRESS_INTERVAL:
+            return
+        self._t_progress = now
+
+        done, total, finished, n = self.fm.transfer.summary()
+        dpg.set_value(self.tag_pb, 1.0 if total == 0 else done / total)
+        dpg.configure_item(
+            self.tag_pb, overlay=f"{finished}/{n} | {done / 1024 / 1024:.1f}/{total / 1024 / 1024:.1f} MB"
+        )
+
+        if transfer.is_finished and transfer.status != Transfer.STATUS_DONE:
+            logger.warning(f"{transfer.src} {transfer.status} {transfer.error}")
 
     def download(self, file_path):
         """
             下载文件
+            后台并发下载，中断后再次下载将自 .part 续传
         :param file_path:
         :return:
         """
@@ -382,23 +482,21 @@ class CPMFilePad(CPMPad):
 
         file_stat = self.adv_device.adb_dev.sync.stat(file_path.__str__())
         if stat.S_ISDIR(file_stat.mode):
-            path_base = path_download / file_path.name
-            path_base.mkdir(parents=True, exist_ok=True)
-            self.adv_device.adb_dev.sync.pull_dir(file_path.__str__(), path_base)
-            logger.success(f"Dir {file_path} Download to {path_download}")
+            futures = self.fm.pull_dir(file_path, path_download / file_path.name, self.transfer_progress)
+            logger.info(f"Dir {file_path} {len(futures)} Files Downloading to {path_download}")
         elif stat.S_ISREG(file_stat.mode):
-            self.adv_device.adb_dev.sync.pull(file_path.__str__(), path_download / file_path.name)
-            logger.success(f"File {file_path} Download to {path_download}")
+            self.fm.transfer.pull(file_path, path_download / file_path.name, self.transfer_progress)
+            logger.info(f"File {file_path} Downloading to {path_download}")
 
     def download_selected(self):
         """
             下载选中文件
         :return:
         """
+        self.fm.transfer.clear_finished()
         for _ in self.all_cb:
             if dpg.get_value(_):
                 self.download(dpg.get_item_user_data(_)[0])
-        self.draw_path()
 
     def rm_selected(self):
         """
@@ -499,36 +597,21 @@ class CPMFilePad(CPMPad):
     def open_file(self, file_path):
         """
             本地打开文件
-            下载文件至临时目录，并打开
+            下载文件至临时目录，完成后打开
         :param file_path:
         :return:
         """
         path_temp = Param.PATH_TEMP / self.adv_device.serial_no
         path_temp.mkdir(parents=True, exist_ok=True)
 
-        path_save = path_temp / file_path.name
-
-        file_info = self.adv_device.adb_dev.sync.stat(file_path.__str__())
-
-        self.adv_device.adb_dev.sync.pull(file_path.__str__(), path_save)
-        threading.Thread(target=self._open, args=(path_save, file_info.size,)).start()
+        def _open(future):
+            transfer = future.result()
+            if transfer.status == Transfer.STATUS_DONE:
+                webbrowser.open(transfer.dest.__str__())
+            else:
+                logger.error(f"File Download Failed => {transfer.error}")
 
-    def _open(self, path_save: pathlib.Path, file_size: int):
-        """
-            使用线程打开，避免大文件导致下载时间过长
-        :param path_save:
-        :param file_size:
-        :return:
-        """
-        retry_n = file_size // (1024 * 1024) + 5
-        while path_save.stat().st_size != file_size:
-            time.sleep(1)
-            logger.warning(f"File Still Downloading...")
-            retry_n -= 1
-            if retry_n == 0:
-                logger.error(f"File Download Failed")
-                return
-        webbrowser.open(path_save.__str__())
+        self.fm.transfer.pull(file_path, path_temp / file_path.name, self.transfer_progress).add_done_callback(_open)
 
 
 @dataclass
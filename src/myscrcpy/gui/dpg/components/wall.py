@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+"""
+    Wall Component
+    ~~~~~~~~~~~~~~~~~~
+    多设备墙
+    各设备以小尺寸、低帧率连接，共用解码线程池
+    全部画面合成至同一 raw_texture，仅刷新帧号变化的格子，点击格子升级为完整 Session
+
+    Log:
+        2026-10-19 1.7.2 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '1.7.2'
+
+__all__ = [
+    'WallCompositor', 'WallTile', 'WinWall'
+]
+
+from concurrent.futures import ThreadPoolExecutor
+import math
+import os
+import threading
+import time
+from typing import Callable, List
+
+import dearpygui.dearpygui as dpg
+from loguru import logger
+import numpy as np
+
+from myscrcpy.core import *
+from myscrcpy.utils import Coordinate
+
+
+class WallCompositor:
+    """
+        格子合成器
+        buffer 为 (H, W, 3) float32 0..1，直接作为 DPG raw_texture 数据源
+        写入均为 buffer 切片原地运算，不产生整幅临时数组
+    """
+
+    def __init__(self, n: int, tile: Coordinate, bg: float = 0.12):
+        """
+            合成器
+        :param n: 格子数
+        :param tile: 格子尺寸
+        :param bg: 背景灰度 0..1
+        """
+        self.n = n
+        self.cols = max(1, math.ceil(math.sqrt(n)))
+        self.rows = max(1, math.ceil(n / self.cols))
+        self.tile = tile
+        self.bg = np.float32(bg)
+
+        self.coord = Coordinate(self.cols * tile.width, self.rows * tile.height)
+        self.buffer = np.full((self.coord.height, self.coord.width, 3), self.bg, dtype=np.float32)
+
+        # 各格子当前画面尺寸，尺寸变化(旋转)时先清空格子
+        self.shapes: List[tuple | None] = [None] * n
+
+    @property
+    def flat(self) -> np.ndarray:
+        """
+            1D 视图，与 buffer 共享内存
+        :return:
+        """
+        return self.buffer.reshape(-1)
+
+    def origin(self, index: int) -> tuple[int, int]:
+        """
+            格子左上角
+        :param index:
+        :return: x, y
+        """
+        return (index % self.cols) * self.tile.width, (index // self.cols) * self.tile.height
+
+    def index_at(self, x: float, y: float) -> int | None:
+        """
+            坐标所在格子
+        :param x:
+        :param y:
+        :return:
+        """
+        if x < 0 or y < 0:
+            return None
+        col, row = int(x // self.tile.width), int(y // self.tile.height)
+        if col >= self.cols or row >= self.rows:
+            return None
+        index = row * self.cols + col
+        return index if index < self.n else None
+
+    def fit(self, coord: Coordinate) -> Coordinate:
+        """
+            画面缩放至格子内尺寸
+        :param coord:
+        :return:
+        """
+        return coord.get_max_coordinate(self.tile.width, self.tile.height)
+
+    def clear(self, index: int, value: float | None = None):
+        """
+            清空格子
+        :param index:
+        :param value:
+        :return:
+        """
+        x, y = self.origin(index)
+        self.buffer[y:y + self.tile.height, x:x + self.tile.width] = self.bg if value is None else value
+        self.shapes[index] = None
+
+    def blit(self, index: int, rgb: np.ndarray):
+        """
+            写入格子，居中
+        :param index:
+        :param rgb: (h, w, 3) uint8，尺寸不大于格子
+        :return:
+        """
+        h, w = rgb.shape[:2]
+        if self.shapes[index] != (h, w):
+            self.clear(index)
+            self.shapes[index] = (h, w)
+
+        x, y = self.origin(index)
+        x += (self.tile.width - w) // 2
+        y += (self.tile.height - h) // 2
+
+        np.multiply(rgb, np.float32(1 / 255), out=self.buffer[y:y + h, x:x + w], casting='unsafe')
+
+
+class WallTile:
+    """
+        墙中单个设备
+    """
+
+    def __init__(self, device: AdvDevice):
+        self.device = device
+        self.session: Session | None = None
+        self.frame_n = -1
+
+    def start(self, video_args: VideoArgs, decode_executor) -> bool:
+        """
+            以低分辨率仅连接视频
+        :param video_args:
+        :param decode_executor:
+        :return:
+        """
+        try:
+            self.session = Session(self.device.adb_dev, video_args=video_args, decode_executor=decode_executor)
+        except Exception as e:
+            logger.warning(f"Wall Tile {self.device.serial_no} Connect Failed => {e}")
+            self.session = None
+        return self.session is not None and self.session.is_video_ready
+
+    def stop(self):
+        if self.session is not None:
+            self.session.disconnect()
+        self.session = None
+        self.frame_n = -1
+
+    def new_frame(self):
+        """
+            帧号变化时返回最新帧
+        :return: av.VideoFrame | None
+        """
+        if self.session is None or not self.session.is_video_ready:
+            return None
+
+        va = self.session.va
+        if va.frame_n == self.frame_n:
+            return None
+
+        self.frame_n = va.frame_n
+        return va.get_video_frame()
+
+
+class WinWall:
+    """
+        多设备墙窗口
+    """
+
+    def __init__(
+            self,
+            devices: List[AdvDevice],
+            tile_size: int = 320,
+            fps: int = 15,
+            select_callback: Callable[[AdvDevice], None] | None = None,
+            decode_workers: int = max(1, (os.cpu_count() or 2) // 2)
+    ):
+        """
+            设备墙
+        :param devices:
+        :param tile_size: 格子边长，即各设备 max_size
+        :param fps: 各设备帧率及合成刷新率
+        :param select_callback: 点击格子回调，用于升级为完整 Session
+        :param decode_workers: 共用解码线程数
+        """
+        self.tiles = [WallTile(_) for _ in devices]
+        self.fps = fps
+        self.select_callback = select_callback
+
+        self.video_args = VideoArgs(max_size=tile_size, fps=fps)
+        self.compositor = WallCompositor(len(self.tiles), Coordinate(tile_size, tile_size))
+
+        self.decode_pool = ThreadPoolExecutor(max_workers=decode_workers, thread_name_prefix='wall_decode')
+
+        self.tag_window = dpg.generate_uuid()
+        self.tag_texture = dpg.generate_uuid()
+        self.tag_dl = dpg.generate_uuid()
+        self.tag_hr = dpg.generate_uuid()
+
+        self.is_running = False
+
+    def draw(self):
+        """
+            绘制窗口并启动
+        :return:
+        """
+        coord = self.compositor.coord
+
+        # raw_texture 持有 buffer 引用，原地写入即可，无需 set_value
+        with dpg.texture_registry(show=False):
+            dpg.add_raw_texture(
+                **coord.d, tag=self.tag_texture, default_value=self.compositor.flat, format=dpg.mvFormat_Float_rgb
+            )
+
+        with dpg.window(
+                label=f"Wall - {len(self.tiles)} Devices", tag=self.tag_window,
+                width=coord.width + 16, height=coord.height + 40, on_close=self.close
+        ):
+            with dpg.drawlist(tag=self.tag_dl, **coord.d):
+                dpg.draw_image(self.tag_texture, pmin=(0, 0), pmax=coord)
+                for index, tile in enumerate(self.tiles):
+                    x, y = self.compositor.origin(index)
+                    dpg.draw_rectangle((x, y), (x + self.compositor.tile.width, y + self.compositor.tile.height))
+                    dpg.draw_text((x + 4, y + 2), tile.device.serial_no, size=14)
+
+        with dpg.item_handler_registry(tag=self.tag_hr):
+            dpg.add_item_clicked_handler(callback=self.clicked)
+        dpg.bind_item_handler_registry(self.tag_dl, self.tag_hr)
+
+        self.is_running = True
+        threading.Thread(target=self._start_tiles, daemon=True).start()
+        threading.Thread(target=self._thread_composite, daemon=True).start()
+        return self
+
+    def _start_tiles(self):
+        """
+            并行连接各设备
+        :return:
+        """
+        with ThreadPoolExecutor(max_workers=8, thread_name_prefix='wall_start') as executor:
+            results = list(executor.map(lambda _: _.start(self.video_args, self.decode_pool), self.tiles))
+        logger.success(f"Wall {sum(results)}/{len(results)} Devices Ready")
+
+    def _thread_composite(self):
+        """
+            按帧率合成，仅刷新新帧格子
+        :return:
+        """
+        interval = 1 / self.fps
+        while self.is_running:
+            t = time.perf_counter()
+            for index, tile in enumerate(self.tiles):
+                frame = tile.new_frame()
+                if frame is None:
+                    continue
+                try:
+                    _c = self.compositor.fit(Coordinate(frame.width, frame.height))
+                    self.compositor.blit(
+                        index, frame.reformat(width=_c.width, height=_c.height, format='rgb24').to_ndarray()
+                    )
+                except Exception as e:
+                    logger.warning(f"Wall Tile {tile.device.serial_no} Composite Error => {e}")
+
+            time.sleep(max(0.0, interval - (time.perf_counter() - t)))
+
+    def clicked(self, sender, app_data):
+        """
+            点击格子，释放低分辨率连接并回调升级
+        :param sender:
+        :param app_data:
+        :return:
+        """
+        index = self.compositor.index_at(*dpg.get_drawing_mouse_pos())
+        if index is None:
+            return
+
+        tile = self.tiles[index]
+        logger.info(f"Wall Upgrade {tile.device.serial_no}")
+
+        tile.stop()
+        self.compositor.clear(index, value=0.3)
+
+        if self.select_callback:
+            self.select_callback(tile.device)
+
+    def close(self):
+        """
+            关闭全部连接及窗口
+        :return:
+        """
+        self.is_running = False
+        for tile in self.tiles:
+            tile.stop()
+        self.decode_pool.shutdown(wait=False, cancel_futures=True)
+
+        for tag in (self.tag_hr, self.tag_window, self.tag_texture):
+            if dpg.does_item_exist(tag):
+                dpg.delete_item(tag)
+
+
+if __name__ == '__main__':
+    """
+        DEMO Here
+        合成耗时对比: 每帧整幅 float 转换 vs 仅刷新变化格子
+    """
+    import av
+
+    n, tile_size = 16, 320
+    wc = WallCompositor(n, Coordinate(tile_size, tile_size))
+    src = av.VideoFrame.from_ndarray(
+        np.random.randint(0, 255, (720, 1600, 3), dtype=np.uint8), format='rgb24'
+    )
+
+    loops = 30
+
+    t = time.perf_counter()
+    for _ in range(loops):
+        for i in range(n):
+            _c = wc.fit(Coordinate(src.width, src.height))
+            wc.blit(i, src.reformat(width=_c.width, height=_c.height, format='rgb24').to_ndarray())
+    t_all = (time.perf_counter() - t) / loops * 1000
+
+    t = time.perf_counter()
+    for _ in range(loops):
+        for i in range(n // 4):
+            _c = wc.fit(Coordinate(src.width, src.height))
+            wc.blit(i, src.reformat(width=_c.width, height=_c.height, format='rgb24').to_ndarray())
+    t_quarter = (time.perf_counter() - t) / loops * 1000
+
+    t = time.perf_counter()
+    for _ in range(loops):
+        for i in range(n):
+            src.to_ndarray(format='rgb24').ravel() / np.float32(255)
+    t_full = (time.perf_counter() - t) / loops * 1000
+
+    print(
+        f"{n} tiles {wc.coord} | all changed {t_all:.2f} ms | 1/4 changed {t_quarter:.2f} ms "
+        f"| {n} full-res textures {t_full:.2f} ms"
+    )
@@ -4,6 +4,8 @@
     ~~~~~~~~~~~~~~~~~~~~~
 
     Log:
+        2026-10-19 1.7.2 Me2sY  新增 设备墙，点击格子升级为完整 Session
+
         2024-11-09 1.7.1 Me2sY
             1. 修复因快速发送ADB命令产生的延迟导致的DPG崩溃
 
@@ -95,7 +97,7 @@
 """
 
 __author__ = 'Me2sY'
-__version__ = '1.6.4'
+__version__ = '1.7.2'
 
 __all__ = ['start_dpg_adv']
 
@@ -123,6 +125,7 @@ from myscrcpy.gui.dpg.components.device import WinDevices
 from myscrcpy.gui.dpg.components.vc import VideoController, CPMVC
 from myscrcpy.gui.dpg.components.pad import *
 from myscrcpy.gui.dpg.components.scrcpy_cfg import CPMScrcpyCfgController
+from myscrcpy.gui.dpg.components.wall import WinWall
 from myscrcpy.gui.dpg.mouse_handler import *
 from myscrcpy.gui.dpg.keyboard_handler import KeyboardHandler
 from myscrcpy.gui.gui_utils import *
@@ -179,6 +182,8 @@ class Window:
         self.mouse_handler: MouseHandler = None
         self.keyboard_handler: KeyboardHandler = None
 
+        self.wall: WinWall | None = None
+
     def vp_resize(self, old_client_coord: Coordinate, new_client_coord: Coordinate):
         """
             Viewport Resize 回调
@@ -599,6 +604,7 @@ class Window:
             with dpg.menu(label='Tools'):
                 dpg.add_menu_item(label='TPEditor', callback=self.open_win_tpeditor)
                 dpg.add_menu_item(label='GameMode', callback=self.open_pyg)
+                dpg.add_menu_item(label='Wall', callback=self.open_wall)
                 dpg.add_separator()
 
                 about_msg = (f"A Scrcpy client implemented in Python. \n"
@@ -726,6 +732,31 @@ class Window:
         else:
             logger.warning(f"Connect A Device With VideoSocket And ControlSocket First!")
 
+    def open_wall(self):
+        """
+            开启 设备墙
+        """
+        if self.wall is not None:
+            self.wall.close()
+
+        devices = [
+            _ for _ in DeviceFactory.device_list()
+            if self.device is None or _.serial_no != self.device.serial_no
+        ]
+        if len(devices) == 0:
+            logger.warning(f"No Other Device For Wall!")
+            return
+
+        self.wall = WinWall(devices, select_callback=self.wall_select).draw()
+
+    def wall_select(self, device: AdvDevice):
+        """
+            设备墙 点击格子，使用设备 default 配置建立完整 Session
+        """
+        cfg = CPMScrcpyCfgController.get_config(device.serial_no, 'default')
+        device.scrcpy_cfg = 'default'
+        self.setup_session(device, cfg if cfg else CPMScrcpyCfgController.default_cfg())
+
     def _open_pg(self, pgcw: PGControlWindow, cfg_path: pathlib.Path):
         threading.Thread(target=pgcw.run, args=(
             self.session, self.device, self.video_controller.coord_frame, cfg_path
@@ -1067,6 +1098,9 @@ def start_dpg_adv(ext_dev_path: pathlib.Path | None = None):
 
     kv_global.set('viewport_pos', {'x_pos': x, 'y_pos': y})
 
+    if wd.wall is not None:
+        wd.wall.close()
+
     DeviceFactory.close_all_devices()
 
 
@@ -5,11 +5,13 @@
     解决 AdvDevice 连接过慢问题
 
     Log:
+        2026-10-19 3.3.0 Me2sY  getprop 改用 PropStore 解析
+
         2025-05-08 3.2.0 Me2sY 创建，替换原 AdvDevice，解决连接过慢问题
 """
 
 __author__ = 'Me2sY'
-__version__ = '3.2.0'
+__version__ = '3.3.0'
 
 __all__ = [
     'DeviceConnectMode', 'PackageInfo',
@@ -29,7 +31,7 @@ from uiautomator2 import Device as U2Device
 from kivy.storage.dictstore import DictStore
 from kivy.logger import Logger
 
-from myscrcpy.utils import Param, Coordinate, ROTATION_VERTICAL, ROTATION_HORIZONTAL
+from myscrcpy.utils import Param, Coordinate, ROTATION_VERTICAL, ROTATION_HORIZONTAL, PropStore
 
 
 class DeviceConnectMode(IntEnum):
@@ -90,56 +92,19 @@ class MYDevice:
         :param u2d: U2Device
         :return:
         """
-        prop_d = {}
-
-        for _ in dev.shell('getprop', timeout=1).split('\n'):
-            _ = _.replace('\r', '')
-            if _[0] != '[' or _[-1] != ']':
-                continue
-            try:
-                k, v = _.split(': ')
-            except Exception as e:
-                continue
-
-            cmd = "prop_d"
-            for _ in k[1:-1].split('.'):
-                cmd += f".setdefault('{_}', {{}})"
-
-            cmd = cmd[:-3] + "'" + v[1:-1] + "')"
-
-            try:
-                exec(cmd)
-            except:
-                pass
+        props = PropStore.parse(dev.shell('getprop', timeout=1))
 
         device_info_u2d = u2d.device_info
         info_u2d = u2d.info
 
-        try:
-            brand = prop_d['ro']['vendor']['brand']
-        except:
-            try:
-                brand = device_info_u2d['brand']
-            except:
-                brand = ''
-
-        try:
-            model = prop_d['ro']['vendor']['model']
-        except:
-            try:
-                model = device_info_u2d['model']
-            except:
-                model = ''
+        brand = props.get('ro.vendor.brand', device_info_u2d.get('brand', ''))
+        model = props.get('ro.vendor.model', device_info_u2d.get('model', ''))
 
-        try:
-            sdk = int(prop_d['ro']['build']['version']['sdk'])
-        except:
+        sdk = props.get_int('ro.build.version.sdk')
+        if sdk is None:
             sdk = info_u2d['sdkInt']
 
-        try:
-            release = prop_d['ro']['build']['version']['release']
-        except Exception:
-            release = None
+        release = props.get('ro.build.version.release')
 
         if release is None or release == '':
             try:
@@ -153,10 +118,7 @@ class MYDevice:
 
         arch = device_info_u2d['arch']
 
-        try:
-            marketname = prop_d['ro']['product']['marketname']
-        except:
-            marketname = brand
+        marketname = props.get('ro.product.marketname', brand)
 
         return MYDeviceInfo(**{
             'brand': brand,
@@ -7,15 +7,16 @@
 
     Log:
         2024-10-27 0.1.0 Me2sY  创建
+        2026-10-19 0.2.0 Me2sY  使用 GamepadScheduler 定频发送
 """
 
 __author__ = 'Me2sY'
-__version__ = '0.1.0'
+__version__ = '0.2.0'
 
 __all__ = []
 
 
-from myscrcpy.core.control import ControlAdapter, Gamepad, ControlArgs
+from myscrcpy.core.control import ControlAdapter, GamepadScheduler, ControlArgs
 from myscrcpy.utils import UnifiedKeys
 
 import pygame
@@ -27,6 +28,9 @@ from adbutils import adb
 d = adb.device_list()[0]
 ca = ControlAdapter.connect(d, ControlArgs(screen_status=ControlArgs.STATUS_ON))
 
+# 500Hz 定频发送，仅发送状态变化
+scheduler = GamepadScheduler(ca.send_packet, poll_hz=500).start()
+
 # 初始化 pygame
 pygame.init()
 pygame.display.init()
@@ -82,13 +86,14 @@ while running:
             # 手柄连接
             if event.type == pygame.JOYDEVICEADDED:
                 joystick = pygame.joystick.Joystick(event.device_index)
-                gamepads[joystick.get_instance_id()] = (joystick, Gamepad(ca.send_packet))
+                gamepads[joystick.get_instance_id()] = (joystick, scheduler.create_gamepad())
                 logger.success(f"Gamepad {joystick.get_instance_id()} | {joystick.get_name()} Connected!")
                 continue
 
             # 手柄移除
             if event.type == pygame.JOYDEVICEREMOVED:
                 js, gp = gamepads.pop(event.instance_id)
+                scheduler.unregister(gp)
                 gp.uhid_destroy()
                 logger.warning(f"Gamepad {event.instance_id} | {js.get_name()} Destroyed!")
                 continue
@@ -110,13 +115,10 @@ while running:
             if event.type == pygame.JOYAXISMOTION:
                 gamepads[event.instance_id][1].axis_value_changed(event.axis, event.value)
 
-        # 更新当前手柄状态
-        for js, gp in gamepads.values():
-            gp.update_status()
-
     except Exception as e:
         ...
 
-    clock.tick(15)
+    clock.tick(500)
 
+scheduler.stop()
 pygame.quit()
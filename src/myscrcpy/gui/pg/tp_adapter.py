@@ -5,6 +5,11 @@
     按键映射适配器
 
     Log:
+        2026-10-19 3.3.0 Me2sY
+            1. 订阅 Session.display_state，设备旋转时同步映射方向
+            2. 加载配置时编译分发表 (按键/鼠标按键 -> TouchProxy，MOUSEMOTION 及 loop 订阅列表)
+            3. Click/Repeat/Cross/Aim 定时动作改由 DeadlineScheduler 执行，不再受 pygame 帧率限制
+
         2024-08-26 1.4.0 Me2sY  适配新Core,配置文件中 unified_key改用对应名称
 
         2024-07-31 1.1.1 Me2sY  适配新Controller
@@ -27,7 +32,7 @@
 """
 
 __author__ = 'Me2sY'
-__version__ = '1.4.0'
+__version__ = '3.3.0'
 
 __all__ = [
     'TouchType',
@@ -35,16 +40,17 @@ __all__ = [
 ]
 
 import random
+import threading
 import time
 from enum import Enum
 import pathlib
-from typing import Set
+from typing import Dict, List, Set
 
 from loguru import logger
 import pygame
 
 from myscrcpy.utils import ScalePoint, ScalePointR, Coordinate, Action, CfgHandler, UnifiedKey, UnifiedKeys, KeyMapper
-from myscrcpy.utils import ROTATION_HORIZONTAL
+from myscrcpy.utils import ROTATION_HORIZONTAL, DeadlineScheduler, Timer
 from myscrcpy.core import *
 
 
@@ -106,6 +112,8 @@ class TouchProxy:
 
         self.on: bool = kwargs.get('on', True)
 
+        self.timer: Timer | None = None
+
     @staticmethod
     def check_time(check_time, threshold_ms) -> bool:
         return ((time.time() - check_time) * 1000) > threshold_ms
@@ -115,6 +123,19 @@ class TouchProxy:
         if not self.on:
             self.key_release()
 
+    def on_display_change(self, display_state: DisplayState):
+        """
+            屏幕方向/尺寸变化，更新映射方向
+        :param display_state:
+        :return:
+        """
+        if display_state.frame is not None:
+            self.frame_coord = display_state.frame.d
+        self._r = display_state.rotation == ROTATION_HORIZONTAL
+        self.spr = ScalePointR(self.touch_x, self.touch_y, self._r)
+        if hasattr(self, '_spr'):
+            self._spr = self.spr
+
     def action(self, action: Action):
         self.control.f_touch_spr(
             action=action, touch_id=self.touch_id,
@@ -135,6 +156,21 @@ class TouchProxy:
         self.spr = ScalePointR(*scale_point, self._r)
         self.action(Action.MOVE)
 
+    def schedule(self, delay_ms: float, callback):
+        """
+            替换当前定时动作
+        :param delay_ms:
+        :param callback:
+        :return:
+        """
+        self.cancel_timer()
+        self.timer = self.tpa.call_later(delay_ms, callback)
+
+    def cancel_timer(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
     def pg_loop_handler(self, *args, **kwargs):
         ...
 
@@ -181,14 +217,18 @@ class TouchClick(TouchProxy):
     def pg_event_handler(self, event: pygame.event.Event, *args, **kwargs):
         if event.type in [pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN]:
             self.key_down()
-            self.need_loop = True
+            self.schedule(self.release_ms, self._release)
         elif self.is_touched and event.type in [pygame.KEYUP, pygame.MOUSEBUTTONUP]:
             self.key_release()
 
-    def pg_loop_handler(self, *args, **kwargs):
-        if self.is_touched and self.check_time(self.last_down_ms, self.release_ms):
+    def _release(self):
+        if self.is_touched:
             self.key_release()
 
+    def key_release(self):
+        self.cancel_timer()
+        super().key_release()
+
 
 class TouchRepeat(TouchProxy):
     """
@@ -208,18 +248,27 @@ class TouchRepeat(TouchProxy):
     def pg_event_handler(self, event: pygame.event.Event, *args, **kwargs):
         if event.type in [pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN]:
             self.key_down()
-            self.need_loop = True
+            self.schedule(self.interval_ms, self._repeat)
         elif event.type in [pygame.KEYUP, pygame.MOUSEBUTTONUP]:
             self.key_release()
 
-    def pg_loop_handler(self, *args, **kwargs):
-        if self.need_loop and self.is_pressed:
-            if self.is_touched:
-                if self.check_time(self.last_down_ms, self.interval_ms):
-                    self.touch_release()
-            else:
-                if self.check_time(self.last_release_ms, self.release_ms):
-                    self.touch_down()
+    def _repeat(self):
+        """
+            按压 interval_ms 后抬起，抬起 release_ms 后按下，交替进行
+        :return:
+        """
+        if not self.is_pressed:
+            return
+        if self.is_touched:
+            self.touch_release()
+            self.schedule(self.release_ms, self._repeat)
+        else:
+            self.touch_down()
+            self.schedule(self.interval_ms, self._repeat)
+
+    def key_release(self):
+        self.cancel_timer()
+        super().key_release()
 
 
 class TouchScope(TouchProxy):
@@ -296,6 +345,8 @@ class TouchCross(TouchProxy):
         十字
     """
 
+    UP_HOLD_MS = 800
+
     def __init__(
             self,
             tpa: 'TouchProxyAdapter', touch_type: TouchType, touch_x: float, touch_y: float,
@@ -319,24 +370,36 @@ class TouchCross(TouchProxy):
         self.x = self.sc_joystick_r
         self.y = self.sc_joystick_r * self.frame_coord['width'] / self.frame_coord['height']
 
-        self.need_loop = True
-
         self._sp = self.sp
         self._spr = self.spr
 
-        self.up_hold_ms = None
+        # 方向键状态 up, down, left, right
+        self.dirs = (False, False, False, False)
+        self.up_held = False
+
+    def on_display_change(self, display_state: DisplayState):
+        super().on_display_change(display_state)
+        self.y = self.sc_joystick_r * self.frame_coord['width'] / self.frame_coord['height']
 
     def pg_event_handler(self, event: pygame.event.Event, *args, **kwargs):
-        if event.type == pygame.KEYDOWN:
-            self.need_loop = True
+        if event.type in [pygame.KEYDOWN, pygame.KEYUP]:
+            pressed_key = pygame.key.get_pressed()
+            self.dirs = (
+                pressed_key[self.k_up], pressed_key[self.k_down], pressed_key[self.k_left], pressed_key[self.k_right]
+            )
+            self.move()
 
-    def pg_loop_handler(self, *args, **kwargs):
-        pressed_key = pygame.key.get_pressed()
+    def _up_hold(self):
+        if self.dirs[0]:
+            self.up_held = True
+            self.move()
 
-        up = pressed_key[self.k_up]
-        down = pressed_key[self.k_down]
-        left = pressed_key[self.k_left]
-        right = pressed_key[self.k_right]
+    def move(self):
+        """
+            按方向键状态移动，上推持续 UP_HOLD_MS 后按 up_scale 放大
+        :return:
+        """
+        up, down, left, right = self.dirs
 
         if up or down or left or right:
             if not self.is_pressed:
@@ -345,11 +408,12 @@ class TouchCross(TouchProxy):
                 self.touch_down()
                 time.sleep(0.05)
 
-            if up and self.up_hold_ms is None:
-                self.up_hold_ms = time.time()
+            if up and self.timer is None and not self.up_held:
+                self.schedule(self.UP_HOLD_MS, self._up_hold)
 
             if not up:
-                self.up_hold_ms = None
+                self.cancel_timer()
+                self.up_held = False
 
             x = self.sp.x
 
@@ -360,11 +424,7 @@ class TouchCross(TouchProxy):
 
             y = self.sp.y
             if up:
-                y -= (
-                    self.y if self.up_hold_ms is None else
-                    self.y * self.up_scale if self.check_time(self.up_hold_ms, 800) else
-                    self.y
-                )
+                y -= self.y * self.up_scale if self.up_held else self.y
             if down:
                 y += self.y
 
@@ -378,7 +438,14 @@ class TouchCross(TouchProxy):
                 self.key_release()
                 self.sp = self._sp
                 self.spr = self._spr
-            self.up_hold_ms = None
+            self.cancel_timer()
+            self.up_held = False
+
+    def key_release(self):
+        self.cancel_timer()
+        self.up_held = False
+        self.dirs = (False, False, False, False)
+        super().key_release()
 
 
 class TouchAim(TouchProxy):
@@ -386,6 +453,9 @@ class TouchAim(TouchProxy):
         视角控制
     """
 
+    # 触摸持续超过该时长后重置，避免滑出视角区域
+    RESET_MS = 500
+
     def __init__(
             self,
             tpa: 'TouchProxyAdapter',
@@ -420,6 +490,7 @@ class TouchAim(TouchProxy):
 
         self.active = False
         self.slow_scale = kwargs.get('slow_scale', 0.2)
+        self.uhid_mouse = False
 
     def pg_event_handler(self, event: pygame.event.Event, *args, **kwargs):
 
@@ -435,18 +506,20 @@ class TouchAim(TouchProxy):
             if self.active:
                 self.tpa.tp_aim = self
 
-                self.tpa.tps[UnifiedKeys.UK_MOUSE_L] = self.attack
+                self.tpa.set_key_proxy(UnifiedKeys.UK_MOUSE_L, self.attack)
                 self.sp = self._sp
                 self.spr = self._spr
                 self.key_down()
+                self.schedule(self.RESET_MS, self._aim_tick)
 
                 if self.tpa.device.info.is_uhid_supported:
                     self.control.f_uhid_mouse_create()
 
 
             else:
+                self.cancel_timer()
                 self.tpa.tp_aim = None
-                self.tpa.tps[UnifiedKeys.UK_MOUSE_L] = self.tpa.mouse_tp
+                self.tpa.set_key_proxy(UnifiedKeys.UK_MOUSE_L, self.tpa.mouse_tp)
                 self.key_release()
                 pygame.mouse.set_pos(self.tpa.coord.to_point(ScalePoint(0.5, 0.5)))
 
@@ -484,9 +557,22 @@ class TouchAim(TouchProxy):
             self.need_move = True
             self.need_loop = True
 
+    def _aim_tick(self):
+        """
+            距上次抬起 RESET_MS 后重置，按住 LSHIFT 使用 UHID 鼠标时跳过
+        :return:
+        """
+        remaining = self.RESET_MS - (time.time() - self.last_release_ms) * 1000
+        if remaining <= 0:
+            if self.active and not self.uhid_mouse:
+                self._reset_aim()
+            remaining = self.RESET_MS
+        self.schedule(remaining, self._aim_tick)
+
     def pg_loop_handler(self, *args, **kwargs):
 
-        if pygame.key.get_mods() & pygame.KMOD_LSHIFT:
+        self.uhid_mouse = bool(pygame.key.get_mods() & pygame.KMOD_LSHIFT)
+        if self.uhid_mouse:
             self.control.f_uhid_mouse_input(
                 0, 0, left_button=pygame.mouse.get_pressed()[0]
             )
@@ -497,9 +583,6 @@ class TouchAim(TouchProxy):
         #     self.sp += ScalePoint(0, 0.0002)
         #     self.touch_move(self.sp)
 
-        if self.active and self.check_time(self.last_release_ms, 500):
-            self._reset_aim()
-
 
 class TouchMouse(TouchProxy):
     """
@@ -591,6 +674,9 @@ class TouchProxyAdapter:
         TouchType.KEY_WATCH: TouchWatch
     }
 
+    # 处理 MOUSEMOTION 的类型
+    MOTION_CLS = (TouchScope, TouchAim, TouchMouse, TouchWatch)
+
     def __init__(self, session: Session, device: AdvDevice, coord: Coordinate, cfg_path: pathlib.Path):
         self.session = session
         self.device = device
@@ -599,13 +685,59 @@ class TouchProxyAdapter:
         self.cfg_path = cfg_path
         self.coord: Coordinate = coord
 
+        self.tp_list: List[TouchProxy] = []
+
+        # 定时动作于 scheduler 线程执行，与 pygame 事件处理共用锁
+        self.lock = threading.RLock()
+        self.scheduler = DeadlineScheduler(name='tp_scheduler').start()
+
         self.mouse_tp = TouchMouse(self, TouchType.MOUSE_TOUCH)
 
+        # 分发表，由 compile 生成
+        self.key_table: Dict[int, TouchProxy] = {}
+        self.button_table: Dict[int, TouchProxy] = {}
+        self.motion_tps: List[TouchProxy] = []
+        self.loop_tps: List[TouchProxy] = []
+
         self.tps = {}
         self.load_cfg()
 
         self.tp_aim = False
 
+        # 2026-10-19 3.3.0 Me2sY  设备旋转时由 display_state 通知，无需轮询
+        self.session.display_state.register(self.on_display_change)
+
+    def on_display_change(self, display_state: DisplayState):
+        """
+            同步全部 TouchProxy 方向
+            于解码线程回调，与 pygame 事件及 scheduler 定时动作共用锁
+        :param display_state:
+        :return:
+        """
+        with self.lock:
+            for tp in self.tp_list:
+                tp.on_display_change(display_state)
+
+    def stop(self):
+        """
+            注销 display_state 订阅，停止 scheduler
+        :return:
+        """
+        self.session.display_state.unregister(self.on_display_change)
+        self.scheduler.stop()
+
+    def call_later(self, delay_ms: float, callback) -> Timer:
+        """
+            延迟执行 TouchProxy 定时动作
+        :param delay_ms:
+        :param callback:
+        :return:
+        """
+        def _run():
+            with self.lock:
+                callback()
+        return self.scheduler.call_later(max(delay_ms, 0) / 1000, _run)
+
     def load_cfg(self, cfg_path: pathlib.Path | None = None):
         """
             加载配置文件
@@ -617,9 +749,7 @@ class TouchProxyAdapter:
             self.cfg_path = cfg_path
 
         self.tp_ids = set()
-
-        for _ in self.tps.values():
-            del _
+        self.tp_list = [self.mouse_tp]
 
         self.tps = {}
 
@@ -633,6 +763,43 @@ class TouchProxyAdapter:
         # 配置鼠标左键点击功能
         self.tps[UnifiedKeys.UK_MOUSE_L] = self.mouse_tp
 
+        self.compile()
+
+    def compile(self):
+        """
+            由 tps 生成分发表
+            按键 pygame 码直接索引 TouchProxy，MOUSEMOTION / loop 仅遍历可能响应的 TouchProxy
+        :return:
+        """
+        key_table, button_table = {}, {}
+        for uk, tp in self.tps.items():
+            code = KeyMapper.uk2pg(uk)
+            if code is None:
+                continue
+            if uk.device == UnifiedKeys.UK_MOUSE_L.device:
+                button_table[code] = tp
+            else:
+                key_table[code] = tp
+
+        self.key_table, self.button_table = key_table, button_table
+
+        # TouchAim 的 attack 等不在 tps 中，订阅列表使用全部已注册 TouchProxy
+        self.motion_tps = [_ for _ in self.tp_list if isinstance(_, self.MOTION_CLS)]
+        self.loop_tps = [_ for _ in self.tp_list if type(_).pg_loop_handler is not TouchProxy.pg_loop_handler]
+
+    def set_key_proxy(self, uk: UnifiedKey, tp: TouchProxy):
+        """
+            运行时替换按键对应 TouchProxy，同步分发表
+        :param uk:
+        :param tp:
+        :return:
+        """
+        self.tps[uk] = tp
+        code = KeyMapper.uk2pg(uk)
+        if code is not None:
+            table = self.button_table if uk.device == UnifiedKeys.UK_MOUSE_L.device else self.key_table
+            table[code] = tp
+
     def register_tp(self, tpd: dict) -> TouchProxy:
         """
             注册 touch proxy
@@ -655,6 +822,9 @@ class TouchProxyAdapter:
             self.tps[UnifiedKeys.filter_name(tpd.get('k_left'))] = tp
             self.tps[UnifiedKeys.filter_name(tpd.get('k_right'))] = tp
 
+        if tp is not None:
+            self.tp_list.append(tp)
+
         return tp
 
     def create_touch_id(self) -> int:
@@ -676,38 +846,97 @@ class TouchProxyAdapter:
         :param kwargs:
         :return:
         """
-        if event.type in [pygame.KEYDOWN, pygame.KEYUP]:
-            uk = KeyMapper.pg2uk(event.key)
-            if uk in self.tps:
-                _ = self.tps[uk]
-                if not _.on:
-                    return
-                _.pg_event_handler(event, coord=self.coord, *args, **kwargs)
-
-        elif event.type in [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP]:
-            uk = KeyMapper.pg2uk(event.button)
-            if uk in self.tps:
-                _ = self.tps[uk]
-                if not _.on:
-                    return
-                _.pg_event_handler(event, coord=self.coord, *args, **kwargs)
-
-        elif event.type == pygame.MOUSEMOTION:
-            mouse_pos = self.coord.to_scale_point(*event.pos)
-            for tp in [_ for _ in self.tps.values() if _.need_move and _.on]:
-                try:
-                    tp.pg_event_handler(event, mouse_pos=mouse_pos, *args, **kwargs)
-                except Exception as e:
-                    logger.error(f"Unexpected Move Event Error: {e}")
+        with self.lock:
+            if event.type == pygame.KEYDOWN or event.type == pygame.KEYUP:
+                tp = self.key_table.get(event.key)
+                if tp is not None and tp.on:
+                    tp.pg_event_handler(event, coord=self.coord, *args, **kwargs)
+
+            elif event.type == pygame.MOUSEBUTTONDOWN or event.type == pygame.MOUSEBUTTONUP:
+                tp = self.button_table.get(event.button)
+                if tp is not None and tp.on:
+                    tp.pg_event_handler(event, coord=self.coord, *args, **kwargs)
+
+            elif event.type == pygame.MOUSEMOTION:
+                mouse_pos = None
+                for tp in self.motion_tps:
+                    if tp.need_move and tp.on:
+                        if mouse_pos is None:
+                            mouse_pos = self.coord.to_scale_point(*event.pos)
+                        try:
+                            tp.pg_event_handler(event, mouse_pos=mouse_pos, *args, **kwargs)
+                        except Exception as e:
+                            logger.error(f"Unexpected Move Event Error: {e}")
 
     def loop_event_handler(self):
         """
             循环事件处理器
         :return:
         """
-        for tp in self.tps.values():
+        with self.lock:
+            for tp in self.loop_tps:
+                if tp.need_loop:
+                    try:
+                        tp.pg_loop_handler()
+                    except Exception as e:
+                        logger.error(e)
+
+
+if __name__ == '__main__':
+    """
+        DEMO Here
+        1000Hz 鼠标移动 + 60fps loop 下，原遍历方式与编译分发表耗时对比
+    """
+    import types
+
+    from myscrcpy.gui.gui_utils import inject_pg_key_mapper
+    from myscrcpy.utils import Param
+    inject_pg_key_mapper()
+
+    class _Session:
+        ca = types.SimpleNamespace(f_touch_spr=lambda **kwargs: None)
+        va = types.SimpleNamespace(coordinate=Coordinate(2400, 1080))
+        display_state = DisplayState()
+
+    keys = 'QWERTYUIOPASDFGHJKLZXCVBNM1234567890'
+    cfg = [
+        {'touch_type': 'key_click', 'unified_key': k, 'touch_x': 0.5, 'touch_y': 0.5, 'release_ms': 50}
+        for k in keys
+    ]
+    cfg.append({
+        'touch_type': 'key_scope', 'unified_key': 'MOUSE_R', 'touch_x': 0.8, 'touch_y': 0.6,
+        'sc_joystick_r': 0.1, 'pmin': [0.1, 0.1], 'pmax': [0.9, 0.9]
+    })
+
+    cfg_path = pathlib.Path(Param.PATH_TEMP) / 'tp_bench.json'
+    CfgHandler.save(cfg_path, {'touch_proxy': cfg})
+
+    tpa = TouchProxyAdapter(_Session(), None, Coordinate(1200, 540), cfg_path)
+    cfg_path.unlink()
+
+    def legacy_motion(event):
+        mouse_pos = tpa.coord.to_scale_point(*event.pos)
+        for tp in [_ for _ in tpa.tps.values() if _.need_move and _.on]:
+            tp.pg_event_handler(event, mouse_pos=mouse_pos)
+
+    def legacy_loop():
+        for tp in tpa.tps.values():
             if tp.need_loop:
-                try:
-                    tp.pg_loop_handler()
-                except Exception as e:
-                    logger.error(e)
+                tp.pg_loop_handler()
+
+    motion = pygame.event.Event(pygame.MOUSEMOTION, pos=(600, 270), rel=(1, 0))
+    seconds = 5
+
+    for name, f_motion, f_loop in [
+        ('legacy', legacy_motion, legacy_loop),
+        ('compiled', lambda e: tpa.event_handler(e), tpa.loop_event_handler)
+    ]:
+        t = time.perf_counter()
+        for i in range(1000 * seconds):
+            f_motion(motion)
+            if i % 16 == 0:
+                f_loop()
+        t_cost = time.perf_counter() - t
+        print(f"{name}: {len(tpa.tps)} proxies | {t_cost / (1000 * seconds) * 1e6:.2f} us/event")
+
+    tpa.stop()
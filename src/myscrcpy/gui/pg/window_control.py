@@ -5,6 +5,8 @@
     pygame框架下设备控制窗口，适用于低延迟需求应用。
 
     Log:
+        2026-10-19 3.3.0 Me2sY  退出时注销 TouchProxyAdapter 订阅
+
         2024-08-29 1.4.0 Me2sY  适配Session
 
         2024-08-26 1.3.7 Me2sY  适配Core架构，去除Run
@@ -16,7 +18,7 @@
 """
 
 __author__ = 'Me2sY'
-__version__ = '1.4.0'
+__version__ = '3.3.0'
 
 __all__ = [
     'PGControlWindow'
@@ -120,4 +122,5 @@ class PGControlWindow:
             self.tpa.loop_event_handler()
             clock.tick(fps)
 
+        self.tpa.stop()
         pygame.quit()
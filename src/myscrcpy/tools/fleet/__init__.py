@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+"""
+    Fleet
+    ~~~~~~~~~~~~~~~~~~
+    无界面多设备运行
+    多设备 Session 共用有界解码线程池，按全局 fps / 码率预算分配各设备参数，汇总指标
+
+    Log:
+        2026-10-19 0.1.0 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.1.0'
+
+__all__ = ['FleetBudget', 'DecodePool', 'Fleet']
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+import json
+import os
+import pathlib
+import threading
+import time
+from typing import Dict
+
+import click
+from loguru import logger
+
+from myscrcpy.core import (
+    Session, VideoArgs, AudioArgs, ControlArgs,
+    DeviceFactory, METRICS
+)
+
+
+@dataclass
+class FleetBudget:
+    """
+        全局资源预算，0 为不限
+    """
+    decode_workers: int = field(default_factory=lambda: os.cpu_count() or 4)   # 解码线程数，即 CPU 预算
+    max_total_fps: int = 0                  # 全部设备 fps 总和上限
+    max_total_bit_rate: int = 0             # 全部设备视频+音频码率总和上限, bps
+    start_workers: int = 8                  # 并行启动 Session 数
+
+    # 音频码率估算，从码率预算中扣除
+    AUDIO_BIT_RATES = {
+        AudioArgs.CODEC_RAW: 48000 * 2 * 16,
+        AudioArgs.CODEC_FLAC: 800_000,
+        AudioArgs.CODEC_OPUS: 128_000,
+    }
+
+
+class DecodePool(ThreadPoolExecutor):
+    """
+        有界解码线程池
+        记录排队及执行中任务数
+    """
+
+    def __init__(self, max_workers: int):
+        super().__init__(max_workers=max_workers, thread_name_prefix='fleet_decode')
+        self.pending = 0
+        self._m_pending = METRICS.gauge('fleet_decode_pending')
+        self._lock = threading.Lock()
+
+    def _done(self, _):
+        with self._lock:
+            self.pending -= 1
+            self._m_pending.set(self.pending)
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        with self._lock:
+            self.pending += 1
+            self._m_pending.set(self.pending)
+        future = super().submit(fn, *args, **kwargs)
+        future.add_done_callback(self._done)
+        return future
+
+
+class Fleet:
+    """
+        多设备 Session 管理
+
+        fleet = Fleet(FleetBudget(decode_workers=4, max_total_fps=300))
+        fleet.add('serial', VideoArgs(max_size=800))
+        fleet.start()
+        fleet.metrics()
+        fleet.stop()
+    """
+
+    def __init__(self, budget: FleetBudget | None = None, heartbeat: bool = True):
+        """
+            Fleet
+        :param budget:
+        :param heartbeat: Session 断线重连
+        """
+        self.budget = FleetBudget() if budget is None else budget
+        self.heartbeat = heartbeat
+
+        self.decode_pool = DecodePool(self.budget.decode_workers)
+
+        self.device_args: Dict[str, Dict[str, VideoArgs | AudioArgs | ControlArgs | None]] = {}
+        self.sessions: Dict[str, Session] = {}
+        self.start_report: Dict[str, dict] = {}
+
+        self._last = {}     # serial: (t, frames, rx_bytes)
+
+        self._m_sessions = METRICS.gauge('fleet_sessions')
+
+    def add(
+            self, serial: str,
+            video_args: VideoArgs | None = None,
+            audio_args: AudioArgs | None = None,
+            control_args: ControlArgs | None = None
+    ):
+        """
+            添加设备
+        :param serial: adb serial
+        :param video_args:
+        :param audio_args:
+        :param control_args:
+        :return:
+        """
+        self.device_args[serial] = {'video': video_args, 'audio': audio_args, 'control': control_args}
+
+    def plan(self) -> Dict[str, VideoArgs]:
+        """
+            按预算分配各设备 VideoArgs，fps / 码率 取设备设置与均分份额较小值
+        :return: {serial: VideoArgs}
+        """
+        videos = {
+            serial: args['video'] for serial, args in self.device_args.items()
+            if args['video'] is not None and args['video'].is_activate
+        }
+        if not videos:
+            return {}
+
+        n = len(videos)
+
+        fps_share = max(1, self.budget.max_total_fps // n) if self.budget.max_total_fps else 0
+
+        bit_rate_share = 0
+        if self.budget.max_total_bit_rate:
+            audio_bit_rate = sum(
+                self.budget.AUDIO_BIT_RATES.get(args['audio'].audio_codec, 0)
+                for args in self.device_args.values() if args['audio'] is not None and args['audio'].is_activate
+            )
+            bit_rate_share = max(100_000, (self.budget.max_total_bit_rate - audio_bit_rate) // n)
+
+        planned = {}
+        for serial, args in videos.items():
+            fps = min(args.fps, fps_share) if fps_share else args.fps
+            bit_rate = args.video_bit_rate
+            if bit_rate_share:
+                bit_rate = min(bit_rate, bit_rate_share) if bit_rate else bit_rate_share
+            planned[serial] = replace(args, fps=fps, video_bit_rate=bit_rate)
+        return planned
+
+    def _start_one(self, serial: str, video_args: VideoArgs | None) -> Session:
+        dc = DeviceFactory.device(serial)
+        if dc is None:
+            raise RuntimeError(f"Device {serial} Not Found")
+
+        args = self.device_args[serial]
+        sess = Session(
+            dc.adb_dev,
+            video_args=video_args,
+            audio_args=args['audio'],
+            control_args=args['control'],
+            heartbeat=self.heartbeat,
+            decode_executor=self.decode_pool,
+        )
+        dc.sessions.add(sess)
+        return sess
+
+    def start(self) -> Dict[str, bool]:
+        """
+            并行启动全部设备
+        :return: {serial: 是否成功}
+        """
+        planned = self.plan()
+
+        t = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.budget.start_workers, thread_name_prefix='fleet_start') as executor:
+            futures = {
+                serial: executor.submit(self._start_one, serial, planned.get(serial))
+                for serial in self.device_args if serial not in self.sessions
+            }
+
+        outcomes = {}
+        for serial, future in futures.items():
+            try:
+                self.sessions[serial] = future.result()
+                self.start_report[serial] = {'ok': True, 'error': '', 'args': planned.get(serial)}
+                outcomes[serial] = True
+            except Exception as e:
+                logger.error(f"Fleet {serial} Start Failed => {e}")
+                self.start_report[serial] = {'ok': False, 'error': str(e), 'args': planned.get(serial)}
+                outcomes[serial] = False
+
+        self._m_sessions.set(len(self.sessions))
+        logger.success(
+            f"Fleet Started {sum(outcomes.values())}/{len(outcomes)} in {(time.perf_counter() - t) * 1000:.0f}ms"
+        )
+        return outcomes
+
+    def stop(self):
+        """
+            停止全部 Session 及解码线程池
+        :return:
+        """
+        for serial, sess in list(self.sessions.items()):
+            try:
+                sess.disconnect()
+            except Exception as e:
+                logger.warning(f"Fleet {serial} Stop Error => {e}")
+        self.sessions.clear()
+        self._m_sessions.set(0)
+        self.decode_pool.shutdown(wait=False, cancel_futures=True)
+
+    def metrics(self) -> dict:
+        """
+            汇总指标，fps / 码率 为距上次调用的平均值
+        :return: {'devices': {serial: {...}}, 'total': {...}}
+        """
+        now = time.perf_counter()
+        devices = {}
+
+        for serial, sess in self.sessions.items():
+            d = {'video_fps': 0.0, 'rx_mbps': 0.0, 'decode_p95_ms': 0.0, 'video_ready': bool(sess.is_video_ready)}
+
+            if sess.va is not None and sess.va.conn.metric_labels:
+                labels = sess.va.conn.metric_labels
+                frames = METRICS.counter('video_frames_total', **labels).value
+                rx_bytes = METRICS.counter('rx_bytes_total', **labels).value
+                d['decode_p95_ms'] = METRICS.histogram('video_decode_ms', **labels).quantile(0.95)
+
+                last = self._last.get(serial)
+                if last is not None and now > last[0]:
+                    dt = now - last[0]
+                    d['video_fps'] = max(0, frames - last[1]) / dt
+                    d['rx_mbps'] = max(0, rx_bytes - last[2]) * 8 / dt / 1e6
+                self._last[serial] = (now, frames, rx_bytes)
+
+            devices[serial] = d
+
+        total = {
+            'sessions': len(self.sessions),
+            'video_ready': sum(_['video_ready'] for _ in devices.values()),
+            'video_fps': sum(_['video_fps'] for _ in devices.values()),
+            'rx_mbps': sum(_['rx_mbps'] for _ in devices.values()),
+            'decode_p95_ms': max((_['decode_p95_ms'] for _ in devices.values()), default=0.0),
+            'decode_pending': self.decode_pool.pending,
+        }
+
+        METRICS.gauge('fleet_video_fps').set(total['video_fps'])
+        METRICS.gauge('fleet_rx_mbps').set(total['rx_mbps'])
+
+        return {'devices': devices, 'total': total}
+
+
+def _load_config(config: str | None) -> dict:
+    """
+        设备配置 JSON
+        {"serial 或 *": {"video": {VideoArgs 字段}, "audio": {AudioArgs 字段} | null, "control": {...} | null}}
+    :param config:
+    :return:
+    """
+    if config is None:
+        return {}
+    return json.loads(pathlib.Path(config).read_text(encoding='utf-8'))
+
+
+@click.command()
+@click.option('--serial', 'serials', multiple=True, help='Device Serial, Repeatable. Default All Devices')
+@click.option('--config', type=click.Path(exists=True, dir_okay=False), default=None, help='Per Device Args JSON')
+@click.option('--max-size', type=click.IntRange(min=0), default=800, help='Video Max Size')
+@click.option('--fps', type=click.IntRange(min=1, max=240), default=30, help='Video fps Per Device')
+@click.option('--bit-rate', type=click.IntRange(min=0), default=0, help='Video Bit Rate Per Device, bps')
+@click.option('--audio/--no-audio', default=False, help='Enable Audio')
+@click.option('--control/--no-control', default=False, help='Enable Control')
+@click.option('--decode-workers', type=click.IntRange(min=1), default=os.cpu_count() or 4, help='Decode Threads')
+@click.option('--max-total-fps', type=click.IntRange(min=0), default=0, help='Total fps Budget, 0 Unlimited')
+@click.option('--max-total-bit-rate', type=click.IntRange(min=0), default=0, help='Total Bit Rate Budget, bps')
+@click.option('--metrics-port', type=click.IntRange(min=0), default=0, help='Prometheus Exporter Port, 0 Disabled')
+@click.option('--report-interval', type=float, default=5.0, help='Report Interval, Second')
+@click.option('--duration', type=float, default=0, help='Run Duration, Second. 0 Until Ctrl+C')
+def cli(
+        serials: tuple, config: str | None, max_size: int, fps: int, bit_rate: int, audio: bool, control: bool,
+        decode_workers: int, max_total_fps: int, max_total_bit_rate: int,
+        metrics_port: int, report_interval: float, duration: float
+):
+    """
+        Run headless sessions on many devices
+    """
+    DeviceFactory.load_devices(save_history=False)
+
+    cfg = _load_config(config)
+    serials = serials or tuple(_.adb_dev.serial for _ in DeviceFactory.device_list())
+    if not serials:
+        logger.error('No Device Found!')
+        return
+
+    fleet = Fleet(FleetBudget(
+        decode_workers=decode_workers, max_total_fps=max_total_fps, max_total_bit_rate=max_total_bit_rate
+    ))
+
+    for serial in serials:
+        _cfg = {**cfg.get('*', {}), **cfg.get(serial, {})}
+
+        video_cfg = {'max_size': max_size, 'fps': fps, 'video_bit_rate': bit_rate, **(_cfg.get('video') or {})}
+        audio_cfg = _cfg.get('audio', {} if audio else None)
+        control_cfg = _cfg.get('control', {} if control else None)
+
+        fleet.add(
+            serial,
+            video_args=VideoArgs(**video_cfg),
+            audio_args=None if audio_cfg is None else AudioArgs(**audio_cfg),
+            control_args=None if control_cfg is None else ControlArgs(**control_cfg),
+        )
+
+    if metrics_port:
+        METRICS.serve(metrics_port)
+
+    try:
+        fleet.start()
+        fleet.metrics()
+
+        t = time.perf_counter()
+        while duration <= 0 or time.perf_counter() - t < duration:
+            time.sleep(report_interval)
+            total = fleet.metrics()['total']
+            logger.info(
+                f"Fleet {total['video_ready']}/{total['sessions']} | {total['video_fps']:.1f} fps | "
+                f"{total['rx_mbps']:.2f} Mbps | decode p95 {total['decode_p95_ms']:.1f} ms | "
+                f"pending {total['decode_pending']}"
+            )
+    except KeyboardInterrupt:
+        ...
+    finally:
+        fleet.stop()
+        METRICS.shutdown()
+
+
+if __name__ == '__main__':
+    cli()
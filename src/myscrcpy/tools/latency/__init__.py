@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+"""
+    Latency Probe
+    ~~~~~~~~~~~~~~~~~~
+    输入至画面(Input-to-Photon)延迟测量
+    通过 ControlAdapter 在指定区域注入 Touch/KeyCode，并监测 VideoAdapter 解码画面中该区域变化
+    Touch 模式下开启 show_touches，使触摸点在画面中可见
+
+    Log:
+        2026-10-19 0.1.1 Me2sY  新增 --profile，对比 SocketProfile
+
+        2026-10-19 0.1.0 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.1.1'
+
+__all__ = ['LatencyProbe']
+
+import random
+import time
+from typing import List
+
+import av
+import click
+import numpy as np
+from loguru import logger
+
+from myscrcpy.core import Session, VideoArgs, ControlArgs, SocketProfile
+from myscrcpy.utils import Action, ScalePoint, ScalePointR, ADBKeyCode
+
+
+class LatencyProbe:
+    """
+        延迟探针
+    """
+
+    MODE_TOUCH = 'touch'
+    MODE_KEY = 'key'
+
+    TOUCH_ID = 0x4C41
+
+    def __init__(
+            self,
+            session: Session,
+            center: ScalePoint = ScalePoint(0.5, 0.5),
+            size: float = 0.06,
+            threshold: float = 8.0,
+            mode: str = MODE_TOUCH,
+            keycode: int = ADBKeyCode.KB_VOLUME_UP,
+    ):
+        """
+            延迟探针
+        :param session: 需同时开启 Video 及 Control
+        :param center: 探测区域中心
+        :param size: 探测区域边长，相对于 frame 宽度
+        :param threshold: 区域平均亮度差阈值 0..255
+        :param mode: touch / key
+        :param keycode: key 模式下注入的 KeyCode
+        """
+        if not (session.is_video_ready and session.is_control_ready):
+            raise RuntimeError('LatencyProbe Needs Video And Control')
+
+        if mode not in [self.MODE_TOUCH, self.MODE_KEY]:
+            raise ValueError(f"Invalid Mode {mode}")
+
+        self.session = session
+        self.center = center
+        self.size = size
+        self.threshold = threshold
+        self.mode = mode
+        self.keycode = int(keycode)
+
+        self.latencies: List[float] = []
+        self.misses = 0
+
+        self._show_touches = None
+
+    @staticmethod
+    def luma(frame: av.VideoFrame) -> np.ndarray:
+        """
+            获取亮度平面，yuv420p 直接读取 Y plane，避免 RGB 转换
+        :param frame:
+        :return: 2D uint8
+        """
+        if frame.format.name in ['yuv420p', 'yuvj420p', 'nv12']:
+            plane = frame.planes[0]
+            return np.frombuffer(plane, np.uint8).reshape(-1, plane.line_size)[:frame.height, :frame.width]
+        return frame.to_ndarray(format='gray')
+
+    def region(self, frame: av.VideoFrame) -> np.ndarray:
+        """
+            截取探测区域
+        :param frame:
+        :return: 2D int16
+        """
+        half = max(1, round(frame.width * self.size / 2))
+        cx = round(self.center.x * frame.width)
+        cy = round(self.center.y * frame.height)
+        return self.luma(frame)[
+            max(0, cy - half):cy + half, max(0, cx - half):cx + half
+        ].astype(np.int16)
+
+    def diff(self, base: np.ndarray, frame: av.VideoFrame) -> float:
+        """
+            区域平均绝对差
+        :param base:
+        :param frame:
+        :return:
+        """
+        roi = self.region(frame)
+        if roi.shape != base.shape:
+            # 旋转
+            return float('inf')
+        return float(np.abs(roi - base).mean())
+
+    def wait_frame(self, frame_n: int, timeout: float) -> tuple[int, av.VideoFrame | None, float]:
+        """
+            等待新的解码帧
+        :param frame_n: 当前帧序号
+        :param timeout:
+        :return: 帧序号, 帧, 获取时间
+        """
+        va = self.session.va
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            if va.frame_n != frame_n:
+                return va.frame_n, va.get_video_frame(), time.perf_counter()
+            time.sleep(0.0002)
+        return frame_n, None, time.perf_counter()
+
+    def settle(self, quiet: float = 0.3, timeout: float = 3) -> np.ndarray:
+        """
+            等待画面稳定，返回基准区域
+        :param quiet: 无变化持续时间
+        :param timeout:
+        :return:
+        """
+        va = self.session.va
+        frame_n = va.frame_n
+        base = self.region(va.get_video_frame())
+        deadline = time.perf_counter() + timeout
+        t_quiet = time.perf_counter()
+        while time.perf_counter() < deadline:
+            frame_n, frame, _ = self.wait_frame(frame_n, quiet)
+            if frame is None:
+                if time.perf_counter() - t_quiet >= quiet:
+                    break
+                continue
+            if self.diff(base, frame) > self.threshold:
+                t_quiet = time.perf_counter()
+            base = self.region(frame)
+        return base
+
+    def inject(self, action: Action):
+        """
+            注入事件
+        :param action:
+        :return:
+        """
+        ca = self.session.ca
+        if self.mode == self.MODE_TOUCH:
+            coord = self.session.va.coordinate
+            ca.f_touch_spr(action, ScalePointR(*self.center, coord.rotation), self.TOUCH_ID, ignore_repeat=True)
+        else:
+            ca.f_keycode(0 if action == Action.DOWN else 1, self.keycode)
+
+    def trial(self, timeout: float = 1.0) -> float | None:
+        """
+            单次测量
+        :param timeout:
+        :return: 延迟 ms，超时返回 None
+        """
+        base = self.settle()
+        frame_n = self.session.va.frame_n
+
+        t_send = time.perf_counter()
+        self.inject(Action.DOWN)
+
+        latency = None
+        deadline = t_send + timeout
+        while time.perf_counter() < deadline:
+            frame_n, frame, t_frame = self.wait_frame(frame_n, deadline - time.perf_counter())
+            if frame is None:
+                break
+            if self.diff(base, frame) > self.threshold:
+                latency = (t_frame - t_send) * 1000
+                break
+
+        self.inject(Action.RELEASE)
+
+        if latency is None:
+            self.misses += 1
+        else:
+            self.latencies.append(latency)
+        return latency
+
+    def _set_show_touches(self, enable: bool):
+        """
+            开启/恢复 show_touches
+        :param enable:
+        :return:
+        """
+        adb_device = self.session.adb_device
+        if enable:
+            self._show_touches = adb_device.shell('settings get system show_touches').strip()
+            adb_device.shell('settings put system show_touches 1')
+        elif self._show_touches is not None:
+            adb_device.shell(
+                f"settings put system show_touches {self._show_touches if self._show_touches in ['0', '1'] else 0}"
+            )
+            self._show_touches = None
+
+    def run(self, trials: int = 50, interval: float = 0.2, timeout: float = 1.0) -> dict:
+        """
+            重复测量
+        :param trials:
+        :param interval: 测量间隔，附加随机抖动避免与刷新周期同步
+        :param timeout:
+        :return: 统计结果
+        """
+        self.latencies = []
+        self.misses = 0
+
+        if self.mode == self.MODE_TOUCH:
+            self._set_show_touches(True)
+
+        try:
+            for i in range(trials):
+                latency = self.trial(timeout)
+                logger.info(
+                    f"Trial {i + 1:>4}/{trials} => {'Timeout' if latency is None else f'{latency:.2f} ms'}"
+                )
+                time.sleep(interval + random.random() * interval)
+        finally:
+            if self.mode == self.MODE_TOUCH:
+                self._set_show_touches(False)
+
+        return self.stats()
+
+    def stats(self) -> dict:
+        """
+            统计 p50/p95/p99
+        :return:
+        """
+        serial = self.session.adb_device.serial
+        d = {
+            'serial': serial,
+            'transport': 'tcpip' if ':' in serial else 'usb',
+            'mode': self.mode,
+            'n': len(self.latencies),
+            'misses': self.misses,
+        }
+        if self.latencies:
+            arr = np.asarray(self.latencies)
+            p50, p95, p99 = np.percentile(arr, [50, 95, 99])
+            d.update({
+                'min': float(arr.min()), 'mean': float(arr.mean()), 'max': float(arr.max()),
+                'p50': float(p50), 'p95': float(p95), 'p99': float(p99)
+            })
+        return d
+
+
+@click.command()
+@click.option('--device_serial', default=None, help='Device Serial Number')
+@click.option('--trials', type=click.IntRange(min=1), default=50, help='Trials')
+@click.option('--mode', type=click.Choice([LatencyProbe.MODE_TOUCH, LatencyProbe.MODE_KEY]), default='touch')
+@click.option('--x', type=click.FloatRange(0, 1), default=0.5, help='Region Center X Scale')
+@click.option('--y', type=click.FloatRange(0, 1), default=0.5, help='Region Center Y Scale')
+@click.option('--size', type=click.FloatRange(0.01, 1), default=0.06, help='Region Size Scale of Frame Width')
+@click.option('--threshold', type=float, default=8.0, help='Mean Luma Diff Threshold')
+@click.option('--max-size', type=click.IntRange(min=0), default=0, help='Video Max Size. 0 is use device size')
+@click.option('--fps', type=click.IntRange(min=1, max=240), default=60, help='fps')
+@click.option('--interval', type=float, default=0.2, help='Interval Between Trials, Second')
+@click.option(
+    '--profile', type=click.Choice(['default', 'legacy']), default='default',
+    help='Socket Profile. legacy: timeout only'
+)
+def cli(
+        device_serial: str, trials: int, mode: str, x: float, y: float, size: float, threshold: float,
+        max_size: int, fps: int, interval: float, profile: str
+):
+    """
+        Measure input-to-photon latency
+    """
+
+    from adbutils import adb
+
+    if device_serial is None and len(adb.device_list()) > 1:
+        logger.warning(f"More Than One Device! Pass a device_serial to connect one")
+        for _ in adb.device_list():
+            logger.info(f"--device_serial {_.serial}")
+        return
+
+    sess = Session(
+        adb_device=adb.device(serial=device_serial),
+        video_args=VideoArgs(max_size=max_size, fps=fps),
+        control_args=ControlArgs(screen_status=ControlArgs.STATUS_ON, clipboard=False),
+        socket_profiles={
+            'video': SocketProfile.LEGACY, 'control': SocketProfile.LEGACY
+        } if profile == 'legacy' else None
+    )
+
+    try:
+        probe = LatencyProbe(sess, ScalePoint(x, y), size, threshold, mode)
+        result = probe.run(trials, interval)
+    except KeyboardInterrupt:
+        result = None
+    finally:
+        sess.disconnect()
+
+    if result:
+        msg = ' | '.join(f"{k}: {f'{v:.2f}' if isinstance(v, float) else v}" for k, v in result.items())
+        logger.success(f"Latency [{profile}] => {msg}")
+
+
+if __name__ == '__main__':
+    cli()
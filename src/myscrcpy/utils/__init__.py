@@ -5,6 +5,10 @@
     工具类
 
     Log:
+        2026-10-19 3.3.0 Me2sY
+            1. 新增 PropStore
+            2. 新增 DeadlineScheduler
+
         2024-10-26 1.7.0 Me2sY
             1.适配 Scrcpy 2.7
             2.支持 Gamepad
@@ -17,7 +21,7 @@
 """
 
 __author__ = 'Me2sY'
-__version__ = '1.7.0'
+__version__ = '3.3.0'
 
 __all__ = [
     # Params
@@ -35,10 +39,18 @@ __all__ = [
 
     # Config manager
     'CfgHandler',
-    'KeyValue', 'KVManager', 'kv_global'
+    'KeyValue', 'KVManager', 'kv_global',
+
+    # Props
+    'PropStore',
+
+    # Scheduler
+    'Timer', 'DeadlineScheduler'
 ]
 
 from myscrcpy.utils.params import *
 from myscrcpy.utils.keys import *
 from myscrcpy.utils.vector import *
 from myscrcpy.utils.config_manager import *
+from myscrcpy.utils.props import *
+from myscrcpy.utils.scheduler import *
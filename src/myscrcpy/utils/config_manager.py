@@ -4,6 +4,8 @@
     ~~~~~~~~~~~~~~~~~~
 
     Log:
+        2026-10-19 3.3.0 Me2sY  KVManager 连接池 WAL 模式，读缓存及后台批量回写
+
         2024-09-16 1.6.0 Me2sY  新增 query / set_many 方法
 
         2024-08-31 1.4.1 Me2sY  使用SQLite3 取代原 TinyDB，进行KeyValue管理
@@ -12,7 +14,7 @@
 """
 
 __author__ = 'Me2sY'
-__version__ = '1.6.0'
+__version__ = '3.3.0'
 
 __all__ = [
     'CfgHandler',
@@ -20,12 +22,19 @@ __all__ = [
     'kv_global'
 ]
 
+import atexit
+from contextlib import contextmanager
 from dataclasses import dataclass
 import json
 import pathlib
 import pickle
+import queue
 import sqlite3
-from typing import Any, ClassVar, Tuple, List, Iterable
+import threading
+import time
+from typing import Any, ClassVar, Dict, Tuple, List, Iterable, Iterator
+
+from loguru import logger
 
 from myscrcpy.utils.params import Param
 
@@ -71,15 +80,188 @@ class KeyValue:
         return self.key, self._encode(self.value), self.info
 
 
+class _KVStore:
+    """
+        单表存储
+        连接池 (WAL) + 读缓存 + 回写队列
+        缓存 pickle 后的记录，get 时反序列化，避免调用方修改返回值影响缓存
+    """
+
+    POOL_SIZE: ClassVar[int] = 4
+    FLUSH_INTERVAL: ClassVar[float] = 0.2
+    MISSING: ClassVar[object] = object()
+
+    stores: ClassVar[Dict[str, '_KVStore']] = {}
+    _stores_lock: ClassVar[threading.Lock] = threading.Lock()
+    _flush_thread: ClassVar[threading.Thread | None] = None
+    _flush_event: ClassVar[threading.Event] = threading.Event()
+
+    @classmethod
+    def of(cls, table_name: str) -> '_KVStore':
+        store = cls.stores.get(table_name)
+        if store is None:
+            with cls._stores_lock:
+                store = cls.stores.get(table_name)
+                if store is None:
+                    store = cls(table_name)
+                    cls.stores[table_name] = store
+                    cls._start_flush_thread()
+        return store
+
+    def __init__(self, table_name: str):
+        self.table_name = table_name
+
+        self.pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self.cache: Dict[str, Tuple[str, bytes, str] | object] = {}
+        self.pending: Dict[str, Tuple[str, bytes, str] | None] = {}     # None 为删除
+        self._version = 0
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+        with self.connection() as db:
+            db.execute(
+                f"""
+                    CREATE TABLE IF NOT EXISTS 
+                    {table_name} (
+                        k    TEXT not null constraint {table_name}_pk primary key,
+                        v    BLOB,
+                        info TEXT
+                    );
+                """
+            )
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+            从连接池取出连接，事务结束后归还
+        :return:
+        """
+        try:
+            db = self.pool.get_nowait()
+        except queue.Empty:
+            db = KVManager.get_connection(self.table_name)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+
+        try:
+            with db:
+                yield db
+        finally:
+            if self.pool.qsize() < self.POOL_SIZE:
+                self.pool.put(db)
+            else:
+                db.close()
+
+    def get(self, key: str) -> Tuple[str, bytes, str] | None:
+        """
+            读取记录，优先 未写入队列 > 缓存 > 数据库
+        :param key:
+        :return:
+        """
+        with self._lock:
+            if key in self.pending:
+                return self.pending[key]
+            record = self.cache.get(key)
+            version = self._version
+
+        if record is None:
+            with self.connection() as db:
+                record = db.execute(f"SELECT * FROM {self.table_name} WHERE k = ?", (key,)).fetchone()
+            with self._lock:
+                # 读取期间无写入时才填充缓存
+                if version == self._version:
+                    self.cache[key] = self.MISSING if record is None else record
+
+        return None if record is self.MISSING else record
+
+    def set_many(self, records: Iterable[Tuple[str, bytes, str]]):
+        with self._lock:
+            self._version += 1
+            for record in records:
+                self.cache[record[0]] = record
+                self.pending[record[0]] = record
+        self._flush_event.set()
+
+    def delete(self, key: str):
+        with self._lock:
+            self._version += 1
+            self.cache[key] = self.MISSING
+            self.pending[key] = None
+        self._flush_event.set()
+
+    def query(self, key_query: str) -> List[Tuple[str, bytes, str]]:
+        """
+            like 查询，先写入队列以保证一致
+        :param key_query:
+        :return:
+        """
+        self.flush()
+        with self.connection() as db:
+            return db.execute(f"SELECT * FROM {self.table_name} WHERE k like ?", (key_query,)).fetchall()
+
+    def flush(self):
+        """
+            批量写入
+        :return:
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self.pending:
+                    return
+                pending, self.pending = self.pending, {}
+
+            upserts = [_ for _ in pending.values() if _ is not None]
+            deletes = [(k,) for k, v in pending.items() if v is None]
+
+            try:
+                with self.connection() as db:
+                    if upserts:
+                        db.executemany(f"INSERT OR REPLACE INTO {self.table_name} VALUES(?, ?, ?)", upserts)
+                    if deletes:
+                        db.executemany(f"DELETE FROM {self.table_name} WHERE k = ?", deletes)
+            except sqlite3.Error:
+                # 事务已回滚，放回队列待下次重试，期间的新写入优先
+                with self._lock:
+                    for k, v in pending.items():
+                        self.pending.setdefault(k, v)
+                self._flush_event.set()
+                raise
+
+    @classmethod
+    def flush_all(cls):
+        for store in list(cls.stores.values()):
+            try:
+                store.flush()
+            except sqlite3.Error as e:
+                logger.error(f"KVManager {store.table_name} Flush Error => {e}")
+
+    @classmethod
+    def _thread_flush(cls):
+        while True:
+            cls._flush_event.wait()
+            time.sleep(cls.FLUSH_INTERVAL)      # 合并短时间内的多次写入
+            cls._flush_event.clear()
+            cls.flush_all()
+
+    @classmethod
+    def _start_flush_thread(cls):
+        if cls._flush_thread is None:
+            cls._flush_thread = threading.Thread(target=cls._thread_flush, daemon=True, name='kvm_flush')
+            cls._flush_thread.start()
+            atexit.register(cls.flush_all)
+
+
 class KVManager:
     """
         使用 SQLite3 进行 KeyValue 管理
         Value 进行 pickle 处理，以 bytes存储至 blob
+        2026-10-19 3.3.0 每表连接池 (WAL)，读缓存，写入经后台线程批量提交，退出时写入
     """
 
     @staticmethod
     def get_connection(db_name: str) -> sqlite3.Connection:
-        return sqlite3.connect(Param.PATH_CONFIGS / f"{db_name}.db")
+        return sqlite3.connect(Param.PATH_CONFIGS / f"{db_name}.db", check_same_thread=False)
 
     @staticmethod
     def _run_check(table_name: str):
@@ -87,17 +269,7 @@ class KVManager:
             初始化检查
         :return:
         """
-        with KVManager.get_connection(table_name) as db:
-            db.execute(
-                f"""
-                    CREATE TABLE IF NOT EXISTS 
-                    {table_name} (
-                        k    TEXT not null constraint {table_name}_pk primary key,
-                        v    BLOB,
-                        info TEXT
-                    );
-                """
-            )
+        _KVStore.of(table_name)
 
     @staticmethod
     def _query(table_name: str, key_query: str) -> List[Any]:
@@ -107,19 +279,7 @@ class KVManager:
         :param key_query:
         :return:
         """
-        sql = f"SELECT * FROM {table_name} WHERE k like ?"
-
-        db = KVManager.get_connection(table_name)
-        cur = db.cursor()
-        cur.execute(sql, (key_query,))
-        values = cur.fetchall()
-        cur.close()
-        db.close()
-
-        if values is None:
-            return []
-        else:
-            return [KeyValue.loads(_) for _ in values]
+        return [KeyValue.loads(_) for _ in _KVStore.of(table_name).query(key_query)]
 
     @staticmethod
     def _get(table_name: str, key: str, default_value: Any = None) -> Any:
@@ -130,19 +290,11 @@ class KVManager:
         :param default_value: 默认值
         :return:
         """
-        sql = f"SELECT * FROM {table_name} WHERE k = ?"
-
-        db = KVManager.get_connection(table_name)
-        cur = db.cursor()
-        cur.execute(sql, (key,))
-        values = cur.fetchone()
-        cur.close()
-        db.close()
-
-        if values is None:
+        record = _KVStore.of(table_name).get(key)
+        if record is None:
             return default_value
         else:
-            return KeyValue.loads(values).value
+            return KeyValue.loads(record).value
 
     @staticmethod
     def _set(table_name: str, key: str, value: Any, info: str = '') -> None:
@@ -154,9 +306,7 @@ class KVManager:
         :param info:
         :return:
         """
-        sql = f"INSERT OR REPLACE INTO {table_name} VALUES(?, ?, ?)"
-        with KVManager.get_connection(table_name) as db:
-            db.execute(sql, KeyValue(key, value, info).dumps())
+        _KVStore.of(table_name).set_many([KeyValue(key, value, info).dumps()])
 
     @staticmethod
     def _set_many(table_name: str, key_values: Iterable[KeyValue]) -> None:
@@ -166,9 +316,7 @@ class KVManager:
         :param key_values:
         :return:
         """
-        sql = f"INSERT OR REPLACE INTO {table_name} VALUES(?, ?, ?)"
-        with KVManager.get_connection(table_name) as db:
-            db.executemany(sql, [kv.dumps() for kv in key_values])
+        _KVStore.of(table_name).set_many([kv.dumps() for kv in key_values])
 
     @staticmethod
     def _del(table_name: str, key: str) -> None:
@@ -179,9 +327,15 @@ class KVManager:
         :param info:
         :return:
         """
-        sql = f"DELETE FROM {table_name} WHERE k = ?"
-        with KVManager.get_connection(table_name) as db:
-            db.execute(sql, (key,))
+        _KVStore.of(table_name).delete(key)
+
+    @staticmethod
+    def flush():
+        """
+            立即写入全部待写入记录
+        :return:
+        """
+        _KVStore.flush_all()
 
     def __init__(self, table_name: str):
         """
@@ -208,3 +362,42 @@ class KVManager:
 
 
 kv_global = KVManager('global')
+
+
+if __name__ == '__main__':
+    """
+        DEMO Here
+        get / set ops 对比 每次 connect 的原实现
+    """
+    n = 2000
+    kvm = KVManager('bench')
+    value = {'x_pos': 400, 'y_pos': 400, 'history': list(range(20))}
+
+    def legacy_set(key, v):
+        with KVManager.get_connection(kvm.table_name) as db:
+            db.execute(f"INSERT OR REPLACE INTO {kvm.table_name} VALUES(?, ?, ?)", KeyValue(key, v).dumps())
+        db.close()
+
+    def legacy_get(key):
+        db = KVManager.get_connection(kvm.table_name)
+        r = db.execute(f"SELECT * FROM {kvm.table_name} WHERE k = ?", (key,)).fetchone()
+        db.close()
+        return KeyValue.loads(r).value
+
+    for name, f_set, f_get in [('legacy', legacy_set, legacy_get), ('pooled', kvm.set, kvm.get)]:
+        t = time.perf_counter()
+        for i in range(n):
+            f_set(f"k{i % 50}", value)
+        t_set = time.perf_counter() - t
+
+        t = time.perf_counter()
+        for i in range(n):
+            f_get(f"k{i % 50}")
+        t_get = time.perf_counter() - t
+
+        KVManager.flush()
+        print(f"{name}: set {n / t_set:,.0f} ops/s | get {n / t_get:,.0f} ops/s")
+
+    for i in range(50):
+        kvm.delete(f"k{i}")
+    KVManager.flush()
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+    Props
+    ~~~~~~~~~~~~~~~~~~
+    getprop 解析
+    单次正则扫描解析为扁平 dict，前缀查询(如 ro.build.)所需有序索引在首次查询时建立
+
+    Log:
+        2026-10-19 3.3.0 Me2sY  创建，替换原 exec 构建嵌套 dict 方式
+"""
+
+__author__ = 'Me2sY'
+__version__ = '3.3.0'
+
+__all__ = [
+    'PropStore'
+]
+
+from bisect import bisect_left
+from collections.abc import Mapping
+import re
+from typing import Dict, Iterator, List
+
+
+class PropStore(Mapping):
+    """
+        设备属性
+        props['ro.build.version.sdk'] / props.prefix('ro.build.')
+    """
+
+    LINE_PATTERN = re.compile(r'^\[([^\]]*)\]: \[(.*)\]\r?$', re.MULTILINE)
+
+    def __init__(self, props: Dict[str, str] | None = None):
+        self._props = {} if props is None else props
+        self._keys: List[str] | None = None     # 有序 key，前缀索引
+        self._nested: dict | None = None
+
+    @classmethod
+    def parse(cls, text: str) -> 'PropStore':
+        """
+            解析 getprop 输出
+        :param text:
+        :return:
+        """
+        return cls(dict(cls.LINE_PATTERN.findall(text)))
+
+    def __getitem__(self, key: str) -> str:
+        return self._props[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._props)
+
+    def __len__(self) -> int:
+        return len(self._props)
+
+    def __repr__(self):
+        return f"PropStore > {len(self._props)} props"
+
+    def get_int(self, key: str, default: int | None = None) -> int | None:
+        """
+            获取整数属性，不存在或无法转换时返回 default
+        :param key:
+        :param default:
+        :return:
+        """
+        try:
+            return int(self._props[key])
+        except (KeyError, ValueError):
+            return default
+
+    def prefix(self, prefix: str) -> Dict[str, str]:
+        """
+            前缀查询
+        :param prefix: 如 ro.build.
+        :return:
+        """
+        if self._keys is None:
+            self._keys = sorted(self._props)
+
+        result = {}
+        for i in range(bisect_left(self._keys, prefix), len(self._keys)):
+            key = self._keys[i]
+            if not key.startswith(prefix):
+                break
+            result[key] = self._props[key]
+        return result
+
+    def nested(self) -> dict:
+        """
+            按 '.' 拆分为嵌套 dict，兼容原 prop_d 结构
+            同时存在 a.b 及 a.b.c 时，保留先出现者
+        :return:
+        """
+        if self._nested is None:
+            nested = {}
+            for key, value in self._props.items():
+                node = nested
+                *parents, last = key.split('.')
+                for part in parents:
+                    node = node.setdefault(part, {})
+                    if not isinstance(node, dict):
+                        break
+                else:
+                    node.setdefault(last, value)
+            self._nested = nested
+        return self._nested
+
+
+if __name__ == '__main__':
+    """
+        DEMO Here
+        有设备时使用真实 getprop 输出，否则生成 1200 行模拟数据
+    """
+    import time
+
+    def legacy_parse(text: str) -> dict:
+        prop_d = {}
+        for _ in text.split('\n'):
+            _ = _.replace('\r', '')
+            if not _ or _[0] != '[' or _[-1] != ']':
+                continue
+            try:
+                k, v = _.split(': ')
+            except Exception:
+                continue
+            cmd = "prop_d"
+            for __ in k[1:-1].split('.'):
+                cmd += f".setdefault('{__}', {{}})"
+            cmd = cmd[:-3] + "'" + v[1:-1] + "')"
+            try:
+                exec(cmd)
+            except:
+                pass
+        return prop_d
+
+    dumps = {}
+    try:
+        from adbutils import adb
+        for _dev in adb.device_list():
+            dumps[_dev.serial] = _dev.shell('getprop', timeout=3)
+    except Exception:
+        ...
+
+    if not dumps:
+        dumps['synthetic'] = '\n'.join(
+            f"[{'ro' if i % 3 else 'persist'}.vendor.module{i // 20}.key_{i}]: [value_{i}]" for i in range(1200)
+        ) + '\n[ro.build.version.sdk]: [34]\n[ro.build.version.release]: [14]\n'
+
+    for name, text in dumps.items():
+        n = 50
+
+        t = time.perf_counter()
+        for _ in range(n):
+            legacy_parse(text)
+        t_legacy = (time.perf_counter() - t) / n * 1000
+
+        t = time.perf_counter()
+        for _ in range(n):
+            ps = PropStore.parse(text)
+        t_parse = (time.perf_counter() - t) / n * 1000
+
+        t = time.perf_counter()
+        for _ in range(n):
+            PropStore.parse(text).prefix('ro.build.')
+        t_prefix = (time.perf_counter() - t) / n * 1000 - t_parse
+
+        print(
+            f"{name}: {text.count(chr(10))} lines | exec {t_legacy:.2f} ms | parse {t_parse:.3f} ms "
+            f"| first prefix {t_prefix:.3f} ms | sdk={ps.get_int('ro.build.version.sdk')}"
+        )
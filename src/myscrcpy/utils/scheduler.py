@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+    Scheduler
+    ~~~~~~~~~~~~~~~~~~
+    Deadline 调度器
+    定时任务按 deadline 存于最小堆，由独立线程执行，临近 deadline 时自旋以提高精度
+
+    Log:
+        2026-10-19 3.3.0 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '3.3.0'
+
+__all__ = [
+    'Timer', 'DeadlineScheduler'
+]
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, List, Tuple
+
+from loguru import logger
+
+
+class Timer:
+    """
+        定时任务句柄
+    """
+
+    __slots__ = ('deadline_ns', 'callback', 'interval_ns', 'cancelled')
+
+    def __init__(self, deadline_ns: int, callback: Callable[[], None], interval_ns: int = 0):
+        self.deadline_ns = deadline_ns
+        self.callback = callback
+        self.interval_ns = interval_ns
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    @property
+    def is_active(self) -> bool:
+        return not self.cancelled
+
+
+class DeadlineScheduler:
+    """
+        Deadline 调度器
+
+        ds = DeadlineScheduler().start()
+        timer = ds.call_later(0.04, release)
+        timer.cancel()
+    """
+
+    # 提前唤醒后自旋等待，补偿 sleep / wait 精度
+    SPIN_NS = 1_000_000
+
+    def __init__(self, name: str = 'deadline_scheduler'):
+        self.name = name
+
+        self._heap: List[Tuple[int, int, Timer]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+
+        self.is_running = False
+        self.fired_n = 0
+        self.max_late_ns = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def call_at(self, deadline_ns: int, callback: Callable[[], None], interval_ns: int = 0) -> Timer:
+        """
+            于 perf_counter_ns 时刻执行
+        :param deadline_ns:
+        :param callback:
+        :param interval_ns: > 0 时按该间隔重复
+        :return:
+        """
+        timer = Timer(deadline_ns, callback, interval_ns)
+        with self._cond:
+            heapq.heappush(self._heap, (deadline_ns, next(self._seq), timer))
+            # 新任务早于当前等待目标时唤醒
+            if self._heap[0][2] is timer:
+                self._cond.notify()
+        return timer
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> Timer:
+        """
+            延迟执行
+        :param delay: 秒
+        :param callback:
+        :return:
+        """
+        return self.call_at(time.perf_counter_ns() + int(delay * 1e9), callback)
+
+    def call_every(self, interval: float, callback: Callable[[], None], delay: float | None = None) -> Timer:
+        """
+            按固定间隔重复执行，以 deadline 累加避免漂移
+        :param interval: 秒
+        :param callback:
+        :param delay: 首次延迟，默认为 interval
+        :return:
+        """
+        interval_ns = int(interval * 1e9)
+        if interval_ns <= 0:
+            raise ValueError('Interval must be > 0')
+        delay_ns = interval_ns if delay is None else int(delay * 1e9)
+        return self.call_at(time.perf_counter_ns() + delay_ns, callback, interval_ns)
+
+    def _next(self) -> Timer | None:
+        """
+            等待至最早 deadline 并取出
+        :return:
+        """
+        with self._cond:
+            while self.is_running:
+                while self._heap and self._heap[0][2].cancelled:
+                    heapq.heappop(self._heap)
+
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+
+                remaining = self._heap[0][0] - time.perf_counter_ns()
+                if remaining > self.SPIN_NS:
+                    self._cond.wait((remaining - self.SPIN_NS) / 1e9)
+                    continue
+
+                return heapq.heappop(self._heap)[2]
+        return None
+
+    def _thread_run(self):
+        while self.is_running:
+            timer = self._next()
+            if timer is None:
+                break
+
+            while time.perf_counter_ns() < timer.deadline_ns:
+                ...
+
+            if timer.cancelled:
+                continue
+
+            self.max_late_ns = max(self.max_late_ns, time.perf_counter_ns() - timer.deadline_ns)
+            self.fired_n += 1
+
+            try:
+                timer.callback()
+            except Exception as e:
+                logger.error(f"{self.name} Callback Error => {e}")
+
+            if timer.interval_ns and not timer.cancelled:
+                deadline_ns = timer.deadline_ns + timer.interval_ns
+                now = time.perf_counter_ns()
+                if deadline_ns < now:
+                    # 落后时重新对齐
+                    deadline_ns = now + timer.interval_ns
+                timer.deadline_ns = deadline_ns
+                with self._cond:
+                    heapq.heappush(self._heap, (deadline_ns, next(self._seq), timer))
+
+        logger.info(f"{self.name} Stopped.")
+
+    def start(self) -> 'DeadlineScheduler':
+        if not self.is_running:
+            self.is_running = True
+            threading.Thread(target=self._thread_run, daemon=True, name=self.name).start()
+        return self
+
+    def stop(self):
+        with self._cond:
+            self.is_running = False
+            self._heap.clear()
+            self._cond.notify()
+
+
+if __name__ == '__main__':
+    """
+        DEMO Here
+        40ms 重复定时误差，对比 60fps 帧循环轮询
+    """
+    n = 100
+    interval = 0.04
+
+    ds = DeadlineScheduler().start()
+    stamps = []
+    done = threading.Event()
+
+    def _tick():
+        stamps.append(time.perf_counter())
+        if len(stamps) >= n:
+            done.set()
+
+    timer = ds.call_every(interval, _tick)
+    done.wait()
+    timer.cancel()
+    ds.stop()
+
+    errors = [abs(b - a - interval) * 1000 for a, b in zip(stamps, stamps[1:])]
+    print(f"scheduler: mean {sum(errors) / len(errors):.3f} ms | max {max(errors):.3f} ms")
+
+    # 帧循环轮询: 仅在每帧检查是否超时
+    frame = 1 / 60
+    stamps = []
+    last = time.perf_counter()
+    while len(stamps) < n:
+        time.sleep(frame)
+        now = time.perf_counter()
+        if now - last >= interval:
+            stamps.append(now)
+            last = now
+
+    errors = [abs(b - a - interval) * 1000 for a, b in zip(stamps, stamps[1:])]
+    print(f"60fps poll: mean {sum(errors) / len(errors):.3f} ms | max {max(errors):.3f} ms")